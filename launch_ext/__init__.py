@@ -4,14 +4,18 @@ from . import actions
 from . import conditions
 from . import substitutions
 from . import entrypoints
+from . import event_handlers
+from . import events
 from . import discovery
+from . import process
 
 __all__ = [
     "actions",
     # 'descriptions',
-    # 'event_handlers',
-    # 'events',
+    "event_handlers",
+    "events",
     "conditions",
     "substitutions",
     "entrypoints" "discovery",
+    "process",
 ]
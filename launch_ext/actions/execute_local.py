@@ -15,20 +15,25 @@
 """Module for the ExecuteLocalExt action."""
 
 import asyncio
-import io
+import contextlib
 import logging
 import os
 import platform
 import signal
+import subprocess
+import time
 import traceback
 from typing import Any  # noqa: F401
 from typing import Callable
 from typing import cast
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Text
-from typing import Tuple  # noqa: F401
+from typing import Tuple
+from typing import Type
 from typing import Union
 
 import launch.logging
@@ -37,18 +42,14 @@ from osrf_pycommon.process_utils import async_execute_process  # type: ignore
 from osrf_pycommon.process_utils import AsyncSubprocessProtocol
 
 from launch.actions.emit_event import EmitEvent
-from launch.actions.opaque_function import OpaqueFunction
-from launch.actions.timer_action import TimerAction
 
 from launch.action import Action
 from launch.conditions import evaluate_condition_expression
 from launch.descriptions import Executable
 from launch.event import Event
-from launch.event_handler import EventHandler
 from launch.event_handlers import OnProcessExit
 from launch.event_handlers import OnProcessIO
 from launch.event_handlers import OnProcessStart
-from launch.event_handlers import OnShutdown
 from launch.events import matches_action
 from launch.events import Shutdown
 
@@ -61,19 +62,81 @@ from launch.events.process import ProcessStdout
 from launch.events.process import ShutdownProcess
 from launch.events.process import SignalProcess
 from launch.launch_context import LaunchContext
-from launch.launch_description import LaunchDescription
 from launch.launch_description_entity import LaunchDescriptionEntity
 from launch.some_entities_type import SomeEntitiesType
 from launch.some_substitutions_type import SomeSubstitutionsType
 from launch.substitution import Substitution  # noqa: F401
 from launch.substitutions import LaunchConfiguration
-from launch.substitutions import PythonExpression
-from launch.utilities import is_a_subclass
 from launch.utilities import normalize_to_list_of_substitutions
 from launch.utilities import perform_substitutions
 from launch.utilities.type_utils import normalize_typed_substitution
 from launch.utilities.type_utils import perform_typed_substitution
 
+from ..event_handlers import ProcessEventDispatcher
+from ..events import ProcessCrashLoop
+from ..events import ProcessReady
+from ..events import ProcessResourceSample
+from ..process import CgroupError
+from ..process import CgroupLeaf
+from ..process import Deadline
+from ..process import JsonLinesWriter
+from ..process import LineAssembler
+from ..process import LogFileRotator
+from ..process import MemoryOutputCache
+from ..process import MmapOutputCache
+from ..process import OutputBackpressure
+from ..process import OutputCache
+from ..process import OutputCoalescer
+from ..process import OutputSheddingFilter
+from ..process import OutputProbe
+from ..process import ReadinessProbe
+from ..process import ResourceSample
+from ..process import ResourceSampler
+from ..process import RespawnPolicy
+from ..process import RingOutputCache
+from ..process import ShutdownScheduler
+from ..process import SpawnScheduler
+from ..process import SpawnSlot
+from ..process import StandbyGate
+from ..process import StartupReport
+from ..process import StartupTimeline
+from ..process import StdinWriter
+from ..process import affinity_setter
+from ..process import check_compression
+from ..process import check_resource_sampling
+from ..process import check_scheduling
+from ..process import compile_output_format
+from ..process import get_rlimit
+from ..process import nice_setter
+from ..process import parse_cpu_affinity
+from ..process import parse_cpu_quota
+from ..process import parse_io_weight
+from ..process import parse_nice
+from ..process import parse_rlimit
+from ..process import parse_sched_policy
+from ..process import parse_size
+from ..process import rlimit_setter
+from ..process import scheduler_setter
+from ..process import wait_for_any_exit
+from ..process.inode_tracker import get_inodes
+from ..process.inode_tracker import get_pids_with_inodes  # noqa: F401
+from ..process.inode_tracker import InodeHolderTracker
+from ..process.stdin_writer import StdinSource
+
+# gate, transport and protocol of a process spawned in advance for respawning
+_StandbyProcess = Tuple[StandbyGate, asyncio.SubprocessTransport, AsyncSubprocessProtocol]
+
+# seconds between scans for the processes holding the stdout/stderr pipes of a process
+# which exited, in case they close them without exiting
+_INODE_RESCAN_PERIOD = 1.0
+# controller needed for each argument of CgroupLeaf.set_limits()
+_CGROUP_CONTROLLERS = {"cpu_max": "cpu", "memory_max": "memory", "io_weight": "io"}
+
+
+def _publish_startup_report(report: StartupReport) -> None:
+    launch.logging.get_logger("launch_ext.startup_report").info(report.render())
+    report.write(os.path.join(launch.logging.launch_config.log_dir, "startup_report.json"))
+
 
 # we have to include the ProcessIO and ProcessExited events here
 # because they hardcore the type of action
@@ -197,43 +260,6 @@ class OnProcessExit(OnActionEventBase):
         )
 
 
-from typing import Set
-
-from pathlib import Path
-import psutil
-
-
-def get_inodes(pid: int) -> Set[int]:
-    fds_to_check = [0, 1, 2]
-    inodes = set()
-
-    for fd in fds_to_check:
-        try:
-            fdinfo = Path(f"/proc/{pid}/fdinfo/{fd}").read_text().strip().split("\n")
-            fdinfo = [s.split(":\t") for s in fdinfo]
-            fdinfo = {s[0]: int(s[1]) for s in fdinfo}
-
-            inodes.add(fdinfo["ino"])
-        except FileNotFoundError as e:
-            continue
-        except PermissionError as e:
-            continue
-        except IndexError as e:
-            continue
-
-    return inodes
-
-
-def get_pids_with_inodes(inodes: Set[int]) -> Set[int]:
-    pids = set()
-
-    for pid in psutil.pids():
-        if inodes & get_inodes(pid):
-            pids.add(pid)
-
-    return pids
-
-
 class ExecuteLocalExt(Action):
     """Action that begins executing a process on the local system and sets up event handlers."""
 
@@ -248,6 +274,20 @@ class ExecuteLocalExt(Action):
         output: SomeSubstitutionsType = "log",
         output_format: str = "[{this.process_description.final_name}] {line}",
         cached_output: bool = False,
+        cached_output_max_bytes: Optional[int] = None,
+        cached_output_max_lines: Optional[int] = None,
+        cached_output_to_file: bool = False,
+        output_coalesce_window: Optional[float] = None,
+        output_coalesce_max_bytes: int = 65536,
+        output_high_water: Optional[int] = None,
+        output_low_water: Optional[int] = None,
+        output_overflow: str = "block",
+        screen_max_lines_per_second: Optional[float] = None,
+        output_to_file: bool = False,
+        output_file_max_bytes: Optional[int] = None,
+        output_file_backups: int = 5,
+        output_file_compression: Optional[str] = "gzip",
+        output_jsonl: bool = False,
         log_cmd: bool = False,
         on_exit: Optional[
             Union[
@@ -258,7 +298,30 @@ class ExecuteLocalExt(Action):
         respawn: Union[bool, SomeSubstitutionsType] = False,
         respawn_delay: Optional[float] = None,
         respawn_max_retries: int = -1,
+        respawn_backoff_multiplier: float = 1.0,
+        respawn_max_delay: Optional[float] = None,
+        respawn_jitter: float = 0.0,
+        respawn_reset_after: Optional[float] = None,
+        respawn_crash_loop_count: Optional[int] = None,
+        respawn_crash_loop_window: float = 60.0,
+        respawn_mode: str = "restart",
+        standby_gate: str = "exec",
         wait_on_child_processes: bool = False,
+        use_cgroup: bool = False,
+        resource_sample_interval: Optional[float] = None,
+        cpu_quota: Optional[SomeSubstitutionsType] = None,
+        memory_max: Optional[SomeSubstitutionsType] = None,
+        io_weight: Optional[SomeSubstitutionsType] = None,
+        rlimits: Optional[Dict[Text, SomeSubstitutionsType]] = None,
+        cpu_affinity: Optional[Union[Iterable[int], SomeSubstitutionsType]] = None,
+        nice: Optional[SomeSubstitutionsType] = None,
+        sched_policy: Optional[SomeSubstitutionsType] = None,
+        sched_priority: Optional[SomeSubstitutionsType] = None,
+        readiness_probe: Optional[ReadinessProbe] = None,
+        readiness_timeout: Optional[float] = None,
+        stdin_file: Optional[SomeSubstitutionsType] = None,
+        spawn_priority: int = 0,
+        starting_timeout: Optional[float] = None,
         **kwargs,
     ) -> None:
         """
@@ -313,12 +376,12 @@ class ExecuteLocalExt(Action):
         :param: shell if True, a shell is used to execute the cmd
         :param: sigterm_timeout time until shutdown should escalate to SIGTERM,
             as a string or a list of strings and Substitutions to be resolved
-            at runtime, defaults to the LaunchConfiguration called
-            'sigterm_timeout'
+            when the action is executed, defaults to the LaunchConfiguration
+            called 'sigterm_timeout'
         :param: sigkill_timeout time until escalating to SIGKILL after SIGTERM,
             as a string or a list of strings and Substitutions to be resolved
-            at runtime, defaults to the LaunchConfiguration called
-            'sigkill_timeout'
+            when the action is executed, defaults to the LaunchConfiguration
+            called 'sigkill_timeout'
         :param: emulate_tty emulate a tty (terminal), defaults to False, but can
             be overridden with the LaunchConfiguration called 'emulate_tty',
             the value of which is evaluated as true or false according to
@@ -334,17 +397,136 @@ class ExecuteLocalExt(Action):
         :param: output_format for logging each output line, supporting `str.format()`
             substitutions with the following keys in scope: `line` to reference the raw
             output line and `this` to reference this action instance.
+            Fields referencing `this` are resolved once, when the process is started.
         :param: log_cmd if True, prints the final cmd before executing the
             process, which is useful for debugging when substitutions are
             involved.
         :param: cached_output if `True`, both stdout and stderr will be cached.
             Use get_stdout() and get_stderr() to read the buffered output.
+        :param: cached_output_max_bytes if set, only the most recent output up to this
+            many bytes per stream is cached, in a ring buffer.
+        :param: cached_output_max_lines if set, only the most recent lines up to this
+            many lines per stream are cached, in a ring buffer.
+        :param: cached_output_to_file if `True`, the cached output is appended to a
+            file per stream in the launch log directory and read back through `mmap`,
+            instead of being held in memory. See `cached_stdout` and `cached_stderr`.
+        :param: output_coalesce_window if set, reads from the process pipes are merged
+            into a single ProcessIO event per stream for up to this many seconds,
+            reducing the load on the launch event queue for chatty processes.
+            See `output_coalescing_stats`.
+        :param: output_coalesce_max_bytes emit the merged output as soon as this many
+            bytes are pending, regardless of `output_coalesce_window`.
+        :param: output_high_water if set, once this many bytes of output were read from
+            the process but not logged yet, e.g. because the screen can't keep up,
+            `output_overflow` applies until it goes back down to `output_low_water`.
+        :param: output_low_water defaults to half of `output_high_water`.
+        :param: output_overflow 'block' to stop reading the pipes of the process, so that
+            it blocks on its writes instead of launch buffering its output, or 'drop' to
+            drop the output, logging how much was dropped. See
+            `output_backpressure_stats`. With 'block', the exit of the process is only
+            handled once the output left in its pipes was read.
+        :param: screen_max_lines_per_second if set, at most this many stdout lines per
+            second are printed on the screen, and a summary of how many lines were
+            dropped is printed instead of the others. Stderr, the log files and the
+            other outputs still get all the lines, so slow terminal rendering does not
+            hold up the launch loop. See `screen_dropped_lines`.
+        :param: output_to_file if `True`, the stdout and stderr of the process are
+            attached directly to `<name>.stdout.log` and `<name>.stderr.log` in the launch
+            log directory, bypassing the launch event system, so `output` and
+            `output_format` do not apply and no ProcessIO events are emitted.
+        :param: output_file_max_bytes if set with `output_to_file`, the log files are
+            rotated in a background thread once they grow past this size.
+        :param: output_file_backups number of rotated segments to keep per log file.
+        :param: output_file_compression compression of the rotated segments, either
+            'gzip', 'zstd' (requires the `zstandard` module) or None.
+        :param: output_jsonl if `True`, each output line is written as a JSON object to
+            `process_output.jsonl` in the launch log directory, shared by all processes,
+            instead of being logged according to `output` and `output_format`.
+            Objects have the keys `name`, `pid`, `stream`, `monotonic`, `time` and `line`,
+            the times being those at which the line was read from the process.
         :param: on_exit list of actions to execute upon process exit.
         :param: respawn if 'True', relaunch the process that abnormally died.
             Either a boolean or a Substitution to be resolved at runtime. Defaults to 'False'.
         :param: respawn_delay a delay time to relaunch the died process if respawn is 'True'.
         :param: respawn_max_retries number of times to respawn the process if respawn is 'True'.
                 A negative value will respawn an infinite number of times (default behavior).
+        :param: respawn_backoff_multiplier factor applied to the respawn delay after each
+            respawn, starting from `respawn_delay`. Defaults to 1, i.e. a fixed delay.
+        :param: respawn_max_delay upper bound of the respawn delay, in seconds.
+        :param: respawn_jitter randomizes each respawn delay by up to this fraction of
+            it either way, e.g. 0.1 for +/-10%.
+        :param: respawn_reset_after once the process ran for this many seconds, the
+            respawn delay and the retries counted against `respawn_max_retries` reset.
+        :param: respawn_crash_loop_count if the process exits this many times within
+            `respawn_crash_loop_window` seconds, it is not respawned anymore and a
+            `launch_ext.events.ProcessCrashLoop` event is emitted.
+        :param: respawn_crash_loop_window length of the crash loop window, in seconds.
+        :param: respawn_mode 'restart' to start a new process once the previous one
+            exited, or 'standby' to keep a replacement process spawned in advance,
+            held back by a gate, and release it instead.
+        :param: standby_gate how the standby process is held back, 'exec' blocks it
+            right before executing the command, 'cooperative' executes the command
+            with the read end of a pipe in the `LAUNCH_EXT_STANDBY_FD` environment
+            variable, the process initializes, then waits to read a byte from it.
+            It should exit when it reads end of file instead.
+        :param: wait_on_child_processes if `True`, the process is only considered exited
+            once its child processes sharing its stdin/stdout/stderr have exited too.
+            With `use_cgroup`, all its descendants are waited for instead.
+        :param: use_cgroup if `True`, the process is started in its own cgroup v2 leaf,
+            under the cgroup given by the `LAUNCH_EXT_CGROUP_ROOT` environment variable
+            (e.g. a delegated subtree or user slice) or else the cgroup of launch.
+            Its descendants are tracked through the cgroup, and SIGKILL is sent to the
+            whole cgroup on shutdown.
+        :param: resource_sample_interval if set, the CPU, memory and IO usage of the
+            process and its descendants is sampled from /proc every this many seconds,
+            emitted as `launch_ext.events.ProcessResourceSample` events and appended to
+            `process_metrics.csv` in the launch log directory.
+        :param: cpu_quota the number of CPUs worth of time the process and its
+            descendants may use, e.g. '0.5', enforced through the cgroup `cpu.max`.
+        :param: memory_max the memory the process and its descendants may use, in
+            bytes or with a K, M, G or T suffix, e.g. '512M', enforced through the
+            cgroup `memory.max`.
+        :param: io_weight the IO weight of the process and its descendants relative
+            to their siblings, from 1 to 10000 (default 100), set as the cgroup
+            `io.weight`.
+            `cpu_quota`, `memory_max` and `io_weight` imply `use_cgroup`, and need
+            `LAUNCH_EXT_CGROUP_ROOT` to be a delegated cgroup with those controllers,
+            which does not hold processes itself.
+        :param: rlimits resource limits set before the process executes, by name of
+            the `resource.RLIMIT_*` constant, e.g. `{'nofile': '4096', 'core':
+            'unlimited'}`. A value sets both the soft and hard limits unless given as
+            'soft:hard'.
+        :param: cpu_affinity the CPUs the process may run on, as a list of integers or
+            in the format of `taskset -c`, e.g. '0-3,6'.
+        :param: nice the nice level of the process, from -20 to 19. Lowering it needs
+            CAP_SYS_NICE or a high enough RLIMIT_NICE.
+        :param: sched_policy the scheduling policy of the process, one of 'other',
+            'batch', 'idle', 'fifo' or 'rr'. Defaults to 'fifo' if only
+            `sched_priority` is given.
+        :param: sched_priority the real-time priority of the process, from 1 to 99.
+            The real-time policies need CAP_SYS_NICE or a high enough RLIMIT_RTPRIO.
+            These settings are applied in the child before it executes the command,
+            and a warning is logged for each of them that did not apply.
+        :param: readiness_probe tells when the process is ready, e.g.
+            `launch_ext.process.OutputProbe(r'listening on')`, `SocketProbe('localhost:8080')`,
+            `FileProbe('/tmp/ready')` or `CoroutineProbe(check)`. Once it succeeds, a
+            `launch_ext.events.ProcessReady` event is emitted, see
+            `launch_ext.event_handlers.OnProcessReady`. Each respawned process is probed
+            again.
+        :param: readiness_timeout if the process is not ready after this many seconds, a
+            warning is logged and it is not probed anymore.
+        :param: stdin_file the path of a file streamed to the stdin of each new process,
+            e.g. recorded data for a replay tool. Stdin is closed at the end of the file.
+            Data can also be written with `ProcessStdin` events, `write_stdin()` and
+            `stream_stdin()`; it is written as fast as the process reads it, and data
+            not written yet when the process exits is dropped.
+        :param: spawn_priority when the `max_starting_processes` launch configuration
+            bounds how many processes are starting at the same time, processes with a
+            higher priority are spawned first. A process has started once it is ready
+            if it has a `readiness_probe`, or else once it writes its first output.
+        :param: starting_timeout the time after which a process counts as started for
+            `max_starting_processes` anyway, defaults to the `starting_timeout` launch
+            configuration, or 10 seconds.
         """
         super().__init__(**kwargs)
         self.__process_description = process_description
@@ -363,27 +545,153 @@ class ExecuteLocalExt(Action):
         else:
             self.__output = tmp_output
         self.__output_format = output_format
+        self.__render_line = lambda line: output_format.format(line=line, this=self)
+        if output_to_file and cached_output:
+            raise ValueError("output_to_file can't be combined with cached_output")
+        self.__output_to_file = output_to_file
+        self.__output_file_paths = None  # type: Optional[Tuple[Text, Text]]
+        self.__log_file_rotator = None  # type: Optional[LogFileRotator]
+        if output_file_max_bytes is not None and not output_to_file:
+            raise ValueError("output_file_max_bytes requires output_to_file")
+        self.__output_file_max_bytes = output_file_max_bytes
+        self.__output_file_backups = output_file_backups
+        if output_file_max_bytes is not None:
+            # rather than failing in the rotation thread, once the log file was copied
+            check_compression(output_file_compression)
+        self.__output_file_compression = output_file_compression
+        self.__output_jsonl = output_jsonl
+        self.__jsonl_writer = None  # type: Optional[JsonLinesWriter]
+        if output_high_water is not None and output_to_file:
+            raise ValueError("output_high_water can't be combined with output_to_file")
+        self.__output_backpressure = None  # type: Optional[OutputBackpressure]
+        if output_high_water is not None:
+            self.__output_backpressure = OutputBackpressure(
+                output_high_water,
+                output_low_water,
+                policy=output_overflow,
+                on_resume=self.__on_output_resumed,
+            )
+        self.__reported_dropped_bytes = 0
+        if screen_max_lines_per_second is not None and screen_max_lines_per_second <= 0:
+            raise ValueError("screen_max_lines_per_second must be positive")
+        self.__screen_max_lines_per_second = screen_max_lines_per_second
+        self.__screen_shedding = None  # type: Optional[OutputSheddingFilter]
+        self.__screen_dropped_lines = 0
 
         self.__log_cmd = log_cmd
         self.__cached_output = cached_output
         self.__on_exit = on_exit
         self.__respawn = normalize_typed_substitution(respawn, bool)
-        self.__respawn_delay = respawn_delay
+        if respawn_mode not in ("restart", "standby"):
+            raise ValueError(
+                f"unsupported respawn_mode '{respawn_mode}', expected 'restart' or 'standby'"
+            )
+        if standby_gate not in StandbyGate.MODES:
+            raise ValueError(
+                f"unsupported standby_gate '{standby_gate}', expected one of {StandbyGate.MODES}"
+            )
+        self.__respawn_mode = respawn_mode
+        self.__standby_gate = standby_gate
+        self.__standby = None  # type: Optional[_StandbyProcess]
+        self.__standby_task = None  # type: Optional[asyncio.Task]
 
         self.__wait_for_child_pids = wait_on_child_processes
+        self.__use_cgroup = use_cgroup
+        self.__cgroup = None  # type: Optional[CgroupLeaf]
+        if resource_sample_interval is not None:
+            check_resource_sampling()
+        self.__resource_sample_interval = resource_sample_interval
+        self.__startup_timeline = None  # type: Optional[StartupTimeline]
+        self.__startup_report = None  # type: Optional[StartupReport]
+        if isinstance(readiness_probe, OutputProbe) and output_to_file:
+            raise ValueError("an OutputProbe can't be used with output_to_file")
+        self.__readiness_probe = readiness_probe
+        self.__readiness_timeout = readiness_timeout
+        self.__stdin_file = (
+            normalize_to_list_of_substitutions(stdin_file) if stdin_file is not None else None
+        )
+        self.__stdin_file_path = None  # type: Optional[Text]
+        self.__spawn_priority = spawn_priority
+        self.__starting_timeout = starting_timeout
+        self.__spawn_slot = None  # type: Optional[SpawnSlot]
+        self.__waiting_for_spawn_slot = False
+        self.__spawn_scheduled = False
+        self.__cgroup_limit_substitutions = {
+            key: normalize_to_list_of_substitutions(value)
+            for key, value in (
+                ("cpu_quota", cpu_quota),
+                ("memory_max", memory_max),
+                ("io_weight", io_weight),
+            )
+            if value is not None
+        }
+        if self.__cgroup_limit_substitutions:
+            self.__use_cgroup = True
+        self.__cgroup_limits = {}  # type: Dict[Text, Any]
+        self.__rlimit_substitutions = {
+            name: normalize_to_list_of_substitutions(value)
+            for name, value in (rlimits or {}).items()
+        }
+        self.__rlimits = []  # type: List[Tuple[int, Tuple[int, int]]]
+        if cpu_affinity is not None and not isinstance(cpu_affinity, (str, Substitution)):
+            cpu_affinity = ",".join(str(cpu) for cpu in cast(Iterable[int], cpu_affinity))
+        self.__scheduling_substitutions = {
+            key: normalize_to_list_of_substitutions(cast(SomeSubstitutionsType, value))
+            for key, value in (
+                ("cpu_affinity", cpu_affinity),
+                ("nice", nice),
+                ("sched_policy", sched_policy),
+                ("sched_priority", sched_priority),
+            )
+            if value is not None
+        }
+        self.__cpu_affinity = None  # type: Optional[Set[int]]
+        self.__nice = None  # type: Optional[int]
+        self.__sched_policy = None  # type: Optional[Tuple[int, int]]
 
         self.__respawn_max_retries = respawn_max_retries
         self.__respawn_retries = 0
+        self.__respawn_crash_loop_window = respawn_crash_loop_window
+        self.__respawn_policy = RespawnPolicy(
+            initial_delay=max(respawn_delay or 0.0, 0.0),
+            multiplier=respawn_backoff_multiplier,
+            max_delay=respawn_max_delay,
+            jitter=respawn_jitter,
+            reset_after=respawn_reset_after,
+            crash_loop_count=respawn_crash_loop_count,
+            crash_loop_window=respawn_crash_loop_window,
+        )
 
         self.__process_event_args = None  # type: Optional[Dict[Text, Any]]
         self._subprocess_protocol = None  # type: Optional[Any]
         self._subprocess_transport = None
         self.__completed_future = None  # type: Optional[asyncio.Future]
         self.__shutdown_future = None  # type: Optional[asyncio.Future]
-        self.__sigterm_timer = None  # type: Optional[TimerAction]
-        self.__sigkill_timer = None  # type: Optional[TimerAction]
-        self.__stdout_buffer = io.StringIO()
-        self.__stderr_buffer = io.StringIO()
+        self.__dispatcher = None  # type: Optional[ProcessEventDispatcher]
+        self.__exit_events_pending = 0
+        self.__sigterm_timeout_value = 5.0
+        self.__sigkill_timeout_value = 5.0
+        self.__sigterm_deadline = None  # type: Optional[Deadline]
+        self.__sigkill_deadline = None  # type: Optional[Deadline]
+        if cached_output_to_file and (
+            cached_output_max_bytes is not None or cached_output_max_lines is not None
+        ):
+            raise ValueError(
+                "cached_output_to_file can't be combined with cached_output_max_bytes"
+                " or cached_output_max_lines"
+            )
+        self.__cached_output_max_bytes = cached_output_max_bytes
+        self.__cached_output_max_lines = cached_output_max_lines
+        self.__cached_output_to_file = cached_output_to_file
+        self.__stdout_cache = None  # type: Optional[OutputCache]
+        self.__stderr_cache = None  # type: Optional[OutputCache]
+        self.__output_coalesce_window = output_coalesce_window
+        self.__output_coalesce_max_bytes = output_coalesce_max_bytes
+        self.__stdout_coalescer = None  # type: Optional[OutputCoalescer]
+        self.__stderr_coalescer = None  # type: Optional[OutputCoalescer]
+        self.__stdout_assembler = LineAssembler()
+        self.__stderr_assembler = LineAssembler()
+        self.__output_closed = False
 
         self.__executed = False
 
@@ -417,6 +725,55 @@ class ExecuteLocalExt(Action):
         """Getter for output."""
         return self.__output
 
+    @property
+    def cached_stdout(self) -> Optional[OutputCache]:
+        """Getter for the cache of stdout, or None if output is not cached or not started."""
+        return self.__stdout_cache
+
+    @property
+    def cached_stderr(self) -> Optional[OutputCache]:
+        """Getter for the cache of stderr, or None if output is not cached or not started."""
+        return self.__stderr_cache
+
+    @property
+    def output_coalescing_stats(self) -> Optional[Dict[Text, Dict[Text, int]]]:
+        """Getter for the pipe read and event counters per stream, or None if not coalescing."""
+        if self.__stdout_coalescer is None or self.__stderr_coalescer is None:
+            return None
+        return {
+            stream: {
+                "reads_received": coalescer.reads_received,
+                "events_emitted": coalescer.chunks_emitted,
+                "reads_merged": coalescer.reads_merged,
+            }
+            for stream, coalescer in (
+                ("stdout", self.__stdout_coalescer),
+                ("stderr", self.__stderr_coalescer),
+            )
+        }
+
+    @property
+    def output_backpressure_stats(self) -> Optional[Dict[Text, int]]:
+        """Getter for the output backpressure counters, or None if not enabled."""
+        backpressure = self.__output_backpressure
+        if backpressure is None:
+            return None
+        return {
+            "pending_bytes": backpressure.pending_bytes,
+            "pause_count": backpressure.pause_count,
+            "dropped_bytes": backpressure.dropped_bytes,
+            "dropped_reads": backpressure.dropped_reads,
+        }
+
+    @property
+    def screen_dropped_lines(self) -> int:
+        """Getter for the number of stdout lines not printed on the screen."""
+        if self.__screen_shedding is None:
+            return 0
+        return self.__screen_dropped_lines + self.__screen_shedding.dropped(
+            self.__stdout_logger.name
+        )
+
     @property
     def process_details(self):
         """Getter for the process details, e.g. name, pid, cmd, etc., or None if not started."""
@@ -442,6 +799,11 @@ class ExecuteLocalExt(Action):
             self.__shutdown_future.set_result(None)
             return None
 
+        # Nothing to shut down yet if the process is waiting for its turn to spawn
+        if self.__waiting_for_spawn_slot:
+            self.__shutdown_future.set_result(None)
+            return None
+
         # Defer shut down if the process is scheduled to be started
         if self.process_details is None or self._subprocess_transport is None:
             # Do not set shutdown result, as event is postponed
@@ -457,21 +819,24 @@ class ExecuteLocalExt(Action):
         self.__shutdown_future.set_result(None)
 
         # Otherwise process is still running, start the shutdown procedures.
-        context.extend_locals({"process_name": self.process_details["name"]})
-        actions_to_return = self.__get_shutdown_timer_actions()
+        self.__schedule_shutdown_escalation(context)
         if send_sigint:
-            actions_to_return.append(self.__get_sigint_event())
-        return actions_to_return
+            return [self.__get_sigint_event()]
+        return None
 
-    def __on_shutdown_process_event(self, context: LaunchContext) -> Optional[LaunchDescription]:
-        typed_event = cast(ShutdownProcess, context.locals.event)
+    def __on_shutdown_process_event(
+        self, event: Event, context: LaunchContext
+    ) -> Optional[SomeEntitiesType]:
+        typed_event = cast(ShutdownProcess, event)
         if not typed_event.process_matcher(self):
             # this event whas not intended for this process
             return None
         return self._shutdown_process(context, send_sigint=True)
 
-    def __on_signal_process_event(self, context: LaunchContext) -> Optional[LaunchDescription]:
-        typed_event = cast(SignalProcess, context.locals.event)
+    def __on_signal_process_event(
+        self, event: Event, context: LaunchContext
+    ) -> Optional[SomeEntitiesType]:
+        typed_event = cast(SignalProcess, event)
         if not typed_event.process_matcher(self):
             # this event whas not intended for this process
             return None
@@ -504,6 +869,9 @@ class ExecuteLocalExt(Action):
         )
         try:
             if typed_event.signal_name == "SIGKILL":
+                if self.__cgroup is not None:
+                    # also kills the descendants of the process
+                    self.__cgroup.kill()
                 self._subprocess_transport.kill()  # works on both Windows and POSIX
                 return None
             self._subprocess_transport.send_signal(typed_event.signal)
@@ -516,140 +884,218 @@ class ExecuteLocalExt(Action):
             )
 
     def __on_process_stdin(self, event: ProcessIO) -> Optional[SomeEntitiesType]:
-        self.__logger.warning(
-            f"in ExecuteProcess('{id(self)}').__on_process_stdin_event()",
-        )
-        cast(ProcessStdin, event)
+        try:
+            self.write_stdin(cast(ProcessStdin, event).text)
+        except RuntimeError as e:
+            self.__logger.warning(f"dropping {len(event.text)} bytes of stdin: {e}")
         return None
 
+    def __get_stdin_writer(self) -> StdinWriter:
+        protocol = self._subprocess_protocol
+        if protocol is None or protocol.complete.done():
+            raise RuntimeError("the process is not running")
+        if not protocol.stdin.connected or protocol.stdin.closing:
+            raise RuntimeError("the stdin of the process is closed")
+        return protocol.stdin
+
+    def write_stdin(self, data: Union[bytes, Text]) -> None:
+        """
+        Write `data` to the stdin of the running process.
+
+        The data is queued and written as fast as the process reads it, see
+        `launch_ext.process.StdinWriter`.
+
+        :raises RuntimeError: if the process is not running or its stdin was closed
+        """
+        self.__get_stdin_writer().write(data)
+
+    async def stream_stdin(
+        self, source: StdinSource, *, chunk_size: int = 1 << 16, close: bool = False
+    ) -> int:
+        """
+        Write all the data of `source` to the stdin of the running process.
+
+        Unlike `write_stdin()`, this waits for the process to read the data, so only
+        a bounded amount of `source` is held in memory.
+
+        :param: source the path of a file, or an iterable or async iterable of chunks
+            of bytes or text
+        :param: chunk_size the size of the chunks a file is read in
+        :param: close close stdin once all of `source` was written
+        :return: the amount of data written
+        :raises RuntimeError: if the process is not running, its stdin was closed, or
+            the process exited before all of `source` was written
+        """
+        return await self.__get_stdin_writer().stream(source, chunk_size=chunk_size, close=close)
+
+    def close_stdin(self) -> None:
+        """Close the stdin of the running process once the data written to it is read."""
+        self.__get_stdin_writer().close()
+
+    async def __stream_stdin_file(self, path: Text) -> None:
+        try:
+            count = await self.stream_stdin(path, close=True)
+        except (OSError, RuntimeError) as e:
+            self.__logger.error(f"failed to stream '{path}' to stdin: {e}")
+            return
+        self.__logger.debug(f"streamed {count} bytes of '{path}' to stdin")
+
     def __on_process_output(
-        self, event: ProcessIO, buffer: io.TextIOBase, logger: logging.Logger
+        self,
+        event: ProcessIO,
+        assembler: LineAssembler,
+        cache: Optional[OutputCache],
+        emit_line: Callable[[Text, Optional[Tuple[float, float]]], None],
+        stream: Text,
     ) -> None:
-        to_write = event.text.decode(errors="replace")
-        if buffer.closed:
-            # buffer was probably closed by __flush_buffers on shutdown.  Output without
+        if self.__output_backpressure is not None:
+            self.__output_backpressure.handled(len(event.text))
+        if self.__spawn_slot is not None and self.__readiness_probe is None:
+            # the first output tells that the process is up, in the lack of a better signal
+            self.__release_spawn_slot()
+        if cache is not None:
+            cache.write(event.text)
+        # ProcessIO events emitted by others do not have it
+        received_at = getattr(event, "received_at", None)
+        if self.__output_closed:
+            # output was closed by __flush_buffers on shutdown.  Output without
             # buffering.
-            logger.info(self.__output_format.format(line=to_write, this=self))
-        else:
-            buffer.write(to_write)
-            buffer.seek(0)
-            last_line = None
-            for line in buffer:
-                if line.endswith(os.linesep):
-                    logger.info(
-                        self.__output_format.format(line=line[: -len(os.linesep)], this=self)
-                    )
-                else:
-                    last_line = line
-                    break
-            buffer.seek(0)
-            buffer.truncate(0)
-            if last_line is not None:
-                buffer.write(last_line)
+            to_write = assembler.drain(event.text)
+            if to_write:
+                emit_line(to_write, received_at)
+            return
+        lines = assembler.feed(event.text)
+        for line in lines:
+            emit_line(line, received_at)
+        probe = self.__readiness_probe
+        if probe is not None and probe.watches_output:
+            for line in lines:
+                probe.on_output(event.pid, stream, line)
 
     def __flush_buffers(self, event, context):
-        line = self.__stdout_buffer.getvalue()
-        if line != "":
-            self.__stdout_logger.info(self.__output_format.format(line=line, this=self))
+        line = self.__stdout_assembler.flush()
+        if line is not None:
+            self.__emit_stdout_line(line, None)
 
-        line = self.__stderr_buffer.getvalue()
-        if line != "":
-            self.__stderr_logger.info(self.__output_format.format(line=line, this=self))
+        line = self.__stderr_assembler.flush()
+        if line is not None:
+            self.__emit_stderr_line(line, None)
 
-        # the respawned process needs to reuse these StringIO resources,
-        # close them only after receiving the shutdown
+        if self.__jsonl_writer is not None:
+            self.__jsonl_writer.flush()
+
+        # the respawned process needs to keep buffering its output,
+        # stop buffering only after receiving the shutdown
+        if self.__cached_output:
+            return
         if self.__shutdown_future is None or self.__shutdown_future.done():
-            self.__stdout_buffer.close()
-            self.__stderr_buffer.close()
-        else:
-            self.__stdout_buffer.seek(0)
-            self.__stdout_buffer.truncate(0)
-            self.__stderr_buffer.seek(0)
-            self.__stderr_buffer.truncate(0)
-
-    def __on_process_output_cached(self, event: ProcessIO, buffer, logger) -> None:
-        to_write = event.text.decode(errors="replace")
-        last_cursor = buffer.tell()
-        buffer.seek(0, os.SEEK_END)  # go to end of buffer
-        buffer.write(to_write)
-        buffer.seek(last_cursor)
-        new_cursor = last_cursor
-        for line in buffer:
-            if not line.endswith(os.linesep):
-                break
-            new_cursor = buffer.tell()
-            logger.info(self.__output_format.format(line=line[: -len(os.linesep)], this=self))
-        buffer.seek(new_cursor)
+            self.__output_closed = True
+
+    def __on_output_resumed(self) -> None:
+        backpressure = cast(OutputBackpressure, self.__output_backpressure)
+        if backpressure.policy == "block":
+            self.__logger.debug("output caught up, reading the process pipes again")
+            return
+        dropped = backpressure.dropped_bytes - self.__reported_dropped_bytes
+        self.__reported_dropped_bytes = backpressure.dropped_bytes
+        self.__logger.warning(f"dropped {dropped} bytes of output, the log could not keep up")
+
+    def __limit_screen_output(self, name: Text) -> None:
+        screen_handler = launch.logging.launch_config.get_screen_handler()
+        if screen_handler not in self.__stdout_logger.handlers:
+            # stdout is not printed on the screen, nothing to shed
+            return
+        self.__screen_shedding = OutputSheddingFilter.shared(screen_handler)
+        self.__screen_shedding.limit(
+            self.__stdout_logger.name, cast(float, self.__screen_max_lines_per_second), name
+        )
+
+    def __emit_stdout_line(self, line: Text, received_at: Optional[Tuple[float, float]]) -> None:
+        self.__stdout_logger.info(self.__render_line(line))
+
+    def __emit_stderr_line(self, line: Text, received_at: Optional[Tuple[float, float]]) -> None:
+        self.__stderr_logger.info(self.__render_line(line))
+
+    def __jsonl_emitter(
+        self, stream: Text
+    ) -> Callable[[Text, Optional[Tuple[float, float]]], None]:
+        writer = cast(JsonLinesWriter, self.__jsonl_writer)
+        name = self.__process_description.final_name
+
+        def emit(line: Text, received_at: Optional[Tuple[float, float]]) -> None:
+            writer.write(name, self.__process_event_args.get("pid"), stream, line, received_at)
+
+        return emit
+
+    def __create_output_cache(self, name: str, stream: str) -> OutputCache:
+        if self.__cached_output_to_file:
+            return MmapOutputCache(
+                os.path.join(launch.logging.launch_config.log_dir, f"{name}-{stream}.cache")
+            )
+        if self.__cached_output_max_bytes is None and self.__cached_output_max_lines is None:
+            return MemoryOutputCache()
+        return RingOutputCache(self.__cached_output_max_bytes, self.__cached_output_max_lines)
+
+    def __create_output_coalescers(self, context: LaunchContext) -> None:
+        if self.__output_coalesce_window is None:
+            return
+
+        def emit(event_cls: Type[ProcessIO], data: bytes, coalescer: OutputCoalescer) -> None:
+            event = event_cls(text=data, **self.__process_event_args)
+            event.received_at = coalescer.received_at  # type: ignore
+            context.emit_event_sync(event)
 
-    def __flush_cached_buffers(self, event, context):
-        for line in self.__stdout_buffer:
-            self.__stdout_logger.info(self.__output_format.format(line=line, this=self))
+        stdout = self.__stdout_coalescer = OutputCoalescer(
+            lambda data: emit(ProcessStdout, data, stdout),
+            context.asyncio_loop,
+            max_latency=self.__output_coalesce_window,
+            max_bytes=self.__output_coalesce_max_bytes,
+        )
+        stderr = self.__stderr_coalescer = OutputCoalescer(
+            lambda data: emit(ProcessStderr, data, stderr),
+            context.asyncio_loop,
+            max_latency=self.__output_coalesce_window,
+            max_bytes=self.__output_coalesce_max_bytes,
+        )
 
-        for line in self.__stderr_buffer:
-            self.__stderr_logger.info(self.__output_format.format(line=line, this=self))
+    def __flush_coalescers(self) -> None:
+        if self.__stdout_coalescer is not None:
+            self.__stdout_coalescer.flush()
+        if self.__stderr_coalescer is not None:
+            self.__stderr_coalescer.flush()
 
     def __on_shutdown(self, event: Event, context: LaunchContext) -> Optional[SomeEntitiesType]:
         due_to_sigint = cast(Shutdown, event).due_to_sigint
+        if self.__startup_report is not None:
+            # report the processes which did not start by now as such
+            self.__startup_report.close()
         return self._shutdown_process(
             context,
             send_sigint=not due_to_sigint or context.noninteractive,
         )
 
-    def __get_shutdown_timer_actions(self) -> List[Action]:
+    def __schedule_shutdown_escalation(self, context: LaunchContext) -> None:
         base_msg = (
             "process[{}] failed to terminate '{}' seconds after receiving '{}', escalating to '{}'"
         )
+        name = self.process_details["name"]
 
-        def printer(context, msg, timeout_substitutions):
-            self.__logger.error(
-                msg.format(
-                    context.locals.process_name,
-                    perform_substitutions(context, timeout_substitutions),
-                )
+        def escalate(timeout, sent, signal_number):
+            self.__logger.error(base_msg.format(name, timeout, sent, signal_number))
+            context.emit_event_sync(
+                SignalProcess(signal_number=signal_number, process_matcher=matches_action(self))
             )
 
-        sigterm_timeout = self.__sigterm_timeout
-        sigkill_timeout = [
-            PythonExpression(
-                ("float(", *self.__sigterm_timeout, ") + float(", *self.__sigkill_timeout, ")")
-            )
-        ]
-        # Setup a timer to send us a SIGTERM if we don't shutdown quickly.
-        self.__sigterm_timer = TimerAction(
-            period=sigterm_timeout,
-            actions=[
-                OpaqueFunction(
-                    function=printer,
-                    args=(base_msg.format("{}", "{}", "SIGINT", "SIGTERM"), sigterm_timeout),
-                ),
-                EmitEvent(
-                    event=SignalProcess(
-                        signal_number=signal.SIGTERM, process_matcher=matches_action(self)
-                    )
-                ),
-            ],
-            cancel_on_shutdown=False,
+        sigterm_timeout = self.__sigterm_timeout_value
+        sigkill_timeout = sigterm_timeout + self.__sigkill_timeout_value
+        scheduler = ShutdownScheduler.shared(context, context.asyncio_loop)
+        # send us a SIGTERM if we don't shutdown quickly, then SIGKILL if that did not work
+        self.__sigterm_deadline = scheduler.schedule(
+            sigterm_timeout, lambda: escalate(sigterm_timeout, "SIGINT", "SIGTERM")
         )
-        # Setup a timer to send us a SIGKILL if we don't shutdown after SIGTERM.
-        self.__sigkill_timer = TimerAction(
-            period=sigkill_timeout,
-            actions=[
-                OpaqueFunction(
-                    function=printer,
-                    args=(base_msg.format("{}", "{}", "SIGTERM", "SIGKILL"), sigkill_timeout),
-                ),
-                EmitEvent(
-                    event=SignalProcess(
-                        signal_number="SIGKILL", process_matcher=matches_action(self)
-                    )
-                ),
-            ],
-            cancel_on_shutdown=False,
+        self.__sigkill_deadline = scheduler.schedule(
+            sigkill_timeout, lambda: escalate(sigkill_timeout, "SIGTERM", "SIGKILL")
         )
-        return [
-            cast(Action, self.__sigterm_timer),
-            cast(Action, self.__sigkill_timer),
-        ]
 
     def __get_sigint_event(self):
         return EmitEvent(
@@ -660,16 +1106,58 @@ class ExecuteLocalExt(Action):
         )
 
     def __cleanup(self):
-        # Cancel any pending timers we started.
-        if self.__sigterm_timer is not None:
-            self.__sigterm_timer.cancel()
-        if self.__sigkill_timer is not None:
-            self.__sigkill_timer.cancel()
+        # Cancel any pending deadlines we scheduled.
+        if self.__sigterm_deadline is not None:
+            self.__sigterm_deadline.cancel()
+        if self.__sigkill_deadline is not None:
+            self.__sigkill_deadline.cancel()
+        # Print how many lines were dropped from the screen since the last summary, and
+        # keep the total for `screen_dropped_lines`, the filter forgets about the process.
+        if self.__screen_shedding is not None:
+            self.__screen_dropped_lines += self.__screen_shedding.unlimit(
+                self.__stdout_logger.name
+            )
+        # Stop rotating the log files, nothing writes to them anymore.
+        if self.__output_file_paths is not None and self.__log_file_rotator is not None:
+            for path in self.__output_file_paths:
+                self.__log_file_rotator.remove(path)
+        # Remove the cgroup once nothing is left in it.
+        if self.__cgroup is not None and not self.__cgroup.populated:
+            try:
+                self.__cgroup.remove()
+            except OSError as e:
+                self.__logger.debug(f"failed to remove cgroup '{self.__cgroup.path}': {e}")
+        # Release the files and mappings of the caches, they can still be read.
+        for cache in (self.__stdout_cache, self.__stderr_cache):
+            if cache is not None:
+                cache.close()
+        # Stop the standby process, nothing is respawned anymore.
+        if self.__standby is not None:
+            self.__discard_standby(self.__standby)
+            self.__standby = None
         # Close subprocess transport if any.
         if self._subprocess_transport is not None:
             self._subprocess_transport.close()
         # Signal that we're done to the launch system.
         self.__completed_future.set_result(None)
+        self.__remove_event_routes()
+
+    def __on_exit_event_handled(self, event, context):
+        self.__exit_events_pending -= 1
+        self.__remove_event_routes()
+
+    def __remove_event_routes(self):
+        # only once the callbacks, e.g. `on_exit`, got the last ProcessExited event
+        if (
+            self.__dispatcher is not None
+            and self.__exit_events_pending == 0
+            and self.__completed_future is not None
+            and self.__completed_future.done()
+        ):
+            self.__dispatcher.remove(self)
+            # the output left in the buffers was written on the last ProcessExited event
+            if self.__jsonl_writer is not None:
+                self.__jsonl_writer.remove(self)
 
     class __ProcessProtocol(AsyncSubprocessProtocol):
         def __init__(
@@ -677,30 +1165,145 @@ class ExecuteLocalExt(Action):
             action: "ExecuteLocalExt",
             context: LaunchContext,
             process_event_args: Dict,
+            stdout_coalescer: Optional[OutputCoalescer] = None,
+            stderr_coalescer: Optional[OutputCoalescer] = None,
+            standby: bool = False,
+            startup_timeline: Optional[StartupTimeline] = None,
+            backpressure: Optional[OutputBackpressure] = None,
+            readiness_probe: Optional[ReadinessProbe] = None,
             **kwargs,
         ) -> None:
             super().__init__(**kwargs)
             self.__context = context
             self.__process_event_args = process_event_args
+            self.__stdout_coalescer = stdout_coalescer
+            self.__stderr_coalescer = stderr_coalescer
+            # output of a standby process is held back until it is activated
+            self.__held_output = [] if standby else None  # type: Optional[List[Tuple[Any, ...]]]
+            self.__startup_timeline = startup_timeline
+            self.__readiness_probe = readiness_probe
             self.__logger = launch.logging.get_logger(process_event_args["name"])
+            self.stdin = StdinWriter(context.asyncio_loop)
+            self.__backpressure = backpressure
+            self.__output_pipes = {}  # type: Dict[int, asyncio.ReadTransport]
+            self.__open_output_fds = set()  # type: Set[int]
+            # done once the stdout and stderr pipes are closed, i.e. were read to their end
+            self.output_closed = context.asyncio_loop.create_future()
 
         def connection_made(self, transport):
             self.__logger.info(
-                f"process started with pid [{transport.get_pid()}]",
+                "{} started with pid [{}]".format(
+                    "process" if self.__held_output is None else "standby process",
+                    transport.get_pid(),
+                )
             )
             super().connection_made(transport)
             self.__process_event_args["pid"] = transport.get_pid()
+            # watch for the ready line before any output is received, a standby process
+            # is only watched once it is released
+            if self.__readiness_probe is not None and self.__held_output is None:
+                self.__readiness_probe.expect(transport.get_pid())
+            if self.__startup_timeline is not None:
+                self.__startup_timeline.mark("connection_made")
+            stdin = transport.get_pipe_transport(0)
+            if stdin is not None:
+                self.stdin.connect(stdin)
+            for fd in (1, 2):
+                pipe = transport.get_pipe_transport(fd)
+                if pipe is None:
+                    continue
+                self.__open_output_fds.add(fd)
+                if self.__backpressure is not None:
+                    self.__output_pipes[fd] = pipe
+                    self.__backpressure.attach(pipe)
+            if not self.__open_output_fds:
+                self.output_closed.set_result(None)
+
+        def pause_writing(self) -> None:
+            # the stdin pipe of the process is full
+            self.stdin.pause_writing()
+
+        def resume_writing(self) -> None:
+            self.stdin.resume_writing()
+
+        def process_exited(self) -> None:
+            self.stdin.disconnect()
+            # the output pipes stay attached until they are closed, the output still in
+            # them is only read once backpressure resumes reading
+            super().process_exited()
+
+        def __detach_output_pipe(self, fd: int) -> None:
+            pipe = self.__output_pipes.pop(fd, None)
+            if pipe is not None and self.__backpressure is not None:
+                self.__backpressure.detach(pipe)
+
+        def activate(self) -> None:
+            held_output, self.__held_output = self.__held_output, None
+            for output in held_output or ():
+                self.__on_output_received(*output)
 
         def on_stdout_received(self, data: bytes) -> None:
-            self.__context.emit_event_sync(ProcessStdout(text=data, **self.__process_event_args))
+            self.__on_output_received(
+                ProcessStdout, self.__stdout_coalescer, data, (time.monotonic(), time.time())
+            )
 
         def on_stderr_received(self, data: bytes) -> None:
-            self.__context.emit_event_sync(ProcessStderr(text=data, **self.__process_event_args))
+            self.__on_output_received(
+                ProcessStderr, self.__stderr_coalescer, data, (time.monotonic(), time.time())
+            )
+
+        def __on_output_received(
+            self,
+            event_cls: Type[ProcessIO],
+            coalescer: Optional[OutputCoalescer],
+            data: bytes,
+            received_at: Tuple[float, float],
+        ) -> None:
+            if self.__held_output is not None:
+                self.__held_output.append((event_cls, coalescer, data, received_at))
+                return
+            if event_cls is ProcessStdout and self.__startup_timeline is not None:
+                self.__startup_timeline.mark("first_output")
+            if self.__backpressure is not None and not self.__backpressure.received(len(data)):
+                return
+            if coalescer is not None:
+                coalescer.feed(data, received_at)
+                return
+            event = event_cls(text=data, **self.__process_event_args)
+            # when the data was read, e.g. for `output_jsonl`, rather than when it is handled
+            event.received_at = received_at  # type: ignore
+            self.__context.emit_event_sync(event)
+
+        def pipe_connection_lost(self, fd, exc):
+            if fd == 0:
+                self.stdin.disconnect()
+            else:
+                self.__detach_output_pipe(fd)
+            # emit what is left of the output before the pipe goes away
+            coalescer = {1: self.__stdout_coalescer, 2: self.__stderr_coalescer}.get(fd)
+            if coalescer is not None:
+                coalescer.flush()
+            self.__open_output_fds.discard(fd)
+            if fd != 0 and not self.__open_output_fds and not self.output_closed.done():
+                self.output_closed.set_result(None)
+            super().pipe_connection_lost(fd, exc)
+
+    async def __wait_for_output_pipes(self, pid: int, fd_inodes: Set[int]) -> None:
+        """Wait until the output the exited process `pid` left in its paused pipes was read."""
+        protocol = self._subprocess_protocol
+        backpressure = cast(OutputBackpressure, self.__output_backpressure)
+        while not protocol.output_closed.done():
+            # once reading is not paused, nothing is held back anymore, and children of the
+            # process may keep the pipes open for as long as they run
+            if not backpressure.engaged and InodeHolderTracker(fd_inodes).poll() - {pid}:
+                return
+            await asyncio.wait((protocol.output_closed,), timeout=_INODE_RESCAN_PERIOD)
 
     async def _wait_for_inodes_to_expire(self, fd_inodes: Set[int]) -> Set[int]:
         pids = set()
+        tracker = InodeHolderTracker(fd_inodes)
         while True:
-            child_pids = get_pids_with_inodes(fd_inodes)
+            child_pids = tracker.poll()
 
             if len(child_pids) == 0:
                 break
@@ -712,10 +1315,301 @@ class ExecuteLocalExt(Action):
                 )
             )
 
-            await asyncio.sleep(0.25)
+            # wake up as soon as one of them exits, to look for any children it left
+            # behind, and rescan now and then for those which closed the pipes and run on
+            await wait_for_any_exit(
+                child_pids, asyncio.get_running_loop(), timeout=_INODE_RESCAN_PERIOD
+            )
 
         return pids
 
+    def __get_child_setup(self, standby: bool = False) -> List[Callable[[int], None]]:
+        """Return the steps setting up a new process, each taking its pid or 0 for itself."""
+        steps = []  # type: List[Callable[[int], None]]
+        # a standby process only joins the cgroup once it is released, so that it is not
+        # waited for or killed along with the process it replaces
+        if self.__cgroup is not None and not standby:
+            steps.append(self.__cgroup.attach)
+        for resource_id, limits in self.__rlimits:
+            steps.append(rlimit_setter(resource_id, limits))
+        if self.__cpu_affinity is not None:
+            steps.append(affinity_setter(self.__cpu_affinity))
+        if self.__nice is not None:
+            steps.append(nice_setter(self.__nice))
+        if self.__sched_policy is not None:
+            steps.append(scheduler_setter(*self.__sched_policy))
+        return steps
+
+    def __check_child_setup(self, pid: int) -> None:
+        """Log the steps of __get_child_setup() which did not apply to the process `pid`."""
+        if self.__cgroup is not None and pid not in self.__cgroup.pids():
+            self.__logger.warning(
+                f"process [pid {pid}] could not be moved into cgroup '{self.__cgroup.path}'"
+            )
+        for resource_id, limits in self.__rlimits:
+            try:
+                applied = get_rlimit(pid, resource_id)
+            except OSError:
+                continue
+            if applied != limits:
+                # raising a hard limit needs CAP_SYS_RESOURCE
+                self.__logger.warning(
+                    f"process [pid {pid}] has rlimit {resource_id} {applied} instead of {limits}"
+                )
+        for issue in check_scheduling(
+            pid, cpus=self.__cpu_affinity, nice=self.__nice, policy=self.__sched_policy
+        ):
+            self.__logger.warning(f"process [pid {pid}]: {issue}")
+
+    async def __spawn_process(
+        self,
+        context: LaunchContext,
+        protocol_factory: Callable[..., AsyncSubprocessProtocol],
+        *,
+        cmd: List[Text],
+        cwd: Optional[Text],
+        env: Optional[Dict[Text, Text]],
+        emulate_tty: bool,
+        gate: Optional[StandbyGate] = None,
+    ) -> Tuple[asyncio.SubprocessTransport, AsyncSubprocessProtocol]:
+        child_setup = self.__get_child_setup(standby=gate is not None)
+        if gate is None and self.__output_file_paths is None and (emulate_tty or not child_setup):
+            transport, protocol = await async_execute_process(
+                protocol_factory,
+                cmd=cmd,
+                cwd=cwd,
+                env=env,
+                shell=self.__shell,
+                emulate_tty=emulate_tty,
+                stderr_to_stdout=False,
+            )
+            # the pty is allocated by osrf_pycommon, which can't run code in the child before
+            # exec, so the process is set up right after it was started instead
+            for step in child_setup:
+                try:
+                    step(transport.get_pid())
+                except OSError:
+                    pass
+            return transport, protocol
+
+        def preexec() -> None:
+            # errors can't be reported from the child, they are checked after the spawn
+            for step in child_setup:
+                try:
+                    step(0)
+                except OSError:
+                    pass
+
+        with contextlib.ExitStack() as stack:
+            kwargs = {
+                "cwd": cwd,
+                "env": env,
+                "stdout": subprocess.PIPE,
+                "stderr": subprocess.PIPE,
+                "preexec_fn": preexec if child_setup else None,
+                # inherit the file descriptors like async_execute_process() does
+                "close_fds": False,
+            }  # type: Dict[Text, Any]
+            if self.__output_file_paths is not None:
+                # the process writes its output to the log files itself, none of it goes
+                # through the launch process
+                if emulate_tty:
+                    self.__logger.warning("emulate_tty is ignored when output_to_file is set")
+                stdout_path, stderr_path = self.__output_file_paths
+                kwargs["stdout"] = stack.enter_context(open(stdout_path, "ab"))
+                kwargs["stderr"] = stack.enter_context(open(stderr_path, "ab"))
+            if gate is not None:
+                if self.__shell:
+                    cmd = ["/bin/sh", "-c", " ".join(cmd)]
+                kwargs["env"] = gate.get_env(env)
+                # only the gate is inherited then, pass_fds needs close_fds
+                kwargs["close_fds"] = True
+                kwargs["pass_fds"] = gate.pass_fds
+                result = await context.asyncio_loop.subprocess_exec(
+                    protocol_factory, *gate.get_cmd(cmd), **kwargs
+                )
+                gate.spawned()
+                return result
+            if self.__shell:
+                return await context.asyncio_loop.subprocess_shell(
+                    protocol_factory, " ".join(cmd), **kwargs
+                )
+            return await context.asyncio_loop.subprocess_exec(protocol_factory, *cmd, **kwargs)
+
+    async def __spawn_standby(self, context: LaunchContext, emulate_tty: bool) -> None:
+        if emulate_tty:
+            # the gate needs the process to be spawned with pipes
+            self.__logger.warning("emulate_tty is set, respawning without a standby process")
+            self.__respawn_mode = "restart"
+            return
+        process_event_args = dict(cast(Dict[Text, Any], self.__process_event_args))
+        gate = StandbyGate(self.__standby_gate)
+        try:
+            standby = (gate,) + await self.__spawn_process(
+                context,
+                lambda **kwargs: self.__ProcessProtocol(
+                    self,
+                    context,
+                    process_event_args,
+                    stdout_coalescer=self.__stdout_coalescer,
+                    stderr_coalescer=self.__stderr_coalescer,
+                    standby=True,
+                    startup_timeline=self.__startup_timeline,
+                    backpressure=self.__output_backpressure,
+                    **kwargs,
+                ),
+                cmd=process_event_args["cmd"],
+                cwd=process_event_args["cwd"],
+                env=process_event_args["env"],
+                emulate_tty=False,
+                gate=gate,
+            )
+        except Exception:
+            gate.cancel()
+            self.__logger.warning(
+                f"exception occurred while starting a standby process:\n{traceback.format_exc()}"
+            )
+            return
+        if self.__completed_future.done() or self.__shutdown_future.done():
+            # nothing will be respawned anymore
+            self.__discard_standby(standby)
+            return
+        self.__standby = standby
+
+    async def __take_standby(self) -> Optional[_StandbyProcess]:
+        if self.__standby_task is not None:
+            # spawning is quick, the standby is not waited for to initialize
+            await self.__standby_task
+            self.__standby_task = None
+        standby, self.__standby = self.__standby, None
+        if standby is not None and standby[1].get_returncode() is not None:
+            self.__logger.warning(
+                "standby process [pid {}] has exited with exit code {}, starting a new process "
+                "instead".format(standby[1].get_pid(), standby[1].get_returncode())
+            )
+            self.__discard_standby(standby)
+            return None
+        return standby
+
+    def __discard_standby(self, standby: _StandbyProcess) -> None:
+        gate, transport, _ = standby
+        gate.cancel()
+        # kills the process if it is still running
+        transport.close()
+
+    async def __wait_until_ready(
+        self, context: LaunchContext, pid: int, started_at: float
+    ) -> None:
+        probe = cast(ReadinessProbe, self.__readiness_probe)
+        process_event_args = dict(cast(Dict[Text, Any], self.__process_event_args))
+        try:
+            await asyncio.wait_for(probe.wait(pid), self.__readiness_timeout)
+        except asyncio.TimeoutError:
+            self.__release_spawn_slot()
+            self.__logger.warning(
+                f"process [pid {pid}] is not ready after {self.__readiness_timeout} seconds, "
+                f"gave up waiting for {probe.describe()}"
+            )
+            if self.__startup_timeline is not None:
+                self.__startup_timeline.abandon()
+            return
+        except Exception:
+            self.__release_spawn_slot()
+            self.__logger.error(
+                "exception occurred while probing the process readiness:\n{}".format(
+                    traceback.format_exc()
+                )
+            )
+            if self.__startup_timeline is not None:
+                self.__startup_timeline.abandon()
+            return
+        self.__release_spawn_slot()
+        elapsed = time.monotonic() - started_at
+        self.__logger.info(
+            f"process [pid {pid}] is ready after {elapsed:.3f} seconds: {probe.describe()}"
+        )
+        if self.__startup_timeline is not None:
+            self.__startup_timeline.mark("ready")
+        await context.emit_event(
+            ProcessReady(elapsed=elapsed, probe=probe.describe(), **process_event_args)
+        )
+
+    async def __acquire_spawn_slot(self, context: LaunchContext) -> bool:
+        """Wait for the turn of the process to spawn, return False if shut down meanwhile."""
+        max_starting = int(
+            perform_substitutions(
+                context,
+                normalize_to_list_of_substitutions(
+                    context.launch_configurations.get("max_starting_processes", "0")
+                ),
+            )
+        )
+        if max_starting <= 0:
+            return True
+        timeout = self.__starting_timeout
+        if timeout is None:
+            timeout = float(
+                perform_substitutions(
+                    context,
+                    normalize_to_list_of_substitutions(
+                        context.launch_configurations.get("starting_timeout", "10.0")
+                    ),
+                )
+            )
+        scheduler = SpawnScheduler.shared(context, context.asyncio_loop, max_starting)
+        acquire = context.asyncio_loop.create_task(
+            scheduler.acquire(self.__spawn_priority, timeout)
+        )
+        shutdown_future = cast(asyncio.Future, self.__shutdown_future)
+        self.__waiting_for_spawn_slot = True
+        try:
+            await asyncio.wait((acquire, shutdown_future), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.__waiting_for_spawn_slot = False
+        if not acquire.done():
+            acquire.cancel()
+            return False
+        self.__spawn_slot = acquire.result()
+        if shutdown_future.done():
+            self.__release_spawn_slot()
+            return False
+        return True
+
+    def __release_spawn_slot(self) -> None:
+        if self.__spawn_slot is not None:
+            self.__spawn_slot.release()
+            self.__spawn_slot = None
+
+    def __start_resource_sampling(self, context: LaunchContext, pid: int) -> None:
+        process_event_args = cast(Dict[Text, Any], self.__process_event_args)
+
+        def emit(sample: ResourceSample) -> None:
+            context.emit_event_sync(
+                ProcessResourceSample(
+                    num_processes=sample.num_processes,
+                    cpu_percent=sample.cpu_percent,
+                    rss=sample.rss,
+                    read_bytes=sample.read_bytes,
+                    write_bytes=sample.write_bytes,
+                    **process_event_args,
+                )
+            )
+
+        sampler = ResourceSampler.shared(
+            context,
+            context.asyncio_loop,
+            os.path.join(launch.logging.launch_config.log_dir, "process_metrics.csv"),
+        )
+        sampler.add(
+            self,
+            process_event_args["name"],
+            pid,
+            cast(float, self.__resource_sample_interval),
+            emit,
+            # the cgroup also knows about descendants which were reparented
+            get_pids=self.__cgroup.pids if self.__cgroup is not None else None,
+        )
+
     async def __execute_process(self, context: LaunchContext) -> None:
         process_event_args = self.__process_event_args
         if process_event_args is None:
@@ -740,27 +1634,81 @@ class ExecuteLocalExt(Action):
                 normalize_to_list_of_substitutions(context.launch_configurations["emulate_tty"]),
             )
 
-        try:
-            transport, self._subprocess_protocol = await async_execute_process(
-                lambda **kwargs: self.__ProcessProtocol(
-                    self, context, process_event_args, **kwargs
-                ),
-                cmd=cmd,
-                cwd=cwd,
-                env=env,
-                shell=self.__shell,
-                emulate_tty=emulate_tty,
-                stderr_to_stdout=False,
-            )
-        except Exception:
-            self.__logger.error(
-                f"exception occurred while executing process:\n{traceback.format_exc()}"
-            )
-            self.__cleanup()
-            return
+        if self.__use_cgroup and self.__cgroup is None:
+            try:
+                self.__cgroup = CgroupLeaf.create(
+                    process_event_args["name"],
+                    controllers=[_CGROUP_CONTROLLERS[key] for key in self.__cgroup_limits],
+                )
+                self.__cgroup.set_limits(**self.__cgroup_limits)
+            except (CgroupError, OSError) as e:
+                if self.__cgroup_limits:
+                    self.__logger.error(f"not applying the cgroup resource limits: {e}")
+                if self.__cgroup is None:
+                    self.__use_cgroup = False
+                    self.__logger.warning(f"not tracking the process in a cgroup: {e}")
+
+        if not self.__spawn_scheduled:
+            # only the first spawn waits for its turn, respawns have their own delays
+            self.__spawn_scheduled = True
+            if not await self.__acquire_spawn_slot(context):
+                if self.__startup_timeline is not None:
+                    self.__startup_timeline.abandon()
+                self.__cleanup()
+                return
+
+        if self.__startup_timeline is not None:
+            self.__startup_timeline.mark("spawn")
+        standby = await self.__take_standby() if self.__respawn_mode == "standby" else None
+        if standby is not None:
+            gate, transport, self._subprocess_protocol = standby
+            process_event_args["pid"] = transport.get_pid()
+            if self.__cgroup is not None:
+                try:
+                    self.__cgroup.attach(transport.get_pid())
+                except OSError:
+                    pass
+            gate.release()
+            if self.__readiness_probe is not None:
+                self.__readiness_probe.expect(transport.get_pid())
+            self._subprocess_protocol.activate()
+            self.__logger.info(f"standby process [pid {transport.get_pid()}] was released")
+        else:
+            try:
+                transport, self._subprocess_protocol = await self.__spawn_process(
+                    context,
+                    lambda **kwargs: self.__ProcessProtocol(
+                        self,
+                        context,
+                        process_event_args,
+                        stdout_coalescer=self.__stdout_coalescer,
+                        stderr_coalescer=self.__stderr_coalescer,
+                        startup_timeline=self.__startup_timeline,
+                        backpressure=self.__output_backpressure,
+                        readiness_probe=self.__readiness_probe,
+                        **kwargs,
+                    ),
+                    cmd=cmd,
+                    cwd=cwd,
+                    env=env,
+                    emulate_tty=emulate_tty,
+                )
+            except Exception:
+                self.__logger.error(
+                    f"exception occurred while executing process:\n{traceback.format_exc()}"
+                )
+                if self.__startup_timeline is not None:
+                    self.__startup_timeline.abandon()
+                self.__release_spawn_slot()
+                self.__cleanup()
+                return
 
         pid = transport.get_pid()
+        started_at = time.monotonic()
         self._subprocess_transport = transport
+        self.__check_child_setup(pid)
+        # fields of the output format may refer to details of this process, e.g. its pid
+        self.__render_line = compile_output_format(self.__output_format, this=self)
 
         # get inode[s] for stdout and stderr for the PID
         fd_inodes = get_inodes(pid)
@@ -768,15 +1716,54 @@ class ExecuteLocalExt(Action):
 
         await context.emit_event(ProcessStarted(**process_event_args))
 
-        returncode = await self._subprocess_protocol.complete
+        if self.__resource_sample_interval is not None:
+            self.__start_resource_sampling(context, pid)
+
+        ready_task = None
+        if self.__readiness_probe is not None:
+            ready_task = context.asyncio_loop.create_task(
+                self.__wait_until_ready(context, pid, started_at)
+            )
 
-        if self.__wait_for_child_pids:
+        if self.__stdin_file_path is not None:
+            context.asyncio_loop.create_task(self.__stream_stdin_file(self.__stdin_file_path))
+
+        if self.__respawn and self.__respawn_mode == "standby":
+            # prepare the replacement while this process runs
+            self.__standby_task = context.asyncio_loop.create_task(
+                self.__spawn_standby(context, emulate_tty)
+            )
+
+        returncode = await self._subprocess_protocol.complete
+        self.__release_spawn_slot()
+        if ready_task is not None and not ready_task.done():
+            ready_task.cancel()
+            self.__logger.warning(f"process [pid {pid}] exited before it was ready")
+            if self.__startup_timeline is not None:
+                self.__startup_timeline.abandon()
+        if self.__readiness_probe is not None:
+            self.__readiness_probe.forget(pid)
+        if self.__output_backpressure is not None and self.__output_backpressure.policy == "block":
+            await self.__wait_for_output_pipes(pid, fd_inodes)
+        self.__flush_coalescers()
+
+        if self.__wait_for_child_pids and self.__cgroup is not None:
+            child_pids = self.__cgroup.pids()
+            self.__logger.info(f"waiting for child processes in cgroup '{self.__cgroup.path}'.")
+            await self.__cgroup.wait_until_empty(context.asyncio_loop)
+            self.__logger.info(
+                "child processes [pids {}] have exited.".format(",".join(map(str, child_pids)))
+            )
+        elif self.__wait_for_child_pids:
             self.__logger.info("waiting for child processes with parent's stdin/stdout pipes.")
             child_pids = await self._wait_for_inodes_to_expire(fd_inodes)
             self.__logger.info(
                 "child processes [pids {}] have exited.".format(",".join(map(str, child_pids)))
             )
 
+        if self.__resource_sample_interval is not None:
+            ResourceSampler.shared(context, context.asyncio_loop).remove(self)
+
         if returncode == 0:
             self.__logger.info(f"process has finished cleanly [pid {pid}]")
         else:
@@ -785,12 +1772,36 @@ class ExecuteLocalExt(Action):
                     pid, returncode, " ".join(filter(lambda part: part.strip(), cmd))
                 )
             )
+        self.__exit_events_pending += 1
         await context.emit_event(ProcessExited(returncode=returncode, **process_event_args))
+
+        now = time.monotonic()
+        if self.__respawn_policy.record_exit(now - started_at, now):
+            # the process was healthy for long enough, start counting retries over
+            self.__respawn_retries = 0
+        shutting_down = (
+            context.is_shutdown or self.__shutdown_future is None or self.__shutdown_future.done()
+        )
+        # a process stopped by the shutdown is not crash looping
+        if self.__respawn and not shutting_down and self.__respawn_policy.in_crash_loop:
+            self.__logger.error(
+                "process has exited {} times within {} seconds, not respawning it anymore".format(
+                    self.__respawn_policy.crash_count, self.__respawn_crash_loop_window
+                )
+            )
+            await context.emit_event(
+                ProcessCrashLoop(
+                    crash_count=self.__respawn_policy.crash_count,
+                    window=self.__respawn_crash_loop_window,
+                    **process_event_args,
+                )
+            )
+            self.__cleanup()
+            return
+
         # respawn the process if necessary
         if (
-            not context.is_shutdown
-            and self.__shutdown_future is not None
-            and not self.__shutdown_future.done()
+            not shutting_down
             and self.__respawn
             and (
                 self.__respawn_max_retries < 0
@@ -799,11 +1810,12 @@ class ExecuteLocalExt(Action):
         ):
             # Increase the respawn_retries counter
             self.__respawn_retries += 1
-            if self.__respawn_delay is not None and self.__respawn_delay > 0.0:
-                # wait for a timeout(`self.__respawn_delay`) to respawn the process
+            respawn_delay = self.__respawn_policy.next_delay()
+            if respawn_delay > 0.0:
+                # wait for a timeout(`respawn_delay`) to respawn the process
                 # and handle shutdown event with future(`self.__shutdown_future`)
                 # to make sure `ros2 launch` exit in time
-                await asyncio.wait((self.__shutdown_future,), timeout=self.__respawn_delay)
+                await asyncio.wait((self.__shutdown_future,), timeout=respawn_delay)
             if not self.__shutdown_future.done():
                 context.asyncio_loop.create_task(self.__execute_process(context))
                 return
@@ -824,19 +1836,58 @@ class ExecuteLocalExt(Action):
         }
 
         self.__respawn = cast(bool, perform_typed_substitution(context, self.__respawn, bool))
+        if self.__stdin_file is not None:
+            self.__stdin_file_path = perform_substitutions(context, self.__stdin_file)
+        # parsed once here, rather than when every process is shut down at the same time
+        self.__sigterm_timeout_value = float(
+            perform_substitutions(context, self.__sigterm_timeout)
+        )
+        self.__sigkill_timeout_value = float(
+            perform_substitutions(context, self.__sigkill_timeout)
+        )
+
+        limits = {
+            key: perform_substitutions(context, value)
+            for key, value in self.__cgroup_limit_substitutions.items()
+        }
+        self.__cgroup_limits = {}
+        if "cpu_quota" in limits:
+            self.__cgroup_limits["cpu_max"] = parse_cpu_quota(limits["cpu_quota"])
+        if "memory_max" in limits:
+            self.__cgroup_limits["memory_max"] = parse_size(limits["memory_max"])
+        if "io_weight" in limits:
+            self.__cgroup_limits["io_weight"] = parse_io_weight(limits["io_weight"])
+        self.__rlimits = [
+            parse_rlimit(name, perform_substitutions(context, value))
+            for name, value in self.__rlimit_substitutions.items()
+        ]
+
+        scheduling = {
+            key: perform_substitutions(context, value)
+            for key, value in self.__scheduling_substitutions.items()
+        }
+        if "cpu_affinity" in scheduling:
+            self.__cpu_affinity = parse_cpu_affinity(scheduling["cpu_affinity"])
+        if "nice" in scheduling:
+            self.__nice = parse_nice(scheduling["nice"])
+        if "sched_policy" in scheduling or "sched_priority" in scheduling:
+            self.__sched_policy = parse_sched_policy(
+                scheduling.get("sched_policy"), scheduling.get("sched_priority")
+            )
 
     def execute(self, context: LaunchContext) -> Optional[List[LaunchDescriptionEntity]]:
         """
         Execute the action.
 
         This does the following:
-        - register an event handler for the shutdown process event
-        - register an event handler for the signal process event
-        - register an event handler for the stdin event
+        - route the shutdown process, signal process, IO, shutdown and exit events
+          of this process to it, through the shared ProcessEventDispatcher
         - configures logging for the IO process event
         - create a task for the coroutine that monitors the process
         """
+        execute_time = time.monotonic()
         self.prepare(context)
+        prepared_time = time.monotonic()
         name = self.__process_description.final_name
 
         if self.__executed:
@@ -844,58 +1895,100 @@ class ExecuteLocalExt(Action):
                 f"ExecuteLocalExt action '{name}': executed more than once: {self.describe()}"
             )
         self.__executed = True
+        self.__render_line = compile_output_format(self.__output_format, this=self)
 
         if context.is_shutdown:
             # If shutdown starts before execution can start, don't start execution.
             return None
 
-        if self.__cached_output:
-            on_output_method = self.__on_process_output_cached
-            flush_buffers_method = self.__flush_cached_buffers
-        else:
-            on_output_method = self.__on_process_output
-            flush_buffers_method = self.__flush_buffers
+        if "startup_report" in context.launch_configurations and evaluate_condition_expression(
+            context,
+            normalize_to_list_of_substitutions(context.launch_configurations["startup_report"]),
+        ):
+            self.__startup_timeline = StartupTimeline(
+                name, expects_ready=self.__readiness_probe is not None
+            )
+            self.__startup_report = StartupReport.shared(
+                context, context.asyncio_loop, _publish_startup_report
+            )
+            self.__startup_report.add(self.__startup_timeline)
+            self.__startup_timeline.mark("execute", at=execute_time)
+            self.__startup_timeline.mark("prepared", at=prepared_time)
 
-        event_handlers = [
-            EventHandler(
-                matcher=lambda event: is_a_subclass(event, ShutdownProcess),
-                entities=OpaqueFunction(function=self.__on_shutdown_process_event),
-            ),
-            EventHandler(
-                matcher=lambda event: is_a_subclass(event, SignalProcess),
-                entities=OpaqueFunction(function=self.__on_signal_process_event),
-            ),
-            OnProcessIO(
-                target_action=self,
-                on_stdin=self.__on_process_stdin,
-                on_stdout=lambda event: on_output_method(
-                    event, self.__stdout_buffer, self.__stdout_logger
-                ),
-                on_stderr=lambda event: on_output_method(
-                    event, self.__stderr_buffer, self.__stderr_logger
+        if self.__cached_output:
+            self.__stdout_cache = self.__create_output_cache(name, "stdout")
+            self.__stderr_cache = self.__create_output_cache(name, "stderr")
+        if self.__output_jsonl:
+            self.__jsonl_writer = JsonLinesWriter.shared(
+                context,
+                os.path.join(launch.logging.launch_config.log_dir, "process_output.jsonl"),
+                context.asyncio_loop,
+            )
+            self.__jsonl_writer.add(self)
+            self.__emit_stdout_line = self.__jsonl_emitter("stdout")
+            self.__emit_stderr_line = self.__jsonl_emitter("stderr")
+
+        # routed by one handler per event type, instead of handlers per process which
+        # launch would match every event against
+        dispatcher = self.__dispatcher = ProcessEventDispatcher.shared(context)
+        on_exit = OnProcessExit(
+            target_action=self,
+            # TODO: This is also a little strange, OnProcessExit shouldn't ever be able to
+            # take a None for the callable, but this seems to be the default case?
+            on_exit=self.__on_exit,  # type: ignore
+        )
+        for event_type, callback in (
+            (ShutdownProcess, self.__on_shutdown_process_event),
+            (SignalProcess, self.__on_signal_process_event),
+            (ProcessStdin, lambda event, context: self.__on_process_stdin(event)),
+            (
+                ProcessStdout,
+                lambda event, context: self.__on_process_output(
+                    event,
+                    self.__stdout_assembler,
+                    self.__stdout_cache,
+                    self.__emit_stdout_line,
+                    "stdout",
                 ),
             ),
-            OnShutdown(
-                on_shutdown=self.__on_shutdown,
-            ),
-            OnProcessExit(
-                target_action=self,
-                # TODO: This is also a little strange, OnProcessExit shouldn't ever be able to
-                # take a None for the callable, but this seems to be the default case?
-                on_exit=self.__on_exit,  # type: ignore
-            ),
-            OnProcessExit(
-                target_action=self,
-                on_exit=flush_buffers_method,
+            (
+                ProcessStderr,
+                lambda event, context: self.__on_process_output(
+                    event,
+                    self.__stderr_assembler,
+                    self.__stderr_cache,
+                    self.__emit_stderr_line,
+                    "stderr",
+                ),
             ),
-        ]
-        for event_handler in event_handlers:
-            context.register_event_handler(event_handler)
+            (Shutdown, self.__on_shutdown),
+            (ProcessExited, self.__flush_buffers),
+            (ProcessExited, on_exit.handle),
+            (ProcessExited, self.__on_exit_event_handled),
+        ):
+            dispatcher.add(self, event_type, callback)
 
         try:
             self.__completed_future = context.asyncio_loop.create_future()
             self.__shutdown_future = context.asyncio_loop.create_future()
             self.__logger = launch.logging.get_logger(name)
+            self.__create_output_coalescers(context)
+            if self.__output_to_file:
+                log_dir = launch.logging.launch_config.log_dir
+                self.__output_file_paths = (
+                    # not launch's own `<name>-stdout.log`, written by the 'log' outputs
+                    os.path.join(log_dir, f"{name}.stdout.log"),
+                    os.path.join(log_dir, f"{name}.stderr.log"),
+                )
+                if self.__output_file_max_bytes is not None:
+                    self.__log_file_rotator = LogFileRotator.shared(context)
+                    for path in self.__output_file_paths:
+                        self.__log_file_rotator.add(
+                            path,
+                            self.__output_file_max_bytes,
+                            self.__output_file_backups,
+                            self.__output_file_compression,
+                        )
             if not isinstance(self.__output, dict):
                 self.__stdout_logger, self.__stderr_logger = launch.logging.get_output_loggers(
                     name, perform_substitutions(context, self.__output)
@@ -904,10 +1997,11 @@ class ExecuteLocalExt(Action):
                 self.__stdout_logger, self.__stderr_logger = launch.logging.get_output_loggers(
                     name, self.__output
                 )
+            if self.__screen_max_lines_per_second is not None:
+                self.__limit_screen_output(name)
             context.asyncio_loop.create_task(self.__execute_process(context))
         except Exception:
-            for event_handler in event_handlers:
-                context.unregister_event_handler(event_handler)
+            dispatcher.remove(self)
             raise
         return None
 
@@ -915,10 +2009,11 @@ class ExecuteLocalExt(Action):
         """Return an asyncio Future, used to let the launch system know when we're done."""
         return self.__completed_future
 
-    def get_stdout(self):
+    def get_stdout(self, last_lines: Optional[int] = None):
         """
         Get cached stdout.
 
+        :param: last_lines if set, only return up to this many of the most recent lines.
         :raises RuntimeError: if cached_output is false.
         """
         if not self.__cached_output:
@@ -926,12 +2021,17 @@ class ExecuteLocalExt(Action):
                 "cached output must be true to be able to get stdout,"
                 f" proc '{self.__process_description.name}'"
             )
-        return self.__stdout_buffer.getvalue()
+        if self.__stdout_cache is None:
+            return ""
+        if last_lines is not None:
+            return "\n".join(self.__stdout_cache.tail(last_lines))
+        return self.__stdout_cache.getvalue()
 
-    def get_stderr(self):
+    def get_stderr(self, last_lines: Optional[int] = None):
         """
-        Get cached stdout.
+        Get cached stderr.
 
+        :param: last_lines if set, only return up to this many of the most recent lines.
         :raises RuntimeError: if cached_output is false.
         """
         if not self.__cached_output:
@@ -939,7 +2039,11 @@ class ExecuteLocalExt(Action):
                 "cached output must be true to be able to get stderr, proc"
                 f" '{self.__process_description.name}'"
             )
-        return self.__stderr_buffer.getvalue()
+        if self.__stderr_cache is None:
+            return ""
+        if last_lines is not None:
+            return "\n".join(self.__stderr_cache.tail(last_lines))
+        return self.__stderr_cache.getvalue()
 
     @property
     def return_code(self):
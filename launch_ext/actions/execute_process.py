@@ -22,6 +22,9 @@ from typing import Optional
 from typing import Text
 
 from .execute_local import ExecuteLocalExt
+from ..process import FileProbe
+from ..process import OutputProbe
+from ..process import SocketProbe
 from launch.actions.shutdown_action import Shutdown
 from launch.descriptions import Executable
 from launch.frontend import Entity
@@ -228,10 +231,78 @@ class ExecuteProcessExt(ExecuteLocalExt):
             involved.
         :param: cached_output if `True`, both stdout and stderr will be cached.
             Use get_stdout() and get_stderr() to read the buffered output.
+        :param: cached_output_max_bytes if set, only the most recent output up to this
+            many bytes per stream is cached, in a ring buffer.
+        :param: cached_output_max_lines if set, only the most recent lines up to this
+            many lines per stream are cached, in a ring buffer.
+        :param: cached_output_to_file if `True`, the cached output is appended to a
+            file per stream in the launch log directory and read back through `mmap`,
+            instead of being held in memory.
+        :param: output_coalesce_window if set, reads from the process pipes are merged
+            into a single ProcessIO event per stream for up to this many seconds.
+        :param: output_coalesce_max_bytes emit the merged output as soon as this many
+            bytes are pending, regardless of `output_coalesce_window`.
+        :param: output_high_water if set, once this many bytes of output are waiting to
+            be logged, `output_overflow` applies until they go back down to
+            `output_low_water` (defaults to half of `output_high_water`).
+        :param: output_overflow 'block' to stop reading the process pipes, so the
+            process blocks on its writes, or 'drop' to drop its output.
+        :param: screen_max_lines_per_second if set, at most this many stdout lines per
+            second are printed on the screen, with summaries of the dropped lines. The
+            other outputs, e.g. the log files, still get all of them.
+        :param: output_to_file if `True`, the stdout and stderr of the process are
+            attached directly to `<name>.stdout.log` and `<name>.stderr.log` in the launch
+            log directory, bypassing the launch event system.
+        :param: output_file_max_bytes if set with `output_to_file`, the log files are
+            rotated in a background thread once they grow past this size.
+        :param: output_file_backups number of rotated segments to keep per log file.
+        :param: output_file_compression compression of the rotated segments, either
+            'gzip', 'zstd' (requires the `zstandard` module) or None.
+        :param: output_jsonl if `True`, each output line is written as a JSON object to
+            `process_output.jsonl` in the launch log directory, instead of being logged
+            according to `output` and `output_format`.
         :param: on_exit list of actions to execute upon process exit.
         :param: respawn if 'True', relaunch the process that abnormally died.
             Defaults to 'False'.
         :param: respawn_delay a delay time to relaunch the died process if respawn is 'True'.
+        :param: respawn_backoff_multiplier factor applied to the respawn delay after each
+            respawn. Defaults to 1, i.e. a fixed delay.
+        :param: respawn_max_delay upper bound of the respawn delay, in seconds.
+        :param: respawn_jitter randomizes each respawn delay by up to this fraction of it.
+        :param: respawn_reset_after once the process ran for this many seconds, the
+            respawn delay and retry counter reset.
+        :param: respawn_crash_loop_count if the process exits this many times within
+            `respawn_crash_loop_window` seconds, it is not respawned anymore and a
+            `launch_ext.events.ProcessCrashLoop` event is emitted.
+        :param: respawn_mode 'restart', or 'standby' to keep a replacement process
+            spawned in advance and release it when the process exits.
+        :param: standby_gate 'exec' or 'cooperative', how the standby process is held back.
+        :param: use_cgroup if `True`, the process is started in its own cgroup v2 leaf,
+            used to track its descendants and to kill all of them on shutdown.
+        :param: resource_sample_interval if set, the resource usage of the process is
+            sampled every this many seconds, see `launch_ext.events.ProcessResourceSample`.
+        :param: cpu_quota the number of CPUs worth of time the process may use, e.g. '0.5'.
+        :param: memory_max the memory the process may use, e.g. '512M'.
+        :param: io_weight the IO weight of the process, from 1 to 10000.
+            These three are enforced through a cgroup and imply `use_cgroup`.
+        :param: rlimits resource limits by name, e.g. `{'nofile': '4096'}`, set before
+            the process executes.
+        :param: cpu_affinity the CPUs the process may run on, e.g. '0-3,6'.
+        :param: nice the nice level of the process, from -20 to 19.
+        :param: sched_policy 'other', 'batch', 'idle', 'fifo' or 'rr'.
+        :param: sched_priority the real-time priority of the process, from 1 to 99.
+        :param: readiness_probe tells when the process is ready, see
+            `launch_ext.process.ReadinessProbe` and `launch_ext.event_handlers.OnProcessReady`.
+            In the frontends, it is given by one of the `ready_output` (regular
+            expression), `ready_socket` ('host:port' or Unix socket path) or `ready_file`
+            attributes.
+        :param: readiness_timeout the time after which the process is not probed anymore.
+        :param: stdin_file a file streamed to the stdin of each new process, which is
+            closed at the end of the file.
+        :param: spawn_priority processes with a higher priority are spawned first, when
+            the `max_starting_processes` launch configuration is set.
+        :param: starting_timeout the time after which the process counts as started
+            for `max_starting_processes`, even if it is not ready yet.
         """
         executable = Executable(
             cmd=cmd, prefix=prefix, name=name, cwd=cwd, env=env, additional_env=additional_env
@@ -388,6 +459,99 @@ class ExecuteProcessExt(ExecuteLocalExt):
             if emulate_tty is not None:
                 kwargs["emulate_tty"] = emulate_tty
 
+        for setting, data_type in (
+            ("cached_output_max_bytes", int),
+            ("cached_output_max_lines", int),
+            ("cached_output_to_file", bool),
+            ("output_coalesce_window", float),
+            ("output_coalesce_max_bytes", int),
+            ("output_high_water", int),
+            ("output_low_water", int),
+            ("output_overflow", str),
+            ("screen_max_lines_per_second", float),
+            ("output_to_file", bool),
+            ("output_file_max_bytes", int),
+            ("output_file_backups", int),
+            ("output_file_compression", str),
+            ("output_jsonl", bool),
+            ("respawn_max_retries", int),
+            ("respawn_backoff_multiplier", float),
+            ("respawn_max_delay", float),
+            ("respawn_jitter", float),
+            ("respawn_reset_after", float),
+            ("respawn_crash_loop_count", int),
+            ("respawn_crash_loop_window", float),
+            ("respawn_mode", str),
+            ("standby_gate", str),
+            ("use_cgroup", bool),
+            ("resource_sample_interval", float),
+        ):
+            if setting not in ignore:
+                value = entity.get_attr(setting, data_type=data_type, optional=True)
+                if value is not None:
+                    kwargs[setting] = value
+        if kwargs.get("output_file_compression") == "none":
+            kwargs["output_file_compression"] = None
+
+        for setting in (
+            "cpu_quota",
+            "memory_max",
+            "io_weight",
+            "cpu_affinity",
+            "nice",
+            "sched_policy",
+            "sched_priority",
+            "stdin_file",
+        ):
+            if setting not in ignore:
+                value = entity.get_attr(setting, optional=True)
+                if value is not None:
+                    kwargs[setting] = parser.parse_substitution(value)
+
+        if "rlimits" not in ignore:
+            rlimits = entity.get_attr("rlimit", data_type=List[Entity], optional=True)
+            if rlimits is not None:
+                kwargs["rlimits"] = {
+                    e.get_attr("name"): parser.parse_substitution(e.get_attr("value"))
+                    for e in rlimits
+                }
+                for e in rlimits:
+                    e.assert_entity_completely_parsed()
+
+        if "readiness_probe" not in ignore:
+            probes = {
+                "ready_output": OutputProbe,
+                "ready_socket": SocketProbe,
+                "ready_file": FileProbe,
+            }
+            for attr, probe_cls in probes.items():
+                value = entity.get_attr(attr, optional=True)
+                if value is not None:
+                    if "readiness_probe" in kwargs:
+                        raise ValueError(
+                            "Entity node expected to have at most one of the attributes {}".format(
+                                ", ".join(probes)
+                            )
+                        )
+                    kwargs["readiness_probe"] = probe_cls(value)
+
+        if "readiness_timeout" not in ignore:
+            readiness_timeout = entity.get_attr(
+                "readiness_timeout", data_type=float, optional=True
+            )
+            if readiness_timeout is not None:
+                kwargs["readiness_timeout"] = readiness_timeout
+
+        if "spawn_priority" not in ignore:
+            spawn_priority = entity.get_attr("spawn_priority", data_type=int, optional=True)
+            if spawn_priority is not None:
+                kwargs["spawn_priority"] = spawn_priority
+
+        if "starting_timeout" not in ignore:
+            starting_timeout = entity.get_attr("starting_timeout", data_type=float, optional=True)
+            if starting_timeout is not None:
+                kwargs["starting_timeout"] = starting_timeout
+
         if "additional_env" not in ignore:
             # Conditions won't be allowed in the `env` tag.
             # If that feature is needed, `set_enviroment_variable` and
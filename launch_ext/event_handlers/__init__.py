@@ -0,0 +1,9 @@
+"""Event handlers for the events emitted by the launch_ext actions."""
+
+from .on_process_ready import OnProcessReady
+from .process_event_dispatcher import ProcessEventDispatcher
+
+__all__ = [
+    "OnProcessReady",
+    "ProcessEventDispatcher",
+]
@@ -0,0 +1,58 @@
+"""Module for the OnProcessReady event handler."""
+
+from typing import Callable
+from typing import cast
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+from launch.event import Event
+from launch.event_handlers.on_action_event_base import OnActionEventBase
+from launch.launch_context import LaunchContext
+from launch.some_entities_type import SomeEntitiesType
+
+from ..events import ProcessReady
+
+if TYPE_CHECKING:
+    from launch.action import Action  # noqa: F401
+
+    from ..actions import ExecuteLocalExt  # noqa: F401
+
+
+class OnProcessReady(OnActionEventBase):
+    """
+    Convenience class for handling a process ready event.
+
+    It may be configured to only handle the readiness of a specific action,
+    or of all processes. Actions started from it only wait for the process to
+    be up, instead of a fixed delay.
+    """
+
+    def __init__(
+        self,
+        *,
+        target_action: Optional[
+            Union[Callable[["ExecuteLocalExt"], bool], "ExecuteLocalExt"]
+        ] = None,
+        on_ready: Union[
+            SomeEntitiesType, Callable[[ProcessReady, LaunchContext], Optional[SomeEntitiesType]]
+        ],
+        **kwargs,
+    ) -> None:
+        """Create an OnProcessReady event handler."""
+        from ..actions import ExecuteLocalExt  # noqa: F811
+
+        super().__init__(
+            action_matcher=cast(
+                Optional[Union[Callable[["Action"], bool], "Action"]], target_action
+            ),
+            on_event=cast(
+                Union[
+                    SomeEntitiesType, Callable[[Event, LaunchContext], Optional[SomeEntitiesType]]
+                ],
+                on_ready,
+            ),
+            target_event_cls=ProcessReady,
+            target_action_cls=ExecuteLocalExt,
+            **kwargs,
+        )
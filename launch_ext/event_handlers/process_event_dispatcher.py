@@ -0,0 +1,107 @@
+"""Module for the ProcessEventDispatcher class."""
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Type
+
+from launch.action import Action
+from launch.event import Event
+from launch.event_handler import EventHandler
+from launch.events.process import RunningProcessEvent
+from launch.launch_context import LaunchContext
+from launch.launch_description_entity import LaunchDescriptionEntity
+from launch.some_entities_type import SomeEntitiesType
+from launch.utilities import is_a_subclass
+
+from ..process import shared_instance
+
+ProcessEventCallback = Callable[[Event, LaunchContext], Optional[SomeEntitiesType]]
+
+
+class _DispatchHandler(EventHandler):
+    def __init__(
+        self,
+        event_type: Type[Event],
+        dispatch: Callable[[Type[Event], Event, LaunchContext], Optional[SomeEntitiesType]],
+    ) -> None:
+        super().__init__(matcher=lambda event: is_a_subclass(event, event_type))
+        self.__event_type = event_type
+        self.__dispatch = dispatch
+
+    def handle(self, event: Event, context: LaunchContext) -> Optional[SomeEntitiesType]:
+        # sets context.locals.event
+        super().handle(event, context)
+        return self.__dispatch(self.__event_type, event, context)
+
+
+class ProcessEventDispatcher:
+    """
+    Routes the events of a launch to callbacks of the actions they concern.
+
+    Launch matches every event against every registered event handler, so
+    registering handlers per process makes each line of output cost O(processes).
+    The dispatcher registers a single handler per event type instead, and finds
+    the callbacks of the target action in a dict.
+
+    Events of a running process, e.g. ProcessStdout or ProcessExited, go to the
+    callbacks of their action only. Other events, e.g. Shutdown or
+    ShutdownProcess, go to the callbacks of every action, in the order they
+    were added.
+    """
+
+    def __init__(self, context: LaunchContext) -> None:
+        self.__context = context
+        self.__routes = {}  # type: Dict[Type[Event], Dict[Action, List[ProcessEventCallback]]]
+        self.__handlers = {}  # type: Dict[Type[Event], EventHandler]
+
+    @classmethod
+    def shared(cls, context: LaunchContext) -> "ProcessEventDispatcher":
+        """Return the dispatcher of the launch `context`, creating it on first use."""
+        return shared_instance(context, cls, lambda: cls(context))
+
+    @property
+    def event_handlers(self) -> List[EventHandler]:
+        """The event handlers registered with the launch context, one per event type."""
+        return list(self.__handlers.values())
+
+    def add(self, action: Action, event_type: Type[Event], callback: ProcessEventCallback) -> None:
+        """
+        Call `callback` with the events of type `event_type` concerning `action`.
+
+        :param: action the action the events are routed to
+        :param: event_type the type of the events, including its subclasses
+        :param: callback called with the event and the launch context, it may return
+            entities to be visited like the entities of an event handler
+        """
+        routes = self.__routes.get(event_type)
+        if routes is None:
+            routes = self.__routes[event_type] = {}
+            handler = self.__handlers[event_type] = _DispatchHandler(event_type, self.__dispatch)
+            self.__context.register_event_handler(handler)
+        routes.setdefault(action, []).append(callback)
+
+    def remove(self, action: Action) -> None:
+        """Stop routing events to the callbacks of `action`."""
+        for routes in self.__routes.values():
+            routes.pop(action, None)
+
+    def __dispatch(
+        self, event_type: Type[Event], event: Event, context: LaunchContext
+    ) -> Optional[SomeEntitiesType]:
+        routes = self.__routes[event_type]
+        if isinstance(event, RunningProcessEvent):
+            callbacks = routes.get(event.action, ())
+        else:
+            callbacks = [callback for callbacks in list(routes.values()) for callback in callbacks]
+        entities = []  # type: List[LaunchDescriptionEntity]
+        for callback in callbacks:
+            result = callback(event, context)
+            if result is None:
+                continue
+            if isinstance(result, LaunchDescriptionEntity):
+                entities.append(result)
+            else:
+                entities.extend(result)
+        return entities or None
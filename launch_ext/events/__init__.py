@@ -0,0 +1,11 @@
+"""Events emitted by the launch_ext actions."""
+
+from .process_crash_loop import ProcessCrashLoop
+from .process_ready import ProcessReady
+from .process_resource_sample import ProcessResourceSample
+
+__all__ = [
+    "ProcessCrashLoop",
+    "ProcessReady",
+    "ProcessResourceSample",
+]
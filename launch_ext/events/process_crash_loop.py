@@ -0,0 +1,40 @@
+"""Module for the ProcessCrashLoop event."""
+
+from typing import Text
+
+from launch.events.process import RunningProcessEvent
+
+
+class ProcessCrashLoop(RunningProcessEvent):
+    """Event emitted when a respawning process exits too often and is given up on."""
+
+    name = "launch_ext.events.process.ProcessCrashLoop"
+
+    def __init__(self, *, crash_count: int, window: float, **kwargs) -> None:
+        """
+        Create a ProcessCrashLoop event.
+
+        Unmatched keyword arguments are passed to RunningProcessEvent, see it
+        for details on those arguments.
+
+        :param: crash_count the number of exits within the window
+        :param: window the length of the window, in seconds
+        """
+        super().__init__(**kwargs)
+        self.__crash_count = crash_count
+        self.__window = window
+
+    @property
+    def crash_count(self) -> int:
+        """Getter for crash_count."""
+        return self.__crash_count
+
+    @property
+    def window(self) -> float:
+        """Getter for window."""
+        return self.__window
+
+    def __str__(self) -> Text:
+        return "ProcessCrashLoop(action='{}', name='{}', crash_count={}, window={})".format(
+            self.action, self.process_name, self.crash_count, self.window
+        )
@@ -0,0 +1,40 @@
+"""Module for the ProcessReady event."""
+
+from typing import Text
+
+from launch.events.process import RunningProcessEvent
+
+
+class ProcessReady(RunningProcessEvent):
+    """Event emitted when the readiness probe of a process succeeds."""
+
+    name = "launch_ext.events.process.ProcessReady"
+
+    def __init__(self, *, elapsed: float, probe: Text, **kwargs) -> None:
+        """
+        Create a ProcessReady event.
+
+        Unmatched keyword arguments are passed to RunningProcessEvent, see it
+        for details on those arguments.
+
+        :param: elapsed the time from the start of the process until it was ready, in seconds
+        :param: probe the description of the probe which succeeded
+        """
+        super().__init__(**kwargs)
+        self.__elapsed = elapsed
+        self.__probe = probe
+
+    @property
+    def elapsed(self) -> float:
+        """Getter for elapsed."""
+        return self.__elapsed
+
+    @property
+    def probe(self) -> Text:
+        """Getter for probe."""
+        return self.__probe
+
+    def __str__(self) -> Text:
+        return "ProcessReady(action='{}', name='{}', elapsed={:.3f}, probe={})".format(
+            self.action, self.process_name, self.elapsed, self.probe
+        )
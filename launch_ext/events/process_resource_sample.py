@@ -0,0 +1,80 @@
+"""Module for the ProcessResourceSample event."""
+
+from typing import Text
+
+from launch.events.process import RunningProcessEvent
+
+
+class ProcessResourceSample(RunningProcessEvent):
+    """Event emitted periodically with the resource usage of a process and its descendants."""
+
+    name = "launch_ext.events.process.ProcessResourceSample"
+
+    def __init__(
+        self,
+        *,
+        num_processes: int,
+        cpu_percent: float,
+        rss: int,
+        read_bytes: int,
+        write_bytes: int,
+        **kwargs,
+    ) -> None:
+        """
+        Create a ProcessResourceSample event.
+
+        Unmatched keyword arguments are passed to RunningProcessEvent, see it
+        for details on those arguments.
+
+        :param: num_processes the number of processes sampled
+        :param: cpu_percent the CPU time used since the previous sample, as a
+            percentage of one CPU
+        :param: rss the resident set size, in bytes
+        :param: read_bytes the bytes read from storage by the live processes
+        :param: write_bytes the bytes written to storage by the live processes
+        """
+        super().__init__(**kwargs)
+        self.__num_processes = num_processes
+        self.__cpu_percent = cpu_percent
+        self.__rss = rss
+        self.__read_bytes = read_bytes
+        self.__write_bytes = write_bytes
+
+    @property
+    def num_processes(self) -> int:
+        """Getter for num_processes."""
+        return self.__num_processes
+
+    @property
+    def cpu_percent(self) -> float:
+        """Getter for cpu_percent."""
+        return self.__cpu_percent
+
+    @property
+    def rss(self) -> int:
+        """Getter for rss."""
+        return self.__rss
+
+    @property
+    def read_bytes(self) -> int:
+        """Getter for read_bytes."""
+        return self.__read_bytes
+
+    @property
+    def write_bytes(self) -> int:
+        """Getter for write_bytes."""
+        return self.__write_bytes
+
+    def __str__(self) -> Text:
+        return (
+            "ProcessResourceSample(action='{}', name='{}', num_processes={}, cpu_percent={:.1f},"
+            " rss={}, read_bytes={}, write_bytes={})".format(
+                self.action,
+                self.process_name,
+                self.num_processes,
+                self.cpu_percent,
+                self.rss,
+                self.read_bytes,
+                self.write_bytes,
+            )
+        )
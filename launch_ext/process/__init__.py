@@ -0,0 +1,110 @@
+"""Helpers used by the process execution actions.
+
+These are building blocks for :class:`launch_ext.actions.ExecuteLocalExt` which
+do not depend on the launch event system, so they can be reused and tested in
+isolation.
+"""
+
+from .cgroup import CgroupError
+from .cgroup import CgroupLeaf
+from .inode_tracker import InodeHolderTracker
+from .inode_tracker import InodeIndex
+from .jsonl_writer import JsonLinesWriter
+from .line_assembler import LineAssembler
+from .log_rotation import LogFileRotator
+from .log_rotation import check_compression
+from .log_rotation import rotate_file
+from .output_backpressure import OutputBackpressure
+from .output_cache import MemoryOutputCache
+from .output_cache import MmapOutputCache
+from .output_cache import OutputCache
+from .output_cache import RingOutputCache
+from .output_coalescer import OutputCoalescer
+from .output_format import compile_output_format
+from .output_shedding import OutputSheddingFilter
+from .pidfd import pidfd_supported
+from .pidfd import wait_for_any_exit
+from .readiness import CoroutineProbe
+from .readiness import FileProbe
+from .readiness import OutputProbe
+from .readiness import ReadinessProbe
+from .readiness import SocketProbe
+from .resource_limits import get_rlimit
+from .resource_limits import parse_cpu_quota
+from .resource_limits import parse_io_weight
+from .resource_limits import parse_rlimit
+from .resource_limits import parse_size
+from .resource_limits import rlimit_setter
+from .resource_sampler import ResourceSample
+from .resource_sampler import ResourceSampler
+from .resource_sampler import check_resource_sampling
+from .respawn_policy import RespawnPolicy
+from .scheduling import affinity_setter
+from .scheduling import check_scheduling
+from .scheduling import nice_setter
+from .scheduling import parse_cpu_affinity
+from .scheduling import parse_nice
+from .scheduling import parse_sched_policy
+from .scheduling import scheduler_setter
+from .shared_instance import shared_instance
+from .shutdown_scheduler import Deadline
+from .shutdown_scheduler import ShutdownScheduler
+from .spawn_scheduler import SpawnScheduler
+from .spawn_scheduler import SpawnSlot
+from .standby_gate import StandbyGate
+from .startup_timeline import StartupReport
+from .startup_timeline import StartupTimeline
+from .stdin_writer import StdinWriter
+
+__all__ = [
+    "CgroupError",
+    "CgroupLeaf",
+    "CoroutineProbe",
+    "Deadline",
+    "FileProbe",
+    "InodeHolderTracker",
+    "InodeIndex",
+    "JsonLinesWriter",
+    "LineAssembler",
+    "LogFileRotator",
+    "MemoryOutputCache",
+    "MmapOutputCache",
+    "OutputBackpressure",
+    "OutputCache",
+    "OutputCoalescer",
+    "OutputProbe",
+    "OutputSheddingFilter",
+    "ReadinessProbe",
+    "ResourceSample",
+    "ResourceSampler",
+    "RespawnPolicy",
+    "RingOutputCache",
+    "ShutdownScheduler",
+    "SocketProbe",
+    "SpawnScheduler",
+    "SpawnSlot",
+    "StandbyGate",
+    "StartupReport",
+    "StartupTimeline",
+    "StdinWriter",
+    "affinity_setter",
+    "check_compression",
+    "check_resource_sampling",
+    "check_scheduling",
+    "compile_output_format",
+    "get_rlimit",
+    "nice_setter",
+    "parse_cpu_affinity",
+    "parse_cpu_quota",
+    "parse_io_weight",
+    "parse_nice",
+    "parse_rlimit",
+    "parse_sched_policy",
+    "parse_size",
+    "pidfd_supported",
+    "rlimit_setter",
+    "rotate_file",
+    "scheduler_setter",
+    "shared_instance",
+    "wait_for_any_exit",
+]
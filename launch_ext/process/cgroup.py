@@ -0,0 +1,248 @@
+"""Module for tracking launched processes in cgroup v2 leaves."""
+
+import asyncio
+import ctypes
+import itertools
+import os
+import re
+import signal
+from typing import Iterable
+from typing import Optional
+from typing import Set
+from typing import Text
+
+CGROUP_ROOT_ENV = "LAUNCH_EXT_CGROUP_ROOT"
+
+_IN_MODIFY = 0x00000002
+_counter = itertools.count()
+
+
+class CgroupError(RuntimeError):
+    """Raised when a cgroup can't be created or used."""
+
+
+def get_cgroup2_mount() -> Optional[Text]:
+    """Return where the unified (v2) cgroup hierarchy is mounted, or None."""
+    try:
+        with open("/proc/self/mounts") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) > 2 and fields[2] == "cgroup2":
+                    return fields[1]
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def get_own_cgroup() -> Text:
+    """Return the absolute path of the cgroup of the current process."""
+    mount = get_cgroup2_mount()
+    if mount is None:
+        raise CgroupError("cgroup v2 is not mounted")
+    with open("/proc/self/cgroup") as f:
+        for line in f:
+            if line.startswith("0::"):
+                return os.path.join(mount, line[3:].strip().lstrip("/"))
+    raise CgroupError("the current process is not in a cgroup v2 hierarchy")
+
+
+def _write(path: Text, value: Text) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
+    try:
+        os.write(fd, value.encode())
+    finally:
+        os.close(fd)
+
+
+def enable_controllers(path: Text, controllers: Iterable[Text]) -> None:
+    """Enable `controllers`, e.g. 'cpu' or 'memory', for the children of the cgroup `path`."""
+    controllers = set(controllers)
+    with open(os.path.join(path, "cgroup.subtree_control")) as f:
+        controllers.difference_update(f.read().split())
+    if not controllers:
+        return
+    with open(os.path.join(path, "cgroup.controllers")) as f:
+        missing = controllers.difference(f.read().split())
+    if missing:
+        raise CgroupError(
+            "cgroup controllers {} are not delegated to '{}'".format(
+                ", ".join(sorted(missing)), path
+            )
+        )
+    try:
+        _write(
+            os.path.join(path, "cgroup.subtree_control"),
+            " ".join("+" + controller for controller in sorted(controllers)),
+        )
+    except OSError as e:
+        # a cgroup holding processes itself can't hand controllers down to its children
+        raise CgroupError(
+            f"failed to enable cgroup controllers in '{path}': {e}, set {CGROUP_ROOT_ENV} "
+            "to a delegated cgroup without processes of its own"
+        ) from e
+
+
+class _InotifyWatch:
+    """Minimal inotify watch for modifications of a file, through libc."""
+
+    def __init__(self, path: Text) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(path), _IN_MODIFY) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for '{path}'")
+
+    async def wait(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Wait for the next modification."""
+        future = loop.create_future()
+        loop.add_reader(self.fd, lambda: future.done() or future.set_result(None))
+        try:
+            await future
+        finally:
+            loop.remove_reader(self.fd)
+        try:
+            while os.read(self.fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class CgroupLeaf:
+    """
+    A leaf cgroup holding a launched process and all of its descendants.
+
+    Leaves are created under the directory given by the `LAUNCH_EXT_CGROUP_ROOT`
+    environment variable, which should be a cgroup delegated to the user running
+    launch, or otherwise under the cgroup of the launch process itself.
+    """
+
+    def __init__(self, path: Text) -> None:
+        self.__path = path
+
+    @classmethod
+    def create(
+        cls, name: Text, parent: Optional[Text] = None, controllers: Iterable[Text] = ()
+    ) -> "CgroupLeaf":
+        """
+        Create a new, uniquely named leaf for the process called `name`.
+
+        :param: name the name of the process
+        :param: parent the cgroup to create the leaf in, see the class documentation
+        :param: controllers the controllers the leaf needs, enabled in the parent
+        """
+        if parent is None:
+            parent = os.environ.get(CGROUP_ROOT_ENV) or get_own_cgroup()
+        if controllers:
+            enable_controllers(parent, controllers)
+        leaf_name = "{}-{}-{}".format(
+            re.sub(r"[^A-Za-z0-9_.-]", "_", name), os.getpid(), next(_counter)
+        )
+        path = os.path.join(parent, leaf_name)
+        try:
+            os.mkdir(path)
+        except OSError as e:
+            raise CgroupError(f"failed to create cgroup '{path}': {e}") from e
+        return cls(path)
+
+    @property
+    def path(self) -> Text:
+        """Absolute path of the cgroup."""
+        return self.__path
+
+    def attach(self, pid: int) -> None:
+        """Move the process `pid` into the cgroup."""
+        _write(os.path.join(self.__path, "cgroup.procs"), str(pid))
+
+    def set_limits(
+        self,
+        *,
+        cpu_max: Optional[Text] = None,
+        memory_max: Optional[int] = None,
+        io_weight: Optional[int] = None,
+    ) -> None:
+        """
+        Limit the resources of the processes in the cgroup.
+
+        :param: cpu_max the content of `cpu.max`, i.e. the quota and period in microseconds
+        :param: memory_max the maximum memory usage, in bytes
+        :param: io_weight the proportional IO weight, from 1 to 10000
+        """
+        limits = (
+            ("cpu.max", cpu_max),
+            ("memory.max", None if memory_max is None else str(memory_max)),
+            ("io.weight", None if io_weight is None else f"default {io_weight}"),
+        )
+        for filename, value in limits:
+            if value is None:
+                continue
+            try:
+                _write(os.path.join(self.__path, filename), value)
+            except OSError as e:
+                raise CgroupError(f"failed to set {filename} of '{self.__path}': {e}") from e
+
+    @property
+    def populated(self) -> bool:
+        """Whether any process is left in the cgroup."""
+        try:
+            with open(os.path.join(self.__path, "cgroup.events")) as f:
+                for line in f:
+                    key, _, value = line.partition(" ")
+                    if key == "populated":
+                        return value.strip() == "1"
+        except FileNotFoundError:
+            return False
+        return False
+
+    def pids(self) -> Set[int]:
+        """Return the pids of the processes in the cgroup."""
+        try:
+            with open(os.path.join(self.__path, "cgroup.procs")) as f:
+                return {int(pid) for pid in f.read().split()}
+        except FileNotFoundError:
+            return set()
+
+    def kill(self) -> None:
+        """Send SIGKILL to every process in the cgroup."""
+        try:
+            _write(os.path.join(self.__path, "cgroup.kill"), "1")
+            return
+        except FileNotFoundError:
+            # cgroup.kill needs Linux 5.14
+            pass
+        for pid in self.pids():
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                continue
+
+    async def wait_until_empty(
+        self, loop: asyncio.AbstractEventLoop, poll_period: float = 0.25
+    ) -> None:
+        """Wait until no process is left in the cgroup."""
+        try:
+            # watch before checking, so that no notification is missed in between
+            watch = _InotifyWatch(os.path.join(self.__path, "cgroup.events"))
+        except OSError:
+            watch = None
+        try:
+            while self.populated:
+                if watch is not None:
+                    await watch.wait(loop)
+                else:
+                    await asyncio.sleep(poll_period)
+        finally:
+            if watch is not None:
+                watch.close()
+
+    def remove(self) -> None:
+        """Remove the cgroup, which must be empty."""
+        try:
+            os.rmdir(self.__path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,129 @@
+"""Module for finding the processes that hold the stdio pipes of a launched process."""
+
+import glob
+import os
+import time
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+import psutil
+
+STDIO_FDS = (0, 1, 2)
+
+
+def get_inodes(pid: int) -> Set[int]:
+    """Return the inodes of the stdin, stdout and stderr of a process."""
+    inodes = set()
+    for fd in STDIO_FDS:
+        try:
+            inodes.add(os.stat(f"/proc/{pid}/fd/{fd}").st_ino)
+        except (FileNotFoundError, PermissionError, ProcessLookupError):
+            continue
+    return inodes
+
+
+def get_children(pid: int) -> Set[int]:
+    """Return the direct children of a process, from the children of all its threads."""
+    children = set()
+    for path in glob.glob(f"/proc/{pid}/task/*/children"):
+        try:
+            with open(path) as f:
+                children.update(int(child) for child in f.read().split())
+        except (FileNotFoundError, PermissionError, ProcessLookupError):
+            continue
+    return children
+
+
+def get_descendants(pids: Iterable[int]) -> Set[int]:
+    """Return all descendants of the given processes, excluding themselves."""
+    descendants: Set[int] = set()
+    pending = list(pids)
+    while pending:
+        for child in get_children(pending.pop()):
+            if child not in descendants:
+                descendants.add(child)
+                pending.append(child)
+    return descendants
+
+
+def scan_inodes(pids: Iterable[int]) -> Dict[int, Set[int]]:
+    """Return a map from stdio inode to the pids, among `pids`, holding it."""
+    index: Dict[int, Set[int]] = {}
+    for pid in pids:
+        for inode in get_inodes(pid):
+            index.setdefault(inode, set()).add(pid)
+    return index
+
+
+class InodeIndex:
+    """
+    System wide map from stdio inode to the pids holding it.
+
+    Scanning every process is expensive, so a scan is shared by all callers
+    asking for it within `max_age` seconds of each other, e.g. all the
+    processes waiting on their children in the same tick.
+    """
+
+    __scan = None  # type: Optional[Tuple[float, Dict[int, Set[int]]]]
+
+    @classmethod
+    def get(
+        cls, max_age: float = 0.1, not_before: Optional[float] = None
+    ) -> Tuple[float, Dict[int, Set[int]]]:
+        """
+        Return the time and result of a scan of all processes.
+
+        :param: max_age the maximum age of a reused scan, in seconds
+        :param: not_before the oldest `time.monotonic()` at which a reused scan may
+            have been made, e.g. the time of the scan the caller last used
+        """
+        now = time.monotonic()
+        if (
+            cls.__scan is None
+            or now - cls.__scan[0] > max_age
+            or (not_before is not None and cls.__scan[0] <= not_before)
+        ):
+            cls.__scan = (now, scan_inodes(psutil.pids()))
+        return cls.__scan
+
+
+class InodeHolderTracker:
+    """
+    Track the processes holding any of a set of stdio inodes.
+
+    The first poll uses the shared system wide scan. As a process can only get
+    the pipes from a process already holding them, later polls only look at
+    the known holders and their descendants. When a holder has exited, its
+    children may have been reparented out of reach, so the next poll uses a
+    system wide scan again.
+    """
+
+    def __init__(self, inodes: Set[int]) -> None:
+        self.__inodes = inodes
+        self.__holders = None  # type: Optional[Set[int]]
+        self.__last_scan = None  # type: Optional[float]
+
+    @property
+    def holders(self) -> Set[int]:
+        """The holders found by the last poll."""
+        return set(self.__holders or ())
+
+    def poll(self) -> Set[int]:
+        """Return the pids currently holding any of the inodes."""
+        if self.__holders is None or not all(psutil.pid_exists(pid) for pid in self.__holders):
+            self.__last_scan, index = InodeIndex.get(not_before=self.__last_scan)
+        else:
+            index = scan_inodes(self.__holders | get_descendants(self.__holders))
+        holders: Set[int] = set()
+        for inode in self.__inodes:
+            holders |= index.get(inode, set())
+        self.__holders = holders
+        return set(holders)
+
+
+def get_pids_with_inodes(inodes: Set[int]) -> Set[int]:
+    """Return the pids of all processes holding any of the given stdio inodes."""
+    return InodeHolderTracker(inodes).poll()
@@ -0,0 +1,116 @@
+"""Module for the JsonLinesWriter class."""
+
+import asyncio
+import json
+import time
+from typing import Any
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Text
+from typing import Tuple
+
+from .shared_instance import shared_instance
+
+
+class JsonLinesWriter:
+    """
+    Batched writer of process output lines as JSON objects, one per line.
+
+    Lines are timestamped with the time their output was received from the
+    process, or else when queued; serialization and the file write happen
+    once per batch, after `flush_interval` seconds or once `max_pending`
+    lines are pending. The file is closed once the last of the processes
+    writing to it removed itself, see `add()`.
+    """
+
+    def __init__(
+        self,
+        path: Text,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        flush_interval: float = 0.1,
+        max_pending: int = 1000,
+    ) -> None:
+        self.__path = path
+        self.__loop = loop
+        self.__flush_interval = flush_interval
+        self.__max_pending = max_pending
+        self.__file = open(path, "a", encoding="utf-8")
+        self.__pending: List[Tuple[Text, Optional[int], Text, float, float, Text]] = []
+        self.__timer = None  # type: Optional[asyncio.TimerHandle]
+        self.__users = set()  # type: Set[Hashable]
+
+    @classmethod
+    def shared(cls, owner: Any, path: Text, loop: asyncio.AbstractEventLoop) -> "JsonLinesWriter":
+        """Return the writer to `path` shared through `owner`, e.g. the launch context."""
+        return shared_instance(
+            owner, (cls, path), lambda: cls(path, loop), renew=lambda writer: writer.closed
+        )
+
+    @property
+    def path(self) -> Text:
+        """Path of the file written to."""
+        return self.__path
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer has been closed."""
+        return self.__file.closed
+
+    def add(self, key: Hashable) -> None:
+        """Keep the file open for `key`, e.g. the action of a process writing to it."""
+        self.__users.add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Close the file if `key` was the last to keep it open."""
+        self.__users.discard(key)
+        if not self.__users:
+            self.close()
+
+    def write(
+        self,
+        name: Text,
+        pid: Optional[int],
+        stream: Text,
+        line: Text,
+        received_at: Optional[Tuple[float, float]] = None,
+    ) -> None:
+        """
+        Queue a line of output of a process.
+
+        :param: received_at the `time.monotonic()` and `time.time()` at which the line
+            was received, defaults to now
+        """
+        monotonic, wall = (time.monotonic(), time.time()) if received_at is None else received_at
+        self.__pending.append((name, pid, stream, monotonic, wall, line))
+        if len(self.__pending) >= self.__max_pending:
+            self.flush()
+        elif self.__timer is None:
+            self.__timer = self.__loop.call_later(self.__flush_interval, self.flush)
+
+    def flush(self) -> None:
+        """Write all queued lines to the file."""
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if not self.__pending or self.__file.closed:
+            return
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        self.__file.write(
+            "".join(
+                '{"name":%s,"pid":%s,"stream":"%s","monotonic":%r,"time":%r,"line":%s}\n'
+                % (encode(name), "null" if pid is None else pid, stream, mono, wall, encode(line))
+                for name, pid, stream, mono, wall, line in self.__pending
+            )
+        )
+        self.__file.flush()
+        self.__pending.clear()
+
+    def close(self) -> None:
+        """Write all queued lines and close the file."""
+        if self.__file.closed:
+            return
+        self.flush()
+        self.__file.close()
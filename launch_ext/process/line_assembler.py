@@ -0,0 +1,70 @@
+"""Module for the LineAssembler class."""
+
+import codecs
+from typing import List
+from typing import Optional
+
+
+class LineAssembler:
+    """
+    Split raw process output into complete, decoded lines.
+
+    Chunks read from a pipe rarely end on a line boundary. The assembler splits
+    each chunk on ``b"\\n"``, keeps only the trailing partial line and decodes
+    all complete lines of a chunk in a single pass. Work per chunk is linear in
+    the size of the chunk, regardless of how long the pending partial line is.
+
+    Bytes are only decoded once a line is complete, so multibyte characters
+    split across reads are decoded correctly and no byte is decoded twice.
+    """
+
+    def __init__(self, encoding: str = "utf-8", errors: str = "replace") -> None:
+        self.__encoding = encoding
+        self.__errors = errors
+        self.__tail = bytearray()
+        self.__decoder = codecs.getincrementaldecoder(encoding)(errors)
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes which do not yet form a complete line."""
+        return len(self.__tail)
+
+    def feed(self, data: bytes) -> List[str]:
+        """Add a chunk of output and return the lines it completed, without newlines."""
+        end = data.rfind(b"\n")
+        if end < 0:
+            self.__tail += data
+            return []
+        if self.__tail:
+            self.__tail += data[:end]
+            complete = bytes(self.__tail)
+            self.__tail.clear()
+        else:
+            complete = data[:end]
+        self.__tail += data[end + 1 :]
+        return complete.decode(self.__encoding, self.__errors).split("\n")
+
+    def drain(self, data: bytes) -> str:
+        """
+        Add a chunk of output and return everything pending, without waiting for a newline.
+
+        Only the bytes of a multibyte character which is not complete yet are
+        kept back, for the next call.
+        """
+        if self.__tail:
+            self.__tail += data
+            data = bytes(self.__tail)
+            self.__tail.clear()
+        text = self.__decoder.decode(data)
+        pending, _ = self.__decoder.getstate()
+        self.__decoder.reset()
+        self.__tail += pending
+        return text
+
+    def flush(self) -> Optional[str]:
+        """Return and clear the pending partial line, or None if there is none."""
+        if not self.__tail:
+            return None
+        line = self.__tail.decode(self.__encoding, self.__errors)
+        self.__tail.clear()
+        return line
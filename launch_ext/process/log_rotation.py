@@ -0,0 +1,142 @@
+"""Module for size based rotation of per-process log files."""
+
+import gzip
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Text
+
+import launch.logging
+
+from .shared_instance import shared_instance
+
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def check_compression(compression: Optional[Text]) -> None:
+    """Raise ValueError if `compression` is not supported, or its module is not installed."""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(
+            f"unsupported compression '{compression}', expected one of"
+            f" {list(COMPRESSION_SUFFIXES)}"
+        )
+    if compression == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            raise ValueError("compression 'zstd' requires the 'zstandard' module")
+
+
+def _compress(path: Text, compression: Optional[Text]) -> Text:
+    """Compress the file at `path`, replacing it, and return the new path."""
+    if compression is None:
+        return path
+    target = path + COMPRESSION_SUFFIXES[compression]
+    with open(path, "rb") as source:
+        if compression == "gzip":
+            with gzip.open(target, "wb") as destination:
+                shutil.copyfileobj(source, destination)
+        else:
+            import zstandard
+
+            with open(target, "wb") as destination:
+                zstandard.ZstdCompressor().copy_stream(source, destination)
+    os.unlink(path)
+    return target
+
+
+def rotate_file(path: Text, backups: int, compression: Optional[Text] = "gzip") -> None:
+    """
+    Rotate the file at `path` into numbered segments, keeping at most `backups` of them.
+
+    The file is copied to `<path>.1` and truncated in place rather than moved,
+    as the process writing to it keeps its file descriptor open. It must be
+    opened with `O_APPEND` for the writes to continue at the start of the file.
+    Output written between the copy and the truncation is lost.
+    """
+    check_compression(compression)
+    suffix = COMPRESSION_SUFFIXES[compression]
+    if backups <= 0:
+        os.truncate(path, 0)
+        return
+    oldest = f"{path}.{backups}{suffix}"
+    if os.path.exists(oldest):
+        os.unlink(oldest)
+    for index in range(backups - 1, 0, -1):
+        segment = f"{path}.{index}{suffix}"
+        if os.path.exists(segment):
+            os.rename(segment, f"{path}.{index + 1}{suffix}")
+    segment = f"{path}.1"
+    with open(path, "rb") as source, open(segment, "wb") as destination:
+        shutil.copyfileobj(source, destination)
+    os.truncate(path, 0)
+    _compress(segment, compression)
+
+
+@dataclass
+class _RotatedFile:
+    max_bytes: int
+    backups: int
+    compression: Optional[Text]
+
+
+class LogFileRotator:
+    """
+    Background thread rotating log files once they grow past their size limit.
+
+    A single thread serves all registered files, so size checks, copies and
+    compression never block the launch event loop. The thread stops once no
+    file is registered anymore.
+    """
+
+    def __init__(self, check_interval: float = 1.0) -> None:
+        self.__check_interval = check_interval
+        self.__files: Dict[Text, _RotatedFile] = {}
+        self.__lock = threading.Lock()
+        self.__thread = None  # type: Optional[threading.Thread]
+        self.__logger = launch.logging.get_logger("launch_ext.log_rotation")
+
+    @classmethod
+    def shared(cls, owner: Any) -> "LogFileRotator":
+        """Return the rotator of `owner`, e.g. the launch context, creating it on first use."""
+        return shared_instance(owner, cls, cls)
+
+    def add(
+        self, path: Text, max_bytes: int, backups: int, compression: Optional[Text] = "gzip"
+    ) -> None:
+        """Start rotating the file at `path` once it is larger than `max_bytes`."""
+        check_compression(compression)
+        with self.__lock:
+            self.__files[path] = _RotatedFile(max_bytes, backups, compression)
+            if self.__thread is None:
+                self.__thread = threading.Thread(
+                    target=self.__run, name="launch_ext log rotation", daemon=True
+                )
+                self.__thread.start()
+
+    def remove(self, path: Text) -> None:
+        """Stop rotating the file at `path`."""
+        with self.__lock:
+            self.__files.pop(path, None)
+
+    def __run(self) -> None:
+        while True:
+            time.sleep(self.__check_interval)
+            with self.__lock:
+                if not self.__files:
+                    self.__thread = None
+                    return
+                files = list(self.__files.items())
+            for path, rotated in files:
+                try:
+                    if os.path.getsize(path) > rotated.max_bytes:
+                        rotate_file(path, rotated.backups, rotated.compression)
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    self.__logger.error(f"failed to rotate '{path}': {e}")
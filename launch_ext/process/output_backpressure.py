@@ -0,0 +1,124 @@
+"""Module for the OutputBackpressure class."""
+
+import asyncio
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Text
+
+
+class OutputBackpressure:
+    """
+    Bounds the output of a process which was read from its pipes, but not handled yet.
+
+    The output is counted as `received()` when read from the pipes, and as
+    `handled()` once the event handlers are done with it. Once more than
+    `high_water` bytes are pending, either:
+
+    - 'block': reading from the pipes of the process is paused, so the process
+      blocks on its writes once the pipes are full, or
+    - 'drop': the output is dropped, and counted in `dropped_bytes`,
+
+    until the pending output goes back down to `low_water` bytes.
+    """
+
+    POLICIES = ("block", "drop")
+
+    def __init__(
+        self,
+        high_water: int,
+        low_water: Optional[int] = None,
+        *,
+        policy: Text = "block",
+        on_resume: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Create an OutputBackpressure.
+
+        :param: high_water the pending output, in bytes, from which the policy applies
+        :param: low_water the pending output, in bytes, from which output is read
+            again, defaults to half of `high_water`
+        :param: policy 'block' or 'drop'
+        :param: on_resume called when the pending output goes back down to `low_water`
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"unsupported policy '{policy}', expected one of {self.POLICIES}")
+        if low_water is None:
+            low_water = high_water // 2
+        if not 0 <= low_water < high_water:
+            raise ValueError(
+                f"invalid water marks: expected 0 <= low_water ({low_water}) "
+                f"< high_water ({high_water})"
+            )
+        self.__high_water = high_water
+        self.__low_water = low_water
+        self.__policy = policy
+        self.__on_resume = on_resume
+        self.__pending_bytes = 0
+        self.__engaged = False
+        self.__pipes = []  # type: List[asyncio.ReadTransport]
+        self.pause_count = 0
+        self.dropped_bytes = 0
+        self.dropped_reads = 0
+
+    @property
+    def policy(self) -> Text:
+        """Getter for policy."""
+        return self.__policy
+
+    @property
+    def pending_bytes(self) -> int:
+        """Output received and not handled yet."""
+        return self.__pending_bytes
+
+    @property
+    def engaged(self) -> bool:
+        """Whether reading is paused, or output is dropped."""
+        return self.__engaged
+
+    def attach(self, pipe: asyncio.ReadTransport) -> None:
+        """Pause and resume reading from `pipe`, paused already if the policy is engaged."""
+        self.__pipes.append(pipe)
+        if self.__engaged and self.__policy == "block":
+            pipe.pause_reading()
+
+    def detach(self, pipe: asyncio.ReadTransport) -> None:
+        """Stop pausing and resuming reading from `pipe`, resuming it if it is paused."""
+        if pipe not in self.__pipes:
+            return
+        self.__pipes.remove(pipe)
+        # a pipe left paused would never be read to its end, nor closed
+        if self.__engaged and self.__policy == "block" and not pipe.is_closing():
+            pipe.resume_reading()
+
+    def received(self, size: int) -> bool:
+        """
+        Count `size` bytes of output read from a pipe.
+
+        :return: whether to keep the output, or else drop it
+        """
+        if self.__engaged and self.__policy == "drop":
+            self.dropped_bytes += size
+            self.dropped_reads += 1
+            return False
+        self.__pending_bytes += size
+        if not self.__engaged and self.__pending_bytes > self.__high_water:
+            self.__engaged = True
+            self.pause_count += 1
+            if self.__policy == "block":
+                for pipe in self.__pipes:
+                    if not pipe.is_closing():
+                        pipe.pause_reading()
+        return True
+
+    def handled(self, size: int) -> None:
+        """Count `size` bytes of received output as handled."""
+        self.__pending_bytes = max(self.__pending_bytes - size, 0)
+        if self.__engaged and self.__pending_bytes <= self.__low_water:
+            self.__engaged = False
+            if self.__policy == "block":
+                for pipe in self.__pipes:
+                    if not pipe.is_closing():
+                        pipe.resume_reading()
+            if self.__on_resume is not None:
+                self.__on_resume()
@@ -0,0 +1,252 @@
+"""Module for the caches backing `cached_output` of ExecuteLocalExt."""
+
+import collections
+import contextlib
+import mmap
+import os
+from typing import Deque
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+
+class OutputCache:
+    """
+    Base class for the storage of the output of a process.
+
+    Raw bytes are written as they are read from the process and only decoded
+    when the cache is read.
+    """
+
+    def write(self, data: bytes) -> None:
+        """Append raw output to the cache."""
+        raise NotImplementedError()
+
+    def getvalue(self) -> str:
+        """Return all cached output."""
+        raise NotImplementedError()
+
+    def tail(self, line_count: int) -> List[str]:
+        """Return up to the last `line_count` lines, without newlines."""
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """Release any resources held by the cache."""
+
+
+class MemoryOutputCache(OutputCache):
+    """Unbounded in-memory cache, keeping the whole output of the process."""
+
+    def __init__(self) -> None:
+        self.__buffer = bytearray()
+
+    def write(self, data: bytes) -> None:
+        self.__buffer += data
+
+    def getvalue(self) -> str:
+        return self.__buffer.decode(errors="replace")
+
+    def tail(self, line_count: int) -> List[str]:
+        return _tail_lines(self.__buffer, line_count)
+
+
+class RingOutputCache(OutputCache):
+    """
+    Bounded in-memory cache, keeping only the most recent output of the process.
+
+    Complete lines are stored in a deque, so appending a line and evicting the
+    oldest one are both O(1) and the last lines can be read without touching
+    the rest of the cache.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, max_lines: Optional[int] = None) -> None:
+        if max_bytes is None and max_lines is None:
+            raise ValueError("RingOutputCache needs at least one of max_bytes or max_lines")
+        if (max_bytes is not None and max_bytes <= 0) or (
+            max_lines is not None and max_lines <= 0
+        ):
+            raise ValueError("RingOutputCache limits must be positive")
+        self.__max_bytes = max_bytes
+        self.__max_lines = max_lines
+        self.__lines: Deque[bytes] = collections.deque()
+        self.__partial = bytearray()
+        self.__size = 0
+
+    @property
+    def size(self) -> int:
+        """Number of bytes currently held by the cache."""
+        return self.__size + len(self.__partial)
+
+    def write(self, data: bytes) -> None:
+        *complete, partial = data.split(b"\n")
+        for part in complete:
+            if self.__partial:
+                self.__partial += part
+                self.__partial += b"\n"
+                line = bytes(self.__partial)
+                self.__partial.clear()
+            else:
+                line = part + b"\n"
+            self.__append(line)
+        self.__partial += partial
+        if self.__max_bytes is not None and len(self.__partial) > self.__max_bytes:
+            # a line longer than the whole cache, only keep its end
+            del self.__partial[: len(self.__partial) - self.__max_bytes]
+        self.__evict()
+
+    def __append(self, line: bytes) -> None:
+        if self.__max_bytes is not None and len(line) > self.__max_bytes:
+            line = line[len(line) - self.__max_bytes :]
+        self.__lines.append(line)
+        self.__size += len(line)
+
+    def __evict(self) -> None:
+        lines = self.__lines
+        if self.__max_lines is not None:
+            # the partial line counts as a line, as it is returned by tail()
+            max_lines = self.__max_lines - (1 if self.__partial else 0)
+            while len(lines) > max_lines:
+                self.__size -= len(lines.popleft())
+        if self.__max_bytes is not None:
+            while lines and self.__size + len(self.__partial) > self.__max_bytes:
+                self.__size -= len(lines.popleft())
+
+    def getvalue(self) -> str:
+        return (b"".join(self.__lines) + self.__partial).decode(errors="replace")
+
+    def tail(self, line_count: int) -> List[str]:
+        if line_count <= 0:
+            return []
+        result = []
+        if self.__partial:
+            result.append(self.__partial.decode(errors="replace"))
+        for line in reversed(self.__lines):
+            if len(result) >= line_count:
+                break
+            result.append(line[:-1].decode(errors="replace"))
+        result.reverse()
+        return result
+
+
+def _tail_lines(buffer, line_count: int) -> List[str]:
+    """Return the last `line_count` lines of a bytes-like buffer, without newlines."""
+    if line_count <= 0 or not buffer:
+        return []
+    end = len(buffer)
+    if buffer[end - 1] == ord("\n"):
+        end -= 1
+    start = end
+    for _ in range(line_count):
+        start = buffer.rfind(b"\n", 0, start)
+        if start < 0:
+            break
+    return bytes(buffer[start + 1 : end]).decode(errors="replace").split("\n")
+
+
+class MmapOutputCache(OutputCache):
+    """
+    Cache which appends the output of a process to a file and reads it back through `mmap`.
+
+    The output is never held in the memory of the launch process, so its
+    resident size stays flat however much a process prints. Use `slice()` and
+    `iter_lines()` to read parts of the output without decoding all of it.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.__path = path
+        self.__fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        self.__size = 0
+        self.__map = None  # type: Optional[mmap.mmap]
+
+    @property
+    def path(self) -> str:
+        """Path of the file backing the cache."""
+        return self.__path
+
+    @property
+    def size(self) -> int:
+        """Number of bytes written to the cache."""
+        return self.__size
+
+    def write(self, data: bytes) -> None:
+        # output read after close() is still appended, opening the file for the write only
+        fd = self.__fd
+        if fd < 0:
+            fd = os.open(self.__path, os.O_WRONLY | os.O_APPEND | os.O_CLOEXEC)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            if fd != self.__fd:
+                os.close(fd)
+        self.__size += len(data)
+
+    def __mapped(self):
+        if self.__size == 0:
+            return b""
+        if self.__map is None or len(self.__map) != self.__size:
+            if self.__map is not None:
+                self.__map.close()
+            self.__map = mmap.mmap(self.__fd, self.__size, access=mmap.ACCESS_READ)
+        return self.__map
+
+    @contextlib.contextmanager
+    def __own_map(self):
+        """Map the file for the caller only, so that it is not closed by a later remap."""
+        if self.__size == 0:
+            yield b""
+            return
+        # once closed, the file is opened again for as long as it is read
+        fd = self.__fd
+        if fd < 0:
+            fd = os.open(self.__path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            mapped = mmap.mmap(fd, self.__size, access=mmap.ACCESS_READ)
+        finally:
+            if fd != self.__fd:
+                os.close(fd)
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+    def slice(self, start: int = 0, stop: Optional[int] = None) -> bytes:
+        """Return the raw bytes of the cached output between `start` and `stop`."""
+        if self.__fd < 0:
+            with self.__own_map() as mapped:
+                return mapped[start:stop]
+        return self.__mapped()[start:stop]
+
+    def iter_lines(self, start: int = 0) -> Iterator[bytes]:
+        """
+        Iterate over the raw lines of the cached output, including the newlines.
+
+        Output written while iterating is not included.
+        """
+        with self.__own_map() as mapped:
+            size = len(mapped)
+            while start < size:
+                end = mapped.find(b"\n", start)
+                end = size if end < 0 else end + 1
+                yield mapped[start:end]
+                start = end
+
+    def getvalue(self) -> str:
+        return self.slice().decode(errors="replace")
+
+    def tail(self, line_count: int) -> List[str]:
+        if self.__fd < 0:
+            with self.__own_map() as mapped:
+                return _tail_lines(mapped, line_count)
+        return _tail_lines(self.__mapped(), line_count)
+
+    def close(self) -> None:
+        """Release the file descriptor and the mapping, the file is opened again on use."""
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
@@ -0,0 +1,67 @@
+"""Module for the OutputCoalescer class."""
+
+import asyncio
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+
+
+class OutputCoalescer:
+    """
+    Merge consecutive pipe reads of a process into fewer, larger chunks.
+
+    Data is held until either `max_latency` seconds have passed since the first
+    pending read or `max_bytes` are pending, whichever comes first, and is then
+    handed to `emit` as a single chunk.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[bytes], None],
+        loop: asyncio.AbstractEventLoop,
+        *,
+        max_latency: float,
+        max_bytes: int = 65536,
+    ) -> None:
+        if max_latency < 0.0:
+            raise ValueError(f"max_latency must be non-negative, got {max_latency}")
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.__emit = emit
+        self.__loop = loop
+        self.__max_latency = max_latency
+        self.__max_bytes = max_bytes
+        self.__pending = bytearray()
+        self.__timer = None  # type: Optional[asyncio.TimerHandle]
+        self.reads_received = 0
+        self.chunks_emitted = 0
+        # (time.monotonic(), time.time()) given with the last read, i.e. when the pending
+        # data was complete, so that `emit` can tell when it was received
+        self.received_at = None  # type: Optional[Tuple[float, float]]
+
+    @property
+    def reads_merged(self) -> int:
+        """Number of reads which did not need an event of their own."""
+        return self.reads_received - self.chunks_emitted - (1 if self.__pending else 0)
+
+    def feed(self, data: bytes, received_at: Optional[Tuple[float, float]] = None) -> None:
+        """Add the data of one pipe read, received at the given times if known."""
+        self.reads_received += 1
+        self.received_at = received_at
+        self.__pending += data
+        if len(self.__pending) >= self.__max_bytes:
+            self.flush()
+        elif self.__timer is None:
+            self.__timer = self.__loop.call_later(self.__max_latency, self.flush)
+
+    def flush(self) -> None:
+        """Emit the pending data now, if any."""
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if not self.__pending:
+            return
+        data = bytes(self.__pending)
+        self.__pending.clear()
+        self.chunks_emitted += 1
+        self.__emit(data)
@@ -0,0 +1,64 @@
+"""Module for compiling the output_format of process actions."""
+
+import re
+import string
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+_formatter = string.Formatter()
+_FIELD_ROOT_REGEX = re.compile(r"[^.\[]*")
+
+
+def compile_output_format(
+    output_format: str, line_field: str = "line", **fields: Any
+) -> Callable[[str], str]:
+    """
+    Compile a `str.format()` style format string into a renderer for output lines.
+
+    All fields other than `line_field` are resolved once, against the keyword
+    arguments given here, so that rendering a line only has to fill in the line
+    itself. Fields that read from the line, e.g. ``{line.upper}``, fall back to
+    a regular `str.format()` per line.
+
+    :param: output_format the format string, e.g. ``"[{this.name}] {line}"``
+    :param: line_field the name of the field receiving each line
+    :param: fields the values of all other fields, e.g. ``this=action``
+    :returns: a callable rendering a line with the format string
+    """
+    # literal text preceding each line field, as (text, conversion, spec)
+    segments: List[Tuple[str, Optional[str], str]] = []
+    text = ""
+    for literal, field_name, spec, conversion in _formatter.parse(output_format):
+        text += literal
+        if field_name is None:
+            continue
+        spec = _formatter.vformat(spec, (), fields)
+        if field_name == line_field:
+            segments.append((text, conversion, spec))
+            text = ""
+        elif _FIELD_ROOT_REGEX.match(field_name).group() == line_field:
+            return lambda line: output_format.format(**{line_field: line}, **fields)
+        else:
+            value, _ = _formatter.get_field(field_name, (), fields)
+            text += _formatter.format_field(_formatter.convert_field(value, conversion), spec)
+    suffix = text
+
+    if not segments:
+        return lambda line: suffix
+    if len(segments) == 1 and segments[0][1:] == (None, ""):
+        prefix = segments[0][0]
+        return lambda line: prefix + line + suffix
+
+    def render(line: str) -> str:
+        return (
+            "".join(
+                prefix + _formatter.format_field(_formatter.convert_field(line, conversion), spec)
+                for prefix, conversion, spec in segments
+            )
+            + suffix
+        )
+
+    return render
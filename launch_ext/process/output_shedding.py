@@ -0,0 +1,133 @@
+"""Module for the OutputSheddingFilter class."""
+
+import logging
+import time
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Text
+
+from .shared_instance import shared_instance
+
+
+class _Bucket:
+    __slots__ = ("rate", "label", "tokens", "last", "dropped", "total_dropped")
+
+    def __init__(self, rate: float, label: Text, now: float) -> None:
+        self.rate = rate
+        self.label = label
+        # up to a second worth of lines may go through at once
+        self.tokens = max(rate, 1.0)
+        self.last = now
+        self.dropped = 0
+        self.total_dropped = 0
+
+    def take(self, now: float) -> bool:
+        self.tokens = min(self.tokens + (now - self.last) * self.rate, max(self.rate, 1.0))
+        self.last = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class OutputSheddingFilter(logging.Filter):
+    """
+    Rate limits the records of some loggers going through one handler, e.g. the screen.
+
+    Only that handler sheds records, the other handlers of the same loggers,
+    e.g. log files, still get all of them. Records of loggers which are not
+    limited always go through. Once records of a logger were dropped, a summary
+    of how many is handed to the handler before the next record that goes
+    through, or on `flush()`.
+    """
+
+    SUMMARY_ATTRIBUTE = "launch_ext_shedding_summary"
+
+    def __init__(
+        self, handler: logging.Handler, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Create an OutputSheddingFilter, and add it to `handler`.
+
+        :param: handler the handler to shed records from
+        :param: clock the time source, in seconds
+        """
+        super().__init__()
+        self.__handler = handler
+        self.__clock = clock
+        self.__buckets = {}  # type: Dict[Text, _Bucket]
+        handler.addFilter(self)
+
+    @classmethod
+    def shared(cls, handler: logging.Handler) -> "OutputSheddingFilter":
+        """Return the filter of `handler`, creating it on first use."""
+        return shared_instance(handler, cls, lambda: cls(handler))
+
+    def limit(
+        self, logger_name: Text, lines_per_second: float, label: Optional[Text] = None
+    ) -> None:
+        """
+        Let at most `lines_per_second` records of the logger `logger_name` through.
+
+        :param: logger_name the name of the logger
+        :param: lines_per_second the sustained rate, a second worth of records may go
+            through at once
+        :param: label how the summaries name the logger, defaults to its name
+        """
+        if lines_per_second <= 0:
+            raise ValueError(f"invalid lines_per_second {lines_per_second}, expected > 0")
+        self.__buckets[logger_name] = _Bucket(
+            lines_per_second, label or logger_name, self.__clock()
+        )
+
+    def unlimit(self, logger_name: Text) -> int:
+        """
+        Let all the records of the logger `logger_name` through again.
+
+        :return: how many records of the logger were dropped in total
+        """
+        self.flush(logger_name)
+        bucket = self.__buckets.pop(logger_name, None)
+        return bucket.total_dropped if bucket is not None else 0
+
+    def dropped(self, logger_name: Text) -> int:
+        """Return how many records of the logger `logger_name` were dropped so far."""
+        bucket = self.__buckets.get(logger_name)
+        return bucket.total_dropped if bucket is not None else 0
+
+    def flush(self, logger_name: Optional[Text] = None) -> None:
+        """Hand the pending summaries, of one logger or all of them, to the handler."""
+        names = [logger_name] if logger_name is not None else list(self.__buckets)
+        for name in names:
+            bucket = self.__buckets.get(name)
+            if bucket is not None and bucket.dropped:
+                self.__summarize(name, bucket)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, self.SUMMARY_ATTRIBUTE, False):
+            return True
+        bucket = self.__buckets.get(record.name)
+        if bucket is None:
+            return True
+        if not bucket.take(self.__clock()):
+            bucket.dropped += 1
+            bucket.total_dropped += 1
+            return False
+        if bucket.dropped:
+            self.__summarize(record.name, bucket)
+        return True
+
+    def __summarize(self, name: Text, bucket: _Bucket) -> None:
+        dropped, bucket.dropped = bucket.dropped, 0
+        record = logging.getLogger(name).makeRecord(
+            name,
+            logging.WARNING,
+            __file__,
+            0,
+            "[%s] dropped %d lines from the screen, over %s lines/s",
+            (bucket.label, dropped, "{:g}".format(bucket.rate)),
+            None,
+        )
+        setattr(record, self.SUMMARY_ATTRIBUTE, True)
+        self.__handler.handle(record)
@@ -0,0 +1,61 @@
+"""Module for waiting on process exits through pidfds."""
+
+import asyncio
+import functools
+import os
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=None)
+def pidfd_supported() -> bool:
+    """Return True if pidfds can be opened on this system (Linux 5.3 and Python 3.9)."""
+    if not hasattr(os, "pidfd_open"):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False
+    return True
+
+
+async def wait_for_any_exit(
+    pids: Iterable[int],
+    loop: asyncio.AbstractEventLoop,
+    fallback_period: float = 0.25,
+    timeout: Optional[float] = None,
+) -> None:
+    """
+    Wait until any of the processes `pids` has exited, or for at most `timeout` seconds.
+
+    Each process gets a pidfd registered with the event loop, which becomes
+    readable as soon as the process exits, so no polling is involved. Where
+    pidfds are not available, this waits for `fallback_period` seconds instead
+    and the caller is expected to check again.
+    """
+    if not pidfd_supported():
+        await asyncio.sleep(fallback_period)
+        return
+
+    future = loop.create_future()
+    pidfds: List[int] = []
+    try:
+        for pid in pids:
+            try:
+                pidfd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                # already gone
+                return
+            pidfds.append(pidfd)
+            loop.add_reader(pidfd, lambda: future.done() or future.set_result(None))
+        if not pidfds:
+            return
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+    finally:
+        for pidfd in pidfds:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
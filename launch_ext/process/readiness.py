@@ -0,0 +1,186 @@
+"""Module for the probes telling when a launched process is ready."""
+
+import asyncio
+import os
+import re
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Pattern
+from typing import Text
+from typing import Tuple
+from typing import Union
+
+
+class ReadinessProbe:
+    """
+    Base class of the probes telling when a process is ready.
+
+    A probe is a reusable description, `wait()` is called again for each new
+    process, e.g. after a respawn. `expect()` is called before the output of
+    the process is handled, and `forget()` once the process exited.
+    """
+
+    def describe(self) -> Text:
+        """Return a short description of what the probe waits for."""
+        raise NotImplementedError
+
+    @property
+    def watches_output(self) -> bool:
+        """Whether the probe needs the output lines of the process, see `on_output()`."""
+        return False
+
+    def on_output(self, pid: int, stream: Text, line: Text) -> None:
+        """Handle a line of output of the process `pid`, from the stream 'stdout' or 'stderr'."""
+
+    def expect(self, pid: int) -> None:
+        """Start watching the process `pid`, before any of its output is handled."""
+
+    def forget(self, pid: int) -> None:
+        """Stop watching the process `pid`, e.g. once it exited."""
+
+    async def wait(self, pid: int) -> None:
+        """Wait until the process `pid` is ready."""
+        raise NotImplementedError
+
+
+class OutputProbe(ReadinessProbe):
+    """Ready once a line of output matches a regular expression."""
+
+    def __init__(self, pattern: Union[Text, Pattern], stream: Optional[Text] = None) -> None:
+        """
+        Create an OutputProbe.
+
+        :param: pattern the regular expression searched in each line
+        :param: stream 'stdout' or 'stderr' to only search that stream, both by default
+        """
+        if stream not in (None, "stdout", "stderr"):
+            raise ValueError(f"invalid stream '{stream}', expected 'stdout' or 'stderr'")
+        self.__pattern = re.compile(pattern)
+        self.__stream = stream
+        # the waits in progress, by pid, as the probe may be shared by several processes
+        self.__matched = {}  # type: Dict[int, asyncio.Event]
+
+    def describe(self) -> Text:
+        return "output matching '{}'".format(self.__pattern.pattern)
+
+    @property
+    def watches_output(self) -> bool:
+        return bool(self.__matched)
+
+    def on_output(self, pid: int, stream: Text, line: Text) -> None:
+        if self.__stream not in (None, stream):
+            return
+        matched = self.__matched.get(pid)
+        if matched is not None and self.__pattern.search(line):
+            matched.set()
+
+    def expect(self, pid: int) -> None:
+        # lines handled before `wait()` runs, e.g. the very first one, are matched too
+        self.__matched.setdefault(pid, asyncio.Event())
+
+    def forget(self, pid: int) -> None:
+        self.__matched.pop(pid, None)
+
+    async def wait(self, pid: int) -> None:
+        matched = self.__matched.setdefault(pid, asyncio.Event())
+        try:
+            await matched.wait()
+        finally:
+            if self.__matched.get(pid) is matched:
+                del self.__matched[pid]
+
+
+class _PollingProbe(ReadinessProbe):
+    def __init__(self, period: float) -> None:
+        self.__period = period
+
+    def check(self) -> bool:
+        raise NotImplementedError
+
+    async def wait(self, pid: int) -> None:
+        while not await self.async_check():
+            await asyncio.sleep(self.__period)
+
+    async def async_check(self) -> bool:
+        return self.check()
+
+
+class SocketProbe(_PollingProbe):
+    """Ready once a TCP or Unix socket accepts connections."""
+
+    def __init__(
+        self, address: Union[Text, Tuple[Text, int]], *, period: float = 0.1, timeout: float = 1.0
+    ) -> None:
+        """
+        Create a SocketProbe.
+
+        :param: address a (host, port) tuple or 'host:port' for TCP, or the path of a
+            Unix socket
+        :param: period the time between connection attempts, in seconds
+        :param: timeout the timeout of each connection attempt, in seconds
+        """
+        super().__init__(period)
+        if isinstance(address, str) and not address.startswith(("/", ".")):
+            host, _, port = address.rpartition(":")
+            address = (host.strip("[]") or "localhost", int(port))
+        self.__address = address
+        self.__timeout = timeout
+
+    def describe(self) -> Text:
+        if isinstance(self.__address, tuple):
+            return "TCP connection to {}:{}".format(*self.__address)
+        return f"connection to Unix socket '{self.__address}'"
+
+    async def async_check(self) -> bool:
+        if isinstance(self.__address, tuple):
+            connection = asyncio.open_connection(*self.__address)
+        else:
+            connection = asyncio.open_unix_connection(self.__address)
+        try:
+            _, writer = await asyncio.wait_for(connection, self.__timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
+
+
+class FileProbe(_PollingProbe):
+    """Ready once a file exists."""
+
+    def __init__(self, path: Text, *, period: float = 0.1) -> None:
+        """
+        Create a FileProbe.
+
+        :param: path the path of the file
+        :param: period the time between checks, in seconds
+        """
+        super().__init__(period)
+        self.__path = path
+
+    def describe(self) -> Text:
+        return f"file '{self.__path}'"
+
+    def check(self) -> bool:
+        return os.path.exists(self.__path)
+
+
+class CoroutineProbe(ReadinessProbe):
+    """Ready once a coroutine, given the pid of the process, returns."""
+
+    def __init__(self, function: Callable[[int], Awaitable[Any]]) -> None:
+        """
+        Create a CoroutineProbe.
+
+        :param: function an async function taking the pid of the process, returning
+            once the process is ready
+        """
+        self.__function = function
+
+    def describe(self) -> Text:
+        return "coroutine {}".format(getattr(self.__function, "__qualname__", self.__function))
+
+    async def wait(self, pid: int) -> None:
+        await self.__function(pid)
@@ -0,0 +1,102 @@
+"""Module for parsing and applying resource limits of launched processes."""
+
+from types import ModuleType
+from typing import Callable
+from typing import Text
+from typing import Tuple
+
+_SIZE_SUFFIXES = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def _resource() -> ModuleType:
+    """Import the resource module, only when rlimits are used, it is missing on Windows."""
+    try:
+        import resource
+    except ImportError:
+        raise ValueError("rlimits are not supported on this platform")
+    if not hasattr(resource, "prlimit"):
+        raise ValueError("rlimits need prlimit(), which is only available on Linux")
+    return resource
+
+
+def parse_size(value: Text) -> int:
+    """Parse a size in bytes, with an optional K, M, G or T binary suffix, e.g. '512M'."""
+    text = value.strip().upper()
+    if text.endswith("B"):
+        text = text[:-1]
+    number, suffix = (text[:-1], text[-1]) if text[-1:] in _SIZE_SUFFIXES else (text, "")
+    try:
+        size = int(float(number) * _SIZE_SUFFIXES[suffix])
+    except ValueError:
+        raise ValueError(f"invalid size '{value}', expected e.g. '1048576', '512M' or '2G'")
+    if size < 0:
+        raise ValueError(f"invalid size '{value}', expected a non-negative value")
+    return size
+
+
+def parse_cpu_quota(value: Text, period: int = 100000) -> Text:
+    """
+    Return the `cpu.max` content for a quota given as a number of CPUs, e.g. '1.5'.
+
+    :param: value the number of CPUs worth of time the processes may use, or 'max'
+    :param: period the period the quota is enforced over, in microseconds
+    """
+    if value.strip() == "max":
+        return f"max {period}"
+    try:
+        cpus = float(value)
+    except ValueError:
+        raise ValueError(f"invalid cpu_quota '{value}', expected a number of CPUs, e.g. '0.5'")
+    if cpus <= 0:
+        raise ValueError(f"invalid cpu_quota '{value}', expected a positive number of CPUs")
+    # the kernel refuses quotas below 1ms
+    return f"{max(int(cpus * period), 1000)} {period}"
+
+
+def parse_io_weight(value: Text) -> int:
+    """Parse an `io.weight`, between 1 and 10000."""
+    try:
+        weight = int(value)
+    except ValueError:
+        weight = 0
+    if not 1 <= weight <= 10000:
+        raise ValueError(f"invalid io_weight '{value}', expected an integer from 1 to 10000")
+    return weight
+
+
+def parse_rlimit(name: Text, value: Text) -> Tuple[int, Tuple[int, int]]:
+    """
+    Parse a resource limit, e.g. ('nofile', '4096') or ('core', 'unlimited').
+
+    The value sets both the soft and hard limits, unless given as 'soft:hard'.
+    Sizes accept the suffixes of :func:`parse_size`.
+
+    :return: the `resource.RLIMIT_*` constant and the (soft, hard) limits
+    """
+    resource = _resource()
+    resource_id = getattr(resource, "RLIMIT_" + name.strip().upper(), None)
+    if resource_id is None:
+        raise ValueError(f"unknown rlimit '{name}', expected e.g. 'nofile', 'core' or 'memlock'")
+
+    def parse_limit(limit: Text) -> int:
+        if limit.strip() in ("unlimited", "infinity"):
+            return resource.RLIM_INFINITY
+        return parse_size(limit)
+
+    soft_text, _, hard_text = value.partition(":")
+    soft, hard = parse_limit(soft_text), parse_limit(hard_text or soft_text)
+    # RLIM_INFINITY is -1 on Linux, it is above any other limit
+    if hard != resource.RLIM_INFINITY and (soft == resource.RLIM_INFINITY or soft > hard):
+        raise ValueError(f"invalid rlimit {name}='{value}', the soft limit is above the hard one")
+    return resource_id, (soft, hard)
+
+
+def rlimit_setter(resource_id: int, limits: Tuple[int, int]) -> Callable[[int], None]:
+    """Return a setup step applying a limit to a process, given its pid or 0 for itself."""
+    resource = _resource()
+    return lambda pid: resource.prlimit(pid, resource_id, limits)
+
+
+def get_rlimit(pid: int, resource_id: int) -> Tuple[int, int]:
+    """Return the (soft, hard) limits of the process `pid`."""
+    return _resource().prlimit(pid, resource_id)
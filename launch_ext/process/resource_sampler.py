@@ -0,0 +1,274 @@
+"""Module for sampling the resource usage of processes from /proc."""
+
+import asyncio
+import csv
+import os
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import NamedTuple
+from typing import Optional
+from typing import Text
+from typing import TextIO
+from typing import Tuple
+
+from .inode_tracker import get_descendants
+from .shared_instance import shared_instance
+
+
+class ResourceSample(NamedTuple):
+    """Resource usage of a process and its descendants."""
+
+    # time.monotonic() at which the sample was taken
+    monotonic: float
+    # number of processes sampled
+    num_processes: int
+    # CPU time used since the previous sample, as a percentage of one CPU
+    cpu_percent: float
+    # resident set size, in bytes
+    rss: int
+    # bytes read from and written to storage by the live processes
+    read_bytes: int
+    write_bytes: int
+
+
+def check_resource_sampling() -> None:
+    """Raise ValueError if processes can't be sampled on this platform, which needs /proc."""
+    if not hasattr(os, "sysconf") or not os.path.isdir("/proc/self"):
+        raise ValueError("resource sampling is only supported on Linux, it reads /proc")
+
+
+def read_process_stats(pid: int) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Return the CPU ticks, resident pages, read bytes and written bytes of a process.
+
+    Returns None if the process is gone. The IO counters are 0 when /proc/<pid>/io
+    can't be read.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        with open(f"/proc/{pid}/statm", "rb") as f:
+            statm = f.read()
+    except (FileNotFoundError, ProcessLookupError):
+        return None
+    # the command name may contain spaces and parentheses, the fields follow the last ')'
+    fields = stat[stat.rindex(b")") + 2 :].split()
+    ticks = int(fields[11]) + int(fields[12])
+    pages = int(statm.split()[1])
+    read_bytes = write_bytes = 0
+    try:
+        with open(f"/proc/{pid}/io", "rb") as f:
+            for line in f:
+                key, _, value = line.partition(b":")
+                if key == b"read_bytes":
+                    read_bytes = int(value)
+                elif key == b"write_bytes":
+                    write_bytes = int(value)
+    except (FileNotFoundError, PermissionError, ProcessLookupError):
+        pass
+    return ticks, pages, read_bytes, write_bytes
+
+
+ProcessStatsReader = Callable[[int], Optional[Tuple[int, int, int, int]]]
+
+
+class _Subscription:
+    def __init__(
+        self,
+        name: Text,
+        pid: int,
+        get_pids: Callable[[], Iterable[int]],
+        interval: float,
+        callback: Callable[[ResourceSample], None],
+        read_stats: ProcessStatsReader,
+        now: float,
+        clock_ticks: int,
+        page_size: int,
+    ) -> None:
+        self.name = name
+        self.pid = pid
+        self.get_pids = get_pids
+        self.interval = interval
+        self.callback = callback
+        self.read_stats = read_stats
+        self.clock_ticks = clock_ticks
+        self.page_size = page_size
+        self.due = now + interval
+        self.last_time = now
+        # only a baseline, the ticks the processes used before are not part of any sample
+        self.last_ticks = {}  # type: Dict[int, int]
+        for pid in get_pids():
+            stats = read_stats(pid)
+            if stats is not None:
+                self.last_ticks[pid] = stats[0]
+
+    def sample(self, now: float) -> ResourceSample:
+        num_processes = rss = read_bytes = write_bytes = used_ticks = 0
+        ticks_by_pid = {}
+        for pid in self.get_pids():
+            stats = self.read_stats(pid)
+            if stats is None:
+                continue
+            ticks, pages, read, written = stats
+            ticks_by_pid[pid] = ticks
+            # the ticks of processes which exited since the last sample are lost
+            used_ticks += max(ticks - self.last_ticks.get(pid, 0), 0)
+            num_processes += 1
+            rss += pages
+            read_bytes += read
+            write_bytes += written
+        elapsed = now - self.last_time
+        cpu_percent = 100.0 * used_ticks / self.clock_ticks / elapsed if elapsed > 0 else 0.0
+        self.last_time = now
+        self.last_ticks = ticks_by_pid
+        self.due = now + self.interval
+        return ResourceSample(
+            now, num_processes, cpu_percent, rss * self.page_size, read_bytes, write_bytes
+        )
+
+
+class ResourceSampler:
+    """
+    Single task sampling the resource usage of all subscribed processes.
+
+    Each subscription is sampled at its own interval, the task only wakes up when
+    the next one is due. Samples taken together are appended to the metrics file,
+    if any, in a single write. The metrics file is open while any process is
+    subscribed.
+    """
+
+    METRICS_FIELDS = (
+        "monotonic",
+        "name",
+        "pid",
+        "num_processes",
+        "cpu_percent",
+        "rss",
+        "read_bytes",
+        "write_bytes",
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        metrics_path: Optional[Text] = None,
+        *,
+        read_stats: ProcessStatsReader = read_process_stats,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Create a ResourceSampler.
+
+        :param: loop the event loop the sampling task runs on
+        :param: metrics_path the CSV file the samples are appended to, if any
+        :param: read_stats reads the stats of a process, see `read_process_stats()`
+        :param: clock the time source, in seconds
+        """
+        self.__loop = loop
+        self.__read_stats = read_stats
+        self.__clock = clock
+        self.__clock_ticks = os.sysconf("SC_CLK_TCK")
+        self.__page_size = os.sysconf("SC_PAGE_SIZE")
+        self.__subscriptions = {}  # type: Dict[Hashable, _Subscription]
+        self.__wakeup = asyncio.Event()
+        self.__task = None  # type: Optional[asyncio.Task]
+        self.__metrics_path = metrics_path
+        self.__metrics_file = None  # type: Optional[TextIO]
+        self.__metrics_writer = None  # type: Any
+
+    @classmethod
+    def shared(
+        cls, owner: Any, loop: asyncio.AbstractEventLoop, metrics_path: Optional[Text] = None
+    ) -> "ResourceSampler":
+        """Return the sampler of `owner`, e.g. the launch context, creating it on first use."""
+        return shared_instance(owner, cls, lambda: cls(loop, metrics_path))
+
+    def add(
+        self,
+        key: Hashable,
+        name: Text,
+        pid: int,
+        interval: float,
+        callback: Callable[[ResourceSample], None],
+        get_pids: Optional[Callable[[], Iterable[int]]] = None,
+    ) -> None:
+        """
+        Sample a process every `interval` seconds, replacing any subscription for `key`.
+
+        :param: key identifies the subscription, e.g. the action running the process
+        :param: name the name of the process in the metrics file
+        :param: pid the process, sampled along with its descendants
+        :param: interval the sampling period, in seconds
+        :param: callback called with each sample
+        :param: get_pids returns the pids to sample, instead of `pid` and its descendants
+        """
+        if get_pids is None:
+            get_pids = lambda: {pid} | get_descendants((pid,))  # noqa: E731
+        self.__subscriptions[key] = _Subscription(
+            name,
+            pid,
+            get_pids,
+            interval,
+            callback,
+            self.__read_stats,
+            self.__clock(),
+            self.__clock_ticks,
+            self.__page_size,
+        )
+        if self.__metrics_path is not None and self.__metrics_file is None:
+            new_file = not os.path.exists(self.__metrics_path)
+            self.__metrics_file = open(self.__metrics_path, "a", encoding="utf-8", newline="")
+            self.__metrics_writer = csv.writer(self.__metrics_file, lineterminator="\n")
+            if new_file:
+                self.__metrics_writer.writerow(self.METRICS_FIELDS)
+        if self.__task is None or self.__task.done():
+            self.__task = self.__loop.create_task(self.__run())
+        self.__wakeup.set()
+
+    def remove(self, key: Hashable) -> None:
+        """Stop sampling the process subscribed with `key`."""
+        self.__subscriptions.pop(key, None)
+        if not self.__subscriptions and self.__metrics_file is not None:
+            self.__metrics_file.close()
+            self.__metrics_file = self.__metrics_writer = None
+
+    def sample_due(self, now: Optional[float] = None) -> float:
+        """Sample the subscriptions which are due, return the time the next one is."""
+        now = self.__clock() if now is None else now
+        rows = []
+        for subscription in list(self.__subscriptions.values()):
+            if subscription.due > now:
+                continue
+            sample = subscription.sample(now)
+            rows.append(
+                (
+                    "%.3f" % sample.monotonic,
+                    subscription.name,
+                    subscription.pid,
+                    sample.num_processes,
+                    "%.1f" % sample.cpu_percent,
+                    sample.rss,
+                    sample.read_bytes,
+                    sample.write_bytes,
+                )
+            )
+            subscription.callback(sample)
+        if rows and self.__metrics_file is not None:
+            # names may contain commas or quotes, which the csv module escapes
+            self.__metrics_writer.writerows(rows)
+            self.__metrics_file.flush()
+        return min((s.due for s in self.__subscriptions.values()), default=float("inf"))
+
+    async def __run(self) -> None:
+        while self.__subscriptions:
+            self.__wakeup.clear()
+            timeout = self.sample_due() - self.__clock()
+            if timeout > 0:
+                try:
+                    await asyncio.wait_for(self.__wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
@@ -0,0 +1,89 @@
+"""Module for the RespawnPolicy class."""
+
+import collections
+import random
+from typing import Deque
+from typing import Optional
+
+
+class RespawnPolicy:
+    """
+    Delay and crash loop detection for respawning a process.
+
+    The delay before a respawn starts at `initial_delay` and is multiplied by
+    `multiplier` after every respawn, up to `max_delay`, with a random jitter of
+    up to `jitter` times the delay either way. Once a process stayed up for
+    `reset_after` seconds, it is considered healthy and the delay starts over.
+
+    A crash loop is detected when `crash_loop_count` exits happened within
+    `crash_loop_window` seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_delay: float = 0.0,
+        multiplier: float = 1.0,
+        max_delay: Optional[float] = None,
+        jitter: float = 0.0,
+        reset_after: Optional[float] = None,
+        crash_loop_count: Optional[int] = None,
+        crash_loop_window: float = 60.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if initial_delay < 0.0 or multiplier < 1.0 or not 0.0 <= jitter <= 1.0:
+            raise ValueError(
+                "expected initial_delay >= 0, multiplier >= 1 and 0 <= jitter <= 1, got"
+                f" {initial_delay}, {multiplier} and {jitter}"
+            )
+        self.__initial_delay = initial_delay
+        self.__multiplier = multiplier
+        self.__max_delay = max_delay
+        self.__jitter = jitter
+        self.__reset_after = reset_after
+        self.__crash_loop_count = crash_loop_count
+        self.__crash_loop_window = crash_loop_window
+        self.__rng = rng if rng is not None else random.Random()
+        self.__attempt = 0
+        self.__exits: Deque[float] = collections.deque()
+
+    @property
+    def attempt(self) -> int:
+        """Number of respawns since the process was last considered healthy."""
+        return self.__attempt
+
+    def record_exit(self, uptime: float, now: float) -> bool:
+        """
+        Record an exit of the process.
+
+        :param: uptime how long the process ran, in seconds
+        :param: now the monotonic time of the exit
+        :returns: True if the process was considered healthy and the policy was reset
+        """
+        self.__exits.append(now)
+        while self.__exits and now - self.__exits[0] > self.__crash_loop_window:
+            self.__exits.popleft()
+        if self.__reset_after is not None and uptime >= self.__reset_after:
+            self.__attempt = 0
+            return True
+        return False
+
+    @property
+    def crash_count(self) -> int:
+        """Number of exits within the crash loop window of the last exit."""
+        return len(self.__exits)
+
+    @property
+    def in_crash_loop(self) -> bool:
+        """Whether the recorded exits amount to a crash loop."""
+        return self.__crash_loop_count is not None and len(self.__exits) >= self.__crash_loop_count
+
+    def next_delay(self) -> float:
+        """Return the delay before the next respawn, and count it as an attempt."""
+        delay = self.__initial_delay * self.__multiplier**self.__attempt
+        if self.__max_delay is not None:
+            delay = min(delay, self.__max_delay)
+        if self.__jitter > 0.0:
+            delay *= 1.0 + self.__rng.uniform(-self.__jitter, self.__jitter)
+        self.__attempt += 1
+        return delay
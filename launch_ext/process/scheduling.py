@@ -0,0 +1,148 @@
+"""Module for parsing and applying the CPU scheduling settings of launched processes."""
+
+import os
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Text
+from typing import Tuple
+
+# only the policies of this platform, e.g. none on Windows, and no 'batch' or 'idle' on macOS
+SCHED_POLICIES = {
+    name: getattr(os, "SCHED_" + name.upper())
+    for name in ("other", "batch", "idle", "fifo", "rr")
+    if hasattr(os, "SCHED_" + name.upper())
+}
+REALTIME_POLICIES = tuple(
+    SCHED_POLICIES[name] for name in ("fifo", "rr") if name in SCHED_POLICIES
+)
+_POLICY_NAMES = {policy: name for name, policy in SCHED_POLICIES.items()}
+
+
+def _check_supported(option: Text, function: Text) -> None:
+    """Raise a ValueError if `option` can't be applied, e.g. on Windows or macOS."""
+    if not hasattr(os, function):
+        raise ValueError(f"{option} is not supported on this platform, it needs os.{function}()")
+
+
+def parse_cpu_affinity(value: Text) -> Set[int]:
+    """Parse a list of CPUs in the format of `taskset -c`, e.g. '0-3,6'."""
+    _check_supported("cpu_affinity", "sched_setaffinity")
+    cpus = set()
+    try:
+        for part in value.replace(" ", "").split(","):
+            first, _, last = part.partition("-")
+            cpus.update(range(int(first), int(last or first) + 1))
+    except ValueError:
+        raise ValueError(f"invalid cpu_affinity '{value}', expected e.g. '2' or '0-3,6'")
+    if not cpus:
+        raise ValueError(f"invalid cpu_affinity '{value}', expected at least one CPU")
+    return cpus
+
+
+def parse_nice(value: Text) -> int:
+    """Parse a nice level, from -20 to 19."""
+    _check_supported("nice", "setpriority")
+    try:
+        nice = int(value)
+    except ValueError:
+        nice = 20
+    if not -20 <= nice <= 19:
+        raise ValueError(f"invalid nice '{value}', expected an integer from -20 to 19")
+    return nice
+
+
+def parse_sched_policy(policy: Optional[Text], priority: Optional[Text]) -> Tuple[int, int]:
+    """
+    Parse a scheduling policy and its static priority.
+
+    :param: policy one of 'other', 'batch', 'idle', 'fifo' or 'rr', defaults to 'fifo'
+        when only a priority is given
+    :param: priority the real-time priority, from 1 to 99 for 'fifo' and 'rr', and 0
+        for the other policies
+    :return: the `os.SCHED_*` constant and priority
+    """
+    _check_supported("sched_policy", "sched_setscheduler")
+    if policy is None:
+        policy = "fifo"
+    sched_policy = SCHED_POLICIES.get(policy.strip().lower())
+    if sched_policy is None:
+        raise ValueError(
+            "invalid sched_policy '{}', expected one of {}".format(
+                policy, ", ".join(SCHED_POLICIES)
+            )
+        )
+    minimum = os.sched_get_priority_min(sched_policy)
+    maximum = os.sched_get_priority_max(sched_policy)
+    try:
+        sched_priority = int(priority) if priority is not None else minimum
+    except ValueError:
+        sched_priority = -1
+    if not minimum <= sched_priority <= maximum:
+        raise ValueError(
+            "invalid sched_priority '{}' for sched_policy '{}', expected an integer from {} "
+            "to {}".format(priority, policy, minimum, maximum)
+        )
+    return sched_policy, sched_priority
+
+
+def affinity_setter(cpus: Set[int]) -> Callable[[int], None]:
+    """Return a setup step pinning a process, given its pid or 0 for itself, to `cpus`."""
+    return lambda pid: os.sched_setaffinity(pid, cpus)
+
+
+def nice_setter(nice: int) -> Callable[[int], None]:
+    """Return a setup step setting the nice level of a process, given its pid or 0 for itself."""
+    return lambda pid: os.setpriority(os.PRIO_PROCESS, pid, nice)
+
+
+def scheduler_setter(policy: int, priority: int) -> Callable[[int], None]:
+    """Return a setup step setting the scheduling policy of a process, or 0 for itself."""
+    return lambda pid: os.sched_setscheduler(pid, policy, os.sched_param(priority))
+
+
+def check_scheduling(
+    pid: int,
+    *,
+    cpus: Optional[Set[int]] = None,
+    nice: Optional[int] = None,
+    policy: Optional[Tuple[int, int]] = None,
+) -> List[Text]:
+    """
+    Return why the scheduling settings did not apply to the process `pid`, if they did not.
+
+    Settings which applied, or can't be checked because the process is gone, are
+    not reported.
+    """
+    issues = []
+    try:
+        if cpus is not None and os.sched_getaffinity(pid) != cpus:
+            issues.append(
+                "cpu_affinity {} is not applied, the CPUs may not exist or may be outside of "
+                "the cpuset of the process".format(sorted(cpus))
+            )
+        if nice is not None and os.getpriority(os.PRIO_PROCESS, pid) != nice:
+            issues.append(
+                f"nice {nice} is not applied, lowering the nice level needs CAP_SYS_NICE "
+                f"or RLIMIT_NICE of at least {20 - nice}"
+            )
+        if policy is not None and (
+            os.sched_getscheduler(pid) != policy[0]
+            or os.sched_getparam(pid).sched_priority != policy[1]
+        ):
+            issue = "sched_policy '{}' with sched_priority {} is not applied".format(
+                _POLICY_NAMES[policy[0]], policy[1]
+            )
+            if policy[0] in REALTIME_POLICIES:
+                import resource
+
+                rtprio = resource.getrlimit(resource.RLIMIT_RTPRIO)[0]
+                issue += (
+                    f", real-time policies need CAP_SYS_NICE or RLIMIT_RTPRIO of at least "
+                    f"{policy[1]} (it is {rtprio})"
+                )
+            issues.append(issue)
+    except ProcessLookupError:
+        pass
+    return issues
@@ -0,0 +1,37 @@
+"""Module for the instances shared by the processes of a launch."""
+
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_ATTRIBUTE = "_launch_ext_shared_instances"
+
+
+def shared_instance(
+    owner: Any,
+    key: Hashable,
+    factory: Callable[[], T],
+    renew: Optional[Callable[[T], bool]] = None,
+) -> T:
+    """
+    Return the instance for `key` shared by everything using `owner`, e.g. the launch context.
+
+    The instance is created by `factory` on first use and stored on `owner`
+    itself, so it goes away with the owner instead of being held forever by a
+    class-level registry, and a new owner, e.g. the context of the next launch,
+    gets its own instance.
+
+    :param: owner the object the instance is stored on, it must have a `__dict__`
+    :param: key which instance of the owner to return, e.g. the class of the instance
+    :param: factory creates the instance
+    :param: renew tells whether an existing instance must be replaced, e.g. once closed
+    """
+    instances = vars(owner).setdefault(_ATTRIBUTE, {})
+    instance = instances.get(key)
+    if instance is None or (renew is not None and renew(instance)):
+        instance = instances[key] = factory()
+    return instance
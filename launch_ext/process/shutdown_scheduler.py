@@ -0,0 +1,79 @@
+"""Module for the ShutdownScheduler class."""
+
+import asyncio
+import heapq
+import itertools
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .shared_instance import shared_instance
+
+
+class Deadline:
+    """Handle of a callback scheduled by a ShutdownScheduler."""
+
+    __slots__ = ("when", "callback", "cancelled")
+
+    def __init__(self, when: float, callback: Callable[[], None]) -> None:
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Do not call the callback, if it was not called yet."""
+        self.cancelled = True
+
+
+class ShutdownScheduler:
+    """
+    Deadlines of all the processes being shut down, in a single heap.
+
+    Only one timer is armed on the event loop at any time, for the earliest
+    deadline, however many processes are shutting down. Cancelled deadlines are
+    dropped once they reach the top of the heap.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.__loop = loop
+        self.__heap = []  # type: List[Tuple[float, int, Deadline]]
+        self.__counter = itertools.count()
+        self.__timer = None  # type: Optional[asyncio.TimerHandle]
+
+    @classmethod
+    def shared(cls, owner: Any, loop: asyncio.AbstractEventLoop) -> "ShutdownScheduler":
+        """Return the scheduler of `owner`, e.g. the launch context, creating it on first use."""
+        return shared_instance(owner, cls, lambda: cls(loop))
+
+    def __len__(self) -> int:
+        return sum(not deadline.cancelled for _, _, deadline in self.__heap)
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> Deadline:
+        """Call `callback` in `delay` seconds, unless the returned deadline is cancelled."""
+        deadline = Deadline(self.__loop.time() + delay, callback)
+        heapq.heappush(self.__heap, (deadline.when, next(self.__counter), deadline))
+        if self.__heap[0][2] is deadline:
+            self.__arm()
+        return deadline
+
+    def __arm(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if self.__heap:
+            self.__timer = self.__loop.call_at(self.__heap[0][0], self.__run)
+
+    def __run(self) -> None:
+        self.__timer = None
+        now = self.__loop.time()
+        while self.__heap and self.__heap[0][0] <= now:
+            _, _, deadline = heapq.heappop(self.__heap)
+            if not deadline.cancelled:
+                deadline.cancelled = True
+                deadline.callback()
+        # drop the cancelled deadlines on top, so they don't wake the loop up for nothing
+        while self.__heap and self.__heap[0][2].cancelled:
+            heapq.heappop(self.__heap)
+        self.__arm()
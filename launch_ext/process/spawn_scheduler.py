@@ -0,0 +1,135 @@
+"""Module for the SpawnScheduler class."""
+
+import asyncio
+import heapq
+import itertools
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .shared_instance import shared_instance
+
+
+class SpawnSlot:
+    """A process allowed to start by a SpawnScheduler, until it is released."""
+
+    def __init__(self, release: Callable[[], None]) -> None:
+        self.__release = release
+        self.__released = False
+        self.__timer = None  # type: Optional[asyncio.TimerHandle]
+
+    @property
+    def released(self) -> bool:
+        """Whether the slot was released."""
+        return self.__released
+
+    def release_after(self, loop: asyncio.AbstractEventLoop, timeout: float) -> None:
+        """Release the slot in `timeout` seconds, unless it is released before."""
+        self.__timer = loop.call_later(timeout, self.release)
+
+    def release(self) -> None:
+        """Let the next process start, if it was not released already."""
+        if self.__released:
+            return
+        self.__released = True
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        self.__release()
+
+
+class SpawnScheduler:
+    """
+    Bounds how many processes of a launch are starting at the same time.
+
+    A process holds a slot from the time it is allowed to spawn until it has
+    started, e.g. once it is ready, which the caller tells by releasing the
+    slot. Processes waiting for a slot get it by decreasing priority, and in
+    the order they asked for it for the same priority. Slots are granted on
+    the next iteration of the loop, so that processes asking for one at the
+    same time, e.g. all the actions of a launch description, are ordered by
+    priority rather than by declaration.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_starting: int) -> None:
+        """
+        Create a SpawnScheduler.
+
+        :param: loop the event loop of the launch
+        :param: max_starting the maximum number of processes starting at the same time
+        """
+        if max_starting < 1:
+            raise ValueError(f"invalid max_starting {max_starting}, expected at least 1")
+        self.__loop = loop
+        self.__max_starting = max_starting
+        self.__starting = 0
+        self.__waiting = []  # type: List[Tuple[int, int, asyncio.Future]]
+        self.__counter = itertools.count()
+        self.__dispatch = None  # type: Optional[asyncio.Handle]
+
+    @classmethod
+    def shared(
+        cls, owner: Any, loop: asyncio.AbstractEventLoop, max_starting: int
+    ) -> "SpawnScheduler":
+        """Return the scheduler of `owner`, e.g. the launch context, creating it on first use."""
+        return shared_instance(owner, cls, lambda: cls(loop, max_starting))
+
+    @property
+    def max_starting(self) -> int:
+        """Getter for max_starting."""
+        return self.__max_starting
+
+    @property
+    def starting(self) -> int:
+        """Number of slots held."""
+        return self.__starting
+
+    @property
+    def waiting(self) -> int:
+        """Number of processes waiting for a slot."""
+        return sum(not future.done() for _, _, future in self.__waiting)
+
+    async def acquire(self, priority: int = 0, timeout: Optional[float] = None) -> SpawnSlot:
+        """
+        Wait for a slot.
+
+        :param: priority slots go to the highest priority first
+        :param: timeout if set, the slot is released this many seconds after it was
+            acquired, if it was not released before
+        """
+        future = self.__loop.create_future()
+        heapq.heappush(self.__waiting, (-priority, next(self.__counter), future))
+        if self.__dispatch is None:
+            self.__dispatch = self.__loop.call_soon(self.__on_dispatch)
+        try:
+            slot = await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # granted at the same time as cancelled
+                future.result().release()
+            else:
+                future.cancel()
+            raise
+        if timeout is not None:
+            slot.release_after(self.__loop, timeout)
+        return slot
+
+    def __grant(self) -> SpawnSlot:
+        self.__starting += 1
+        return SpawnSlot(self.__on_release)
+
+    def __on_dispatch(self) -> None:
+        self.__dispatch = None
+        self.__grant_waiting()
+
+    def __on_release(self) -> None:
+        self.__starting -= 1
+        self.__grant_waiting()
+
+    def __grant_waiting(self) -> None:
+        while self.__waiting and self.__starting < self.__max_starting:
+            _, _, future = heapq.heappop(self.__waiting)
+            if not future.done():
+                future.set_result(self.__grant())
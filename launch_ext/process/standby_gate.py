@@ -0,0 +1,86 @@
+"""Module for the StandbyGate class."""
+
+import os
+import sys
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Text
+
+# Trampoline of the 'exec' gate, it blocks before executing the actual command.
+_EXEC_GATE_SCRIPT = (
+    "import os, sys\n"
+    "fd = int(sys.argv[1])\n"
+    "if not os.read(fd, 1):\n"
+    "    os._exit(1)\n"
+    "os.close(fd)\n"
+    "os.execvp(sys.argv[2], sys.argv[2:])\n"
+)
+
+
+class StandbyGate:
+    """
+    Pipe holding back a pre-spawned standby process until it is needed.
+
+    With the 'exec' gate, the standby is a small trampoline blocked before
+    executing the command, so it has been forked, set up and accounted for,
+    but the command itself has not started yet. With the 'cooperative' gate,
+    the command is executed straight away and finds the read end of the pipe in
+    the `LAUNCH_EXT_STANDBY_FD` environment variable. It is expected to
+    initialize, then block reading a byte from it before becoming active, and
+    to exit if it reads end of file instead.
+
+    Either way, the standby exits if the gate is cancelled or the launch process
+    goes away, as the write end of the pipe is closed.
+    """
+
+    ENV_VAR = "LAUNCH_EXT_STANDBY_FD"
+    MODES = ("exec", "cooperative")
+
+    def __init__(self, mode: Text = "exec") -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"unsupported standby gate '{mode}', expected one of {self.MODES}")
+        self.__mode = mode
+        self.__read_fd, self.__write_fd = os.pipe()
+
+    @property
+    def mode(self) -> Text:
+        """Getter for mode."""
+        return self.__mode
+
+    @property
+    def pass_fds(self):
+        """File descriptors the standby has to inherit."""
+        return (self.__read_fd,) if self.__read_fd >= 0 else ()
+
+    def get_cmd(self, cmd: List[Text]) -> List[Text]:
+        """Return the command line of the standby."""
+        if self.__mode != "exec":
+            return cmd
+        return [sys.executable, "-c", _EXEC_GATE_SCRIPT, str(self.__read_fd), *cmd]
+
+    def get_env(self, env: Optional[Dict[Text, Text]]) -> Optional[Dict[Text, Text]]:
+        """Return the environment of the standby, based on `env` or else os.environ."""
+        if self.__mode != "cooperative":
+            return env
+        env = dict(os.environ if env is None else env)
+        env[self.ENV_VAR] = str(self.__read_fd)
+        return env
+
+    def spawned(self) -> None:
+        """Close the end of the pipe only the standby needs, once it was spawned."""
+        if self.__read_fd >= 0:
+            os.close(self.__read_fd)
+            self.__read_fd = -1
+
+    def release(self) -> None:
+        """Let the standby run."""
+        os.write(self.__write_fd, b"\x01")
+        self.cancel()
+
+    def cancel(self) -> None:
+        """Close the gate for good, a standby still waiting on it exits."""
+        self.spawned()
+        if self.__write_fd >= 0:
+            os.close(self.__write_fd)
+            self.__write_fd = -1
@@ -0,0 +1,241 @@
+"""Module for recording and reporting the startup milestones of launched processes."""
+
+import asyncio
+import json
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Text
+
+from .shared_instance import shared_instance
+
+# milestones in the order they are expected to happen
+MILESTONES = ("execute", "prepared", "spawn", "connection_made", "first_output", "ready")
+
+
+class StartupTimeline:
+    """
+    The `time.monotonic()` at which a process reached each of its startup milestones.
+
+    Only the first occurrence of a milestone is kept, so later respawns of the
+    process do not change its timeline.
+    """
+
+    def __init__(self, name: Text, *, expects_ready: bool = False) -> None:
+        """
+        Create a StartupTimeline.
+
+        :param: name the name of the process
+        :param: expects_ready whether the process reports readiness, in which case
+            it has started once 'ready' is reached, or else once 'connection_made' is
+        """
+        self.__name = name
+        self.__expects_ready = expects_ready
+        self.__times = {}  # type: Dict[Text, float]
+        self.__abandoned = False
+        self.__listeners = []  # type: List[Callable[[], None]]
+
+    @property
+    def name(self) -> Text:
+        """Getter for name."""
+        return self.__name
+
+    @property
+    def times(self) -> Dict[Text, float]:
+        """Time of each milestone reached, by milestone."""
+        return dict(self.__times)
+
+    @property
+    def expects_ready(self) -> bool:
+        """Whether the process reports readiness."""
+        return self.__expects_ready
+
+    @expects_ready.setter
+    def expects_ready(self, expects_ready: bool) -> None:
+        self.__expects_ready = expects_ready
+
+    @property
+    def complete(self) -> bool:
+        """Whether the process has started, see `expects_ready`."""
+        return ("ready" if self.__expects_ready else "connection_made") in self.__times
+
+    @property
+    def finished(self) -> bool:
+        """Whether the process has started, or never will."""
+        return self.__abandoned or self.complete
+
+    def abandon(self) -> None:
+        """Record that the process will not start, e.g. because it failed to spawn."""
+        self.__abandoned = True
+        for listener in self.__listeners:
+            listener()
+
+    @property
+    def end(self) -> Optional[float]:
+        """Time of the last milestone reached."""
+        return max(self.__times.values(), default=None)
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Call `listener` whenever a new milestone is reached."""
+        self.__listeners.append(listener)
+
+    def mark(self, milestone: Text, at: Optional[float] = None) -> None:
+        """Record that `milestone` was reached, now or at the monotonic time `at`."""
+        if milestone not in MILESTONES:
+            raise ValueError(f"unknown startup milestone '{milestone}'")
+        if milestone in self.__times:
+            return
+        self.__times[milestone] = time.monotonic() if at is None else at
+        for listener in self.__listeners:
+            listener()
+
+
+class StartupReport:
+    """
+    Startup timelines of all the processes of a launch.
+
+    The report is handed to `on_complete` once, when it is closed: either once
+    every process has started, or failed to, and no process was added for
+    `settle_delay` seconds, or on `close()`, e.g. when the launch is shut down
+    with processes which did not start yet. Processes added after that are not
+    part of the report.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        on_complete: Callable[["StartupReport"], None],
+        *,
+        settle_delay: float = 1.0,
+    ) -> None:
+        """
+        Create a StartupReport.
+
+        :param: loop the event loop the settle delay is waited on
+        :param: on_complete called with the report once it is closed
+        :param: settle_delay the time to wait for more processes after the last one was
+            added, before the report is closed
+        """
+        self.__loop = loop
+        self.__on_complete = on_complete
+        self.__settle_delay = settle_delay
+        self.__timelines = []  # type: List[StartupTimeline]
+        self.__last_added = loop.time()
+        self.__timer = None  # type: Optional[asyncio.TimerHandle]
+        self.__closed = False
+
+    @classmethod
+    def shared(
+        cls,
+        owner: Any,
+        loop: asyncio.AbstractEventLoop,
+        on_complete: Callable[["StartupReport"], None],
+    ) -> "StartupReport":
+        """Return the report of `owner`, e.g. the launch context, creating it on first use."""
+        return shared_instance(owner, cls, lambda: cls(loop, on_complete))
+
+    @property
+    def closed(self) -> bool:
+        """Whether the report was handed to `on_complete`."""
+        return self.__closed
+
+    @property
+    def timelines(self) -> List[StartupTimeline]:
+        """Timelines of the processes, in the order they were added."""
+        return list(self.__timelines)
+
+    def add(self, timeline: StartupTimeline) -> None:
+        """Add the timeline of a process, unless the report is closed."""
+        if self.__closed:
+            return
+        self.__timelines.append(timeline)
+        self.__last_added = self.__loop.time()
+        timeline.add_listener(self.__check_complete)
+        self.__check_complete()
+
+    def close(self) -> None:
+        """Hand the report to `on_complete`, if it was not already."""
+        if self.__closed:
+            return
+        self.__closed = True
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        self.__on_complete(self)
+
+    def __check_complete(self) -> None:
+        if self.__closed:
+            return
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if all(timeline.finished for timeline in self.__timelines):
+            self.__timer = self.__loop.call_at(self.__last_added + self.__settle_delay, self.close)
+
+    def to_dict(self) -> Dict:
+        """Return the report as a JSON compatible dictionary, on the critical path order."""
+        start = min(
+            (timeline.times.get("execute", float("inf")) for timeline in self.__timelines),
+            default=0.0,
+        )
+        processes = []
+        for timeline in self.__critical_path():
+            times = timeline.times
+            processes.append(
+                {
+                    "name": timeline.name,
+                    "complete": timeline.complete,
+                    "end": round(timeline.end - start, 6) if timeline.end is not None else None,
+                    "milestones": {
+                        milestone: round(times[milestone] - start, 6)
+                        for milestone in MILESTONES
+                        if milestone in times
+                    },
+                }
+            )
+        return {"start_monotonic": start, "processes": processes}
+
+    def render(self) -> Text:
+        """Return a human readable table of the report, on the critical path order."""
+        header = "{:<40} {:>9}".format("process", "total") + "".join(
+            " {:>15}".format(milestone) for milestone in MILESTONES[1:]
+        )
+        lines = ["startup report, slowest first (seconds since launch / since previous):", header]
+        for process in self.to_dict()["processes"]:
+            milestones = process["milestones"]
+            columns = []
+            previous = milestones.get("execute")
+            for milestone in MILESTONES[1:]:
+                at = milestones.get(milestone)
+                if at is None:
+                    columns.append(" {:>15}".format("-"))
+                    continue
+                columns.append(" {:>15}".format(f"{at:.3f}/{at - (previous or 0.0):.3f}"))
+                previous = at
+            total = "-" if process["end"] is None else f"{process['end']:.3f}"
+            lines.append(
+                "{:<40} {:>9}".format(process["name"][:40], total)
+                + "".join(columns)
+                + ("" if process["complete"] else " (not started)")
+            )
+        return "\n".join(lines)
+
+    def write(self, path: Text) -> None:
+        """Write the report to `path` as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def __critical_path(self) -> List[StartupTimeline]:
+        # the processes which started last gate the bring-up, and those which never
+        # started at all even more so
+        return sorted(
+            self.__timelines,
+            key=lambda timeline: (
+                timeline.complete,
+                -(timeline.end if timeline.end is not None else float("inf")),
+            ),
+        )
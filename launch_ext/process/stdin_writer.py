@@ -0,0 +1,169 @@
+"""Module for the StdinWriter class."""
+
+import asyncio
+import collections.abc
+from typing import AsyncIterable
+from typing import Iterable
+from typing import Optional
+from typing import Text
+from typing import Union
+
+StdinSource = Union[Text, bytes, Iterable[Union[bytes, Text]], AsyncIterable[Union[bytes, Text]]]
+
+
+class StdinWriter:
+    """
+    Writes data to the stdin pipe of a process, from a queue drained by a task.
+
+    Data is only written while the pipe accepts it: the protocol of the process
+    forwards its `pause_writing()` and `resume_writing()` calls, made by the
+    pipe transport once its write buffer goes over or back under its limits.
+    `write()` always queues the data, `stream()` waits for the queue to go down
+    below `max_queued_bytes` instead, so streaming a large file only holds a
+    bounded amount of it in memory.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, *, max_queued_bytes: int = 1 << 20
+    ) -> None:
+        """
+        Create a StdinWriter.
+
+        :param: loop the event loop of the process
+        :param: max_queued_bytes how much data `stream()` queues before waiting
+        """
+        self.__loop = loop
+        self.__max_queued_bytes = max_queued_bytes
+        self.__queue = asyncio.Queue()  # type: asyncio.Queue
+        self.__queued_bytes = 0
+        self.__has_room = asyncio.Event()
+        self.__has_room.set()
+        self.__can_write = asyncio.Event()
+        self.__can_write.set()
+        self.__transport = None  # type: Optional[asyncio.WriteTransport]
+        self.__task = None  # type: Optional[asyncio.Task]
+        self.__closing = False
+        self.__written_bytes = 0
+
+    @property
+    def connected(self) -> bool:
+        """Whether the writer has a pipe to write to."""
+        return self.__transport is not None
+
+    @property
+    def closing(self) -> bool:
+        """Whether `close()` or `disconnect()` was called."""
+        return self.__closing
+
+    @property
+    def queued_bytes(self) -> int:
+        """Amount of data waiting to be written to the pipe."""
+        return self.__queued_bytes
+
+    @property
+    def written_bytes(self) -> int:
+        """Amount of data written to the pipe so far."""
+        return self.__written_bytes
+
+    def connect(self, transport: asyncio.WriteTransport) -> None:
+        """Start writing the queued data to the stdin pipe `transport`."""
+        self.__transport = transport
+        self.__task = self.__loop.create_task(self.__run())
+
+    def pause_writing(self) -> None:
+        """Stop writing to the pipe, its write buffer is full."""
+        self.__can_write.clear()
+
+    def resume_writing(self) -> None:
+        """Write to the pipe again."""
+        self.__can_write.set()
+
+    def write(self, data: Union[bytes, Text]) -> None:
+        """Queue `data`, encoded in UTF-8 if it is text, to be written to the pipe."""
+        if self.__closing:
+            raise RuntimeError("stdin is closed")
+        if isinstance(data, str):
+            data = data.encode()
+        if not data:
+            return
+        self.__queued_bytes += len(data)
+        if self.__queued_bytes >= self.__max_queued_bytes:
+            self.__has_room.clear()
+        self.__queue.put_nowait(data)
+
+    async def drain(self) -> None:
+        """Wait until less than `max_queued_bytes` are queued."""
+        while not self.__has_room.is_set() and not self.__closing:
+            await self.__has_room.wait()
+
+    async def stream(
+        self, source: StdinSource, *, chunk_size: int = 1 << 16, close: bool = False
+    ) -> int:
+        """
+        Write all the data of `source`, waiting for the pipe to take it in.
+
+        :param: source the path of a file, or an iterable or async iterable of
+            chunks of bytes or text
+        :param: chunk_size the size of the chunks a file is read in
+        :param: close close stdin once all of `source` was queued
+        :return: the amount of data queued
+        """
+        count = 0
+        if isinstance(source, (str, bytes)):
+            with open(source, "rb") as f:
+                while True:
+                    data = await self.__loop.run_in_executor(None, f.read, chunk_size)
+                    if not data:
+                        break
+                    count += await self.__stream_chunk(data)
+        elif isinstance(source, collections.abc.AsyncIterable):
+            async for data in source:
+                count += await self.__stream_chunk(data)
+        else:
+            for data in source:
+                count += await self.__stream_chunk(data)
+        if close:
+            self.close()
+        return count
+
+    async def __stream_chunk(self, data: Union[bytes, Text]) -> int:
+        await self.drain()
+        if self.__closing:
+            raise RuntimeError("stdin is closed")
+        if isinstance(data, str):
+            data = data.encode()
+        self.write(data)
+        return len(data)
+
+    def close(self) -> None:
+        """Close the pipe once the queued data is written, the process then reads EOF."""
+        if self.__closing:
+            return
+        self.__closing = True
+        self.__queue.put_nowait(None)
+
+    def disconnect(self) -> None:
+        """Drop the queued data, e.g. once the process exited."""
+        self.__closing = True
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+        self.__transport = None
+        self.__queued_bytes = 0
+        self.__has_room.set()
+
+    async def __run(self) -> None:
+        while True:
+            data = await self.__queue.get()
+            transport = self.__transport
+            if transport is None or transport.is_closing():
+                return
+            if data is None:
+                transport.close()
+                return
+            await self.__can_write.wait()
+            transport.write(data)
+            self.__written_bytes += len(data)
+            self.__queued_bytes -= len(data)
+            if self.__queued_bytes < self.__max_queued_bytes:
+                self.__has_room.set()
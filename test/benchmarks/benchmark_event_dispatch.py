@@ -0,0 +1,102 @@
+"""Benchmark of routing the output events of many processes to their actions.
+
+Run with ``python test/benchmarks/benchmark_event_dispatch.py``.
+"""
+
+import timeit
+
+from launch import Action
+from launch import LaunchContext
+from launch.event_handler import EventHandler
+from launch.event_handlers import OnProcessExit
+from launch.event_handlers import OnProcessIO
+from launch.event_handlers import OnShutdown
+from launch.events import Shutdown
+from launch.events.process import ProcessExited
+from launch.events.process import ProcessStdout
+from launch.events.process import ShutdownProcess
+from launch.events.process import SignalProcess
+from launch.utilities import is_a_subclass
+
+from launch_ext.event_handlers import ProcessEventDispatcher
+
+PROCESS_COUNT = 200
+LINES_PER_PROCESS = 50
+
+
+def make_events(actions):
+    """Return interleaved stdout events, as chatty processes would emit them."""
+    return [
+        ProcessStdout(
+            text=b"[INFO] [talker]: Publishing: 'Hello World: %d'\n" % i,
+            action=action,
+            name=f"talker-{n}",
+            cmd=["talker"],
+            cwd=None,
+            env=None,
+            pid=1000 + n,
+        )
+        for i in range(LINES_PER_PROCESS)
+        for n, action in enumerate(actions)
+    ]
+
+
+def per_action_handlers(context, actions, on_output):
+    """Register the handlers ExecuteLocalExt used to register for each process."""
+    for action in actions:
+        for handler in (
+            EventHandler(matcher=lambda event: is_a_subclass(event, ShutdownProcess)),
+            EventHandler(matcher=lambda event: is_a_subclass(event, SignalProcess)),
+            OnProcessIO(target_action=action, on_stdout=lambda event: on_output()),
+            OnShutdown(on_shutdown=lambda event, context: None),
+            OnProcessExit(target_action=action, on_exit=lambda event, context: None),
+            OnProcessExit(target_action=action, on_exit=lambda event, context: None),
+        ):
+            context.register_event_handler(handler)
+
+
+def dispatcher_handlers(context, actions, on_output):
+    """Register the callbacks ExecuteLocalExt registers with the dispatcher."""
+    dispatcher = ProcessEventDispatcher.shared(context)
+    for action in actions:
+        for event_type, callback in (
+            (ShutdownProcess, lambda event, context: None),
+            (SignalProcess, lambda event, context: None),
+            (ProcessStdout, lambda event, context: on_output()),
+            (Shutdown, lambda event, context: None),
+            (ProcessExited, lambda event, context: None),
+            (ProcessExited, lambda event, context: None),
+        ):
+            dispatcher.add(action, event_type, callback)
+
+
+def process_events(context, events):
+    """Match and handle events the way the launch service does."""
+    for event in events:
+        for handler in tuple(context._event_handlers):
+            if handler.matches(event):
+                handler.handle(event, context)
+
+
+def bench(name, register):
+    context = LaunchContext()
+    actions = [Action() for _ in range(PROCESS_COUNT)]
+    events = make_events(actions)
+    handled = []
+    register(context, actions, lambda: handled.append(None))
+    seconds = min(timeit.repeat(lambda: process_events(context, events), number=1, repeat=5))
+    assert len(handled) == len(events) * 5
+    print(
+        f"{name:<40} {len(events) / seconds:>14,.0f} events/s "
+        f"({len(context._event_handlers)} event handlers)"
+    )
+
+
+def main():
+    print(f"{PROCESS_COUNT} processes, {LINES_PER_PROCESS} lines each")
+    bench("handlers per process", per_action_handlers)
+    bench("ProcessEventDispatcher", dispatcher_handlers)
+
+
+if __name__ == "__main__":
+    main()
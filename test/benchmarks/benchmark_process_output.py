@@ -0,0 +1,115 @@
+"""Throughput benchmarks for the ExecuteLocalExt output path.
+
+Run with ``python test/benchmarks/benchmark_process_output.py``.
+"""
+
+import io
+import os
+import timeit
+from types import SimpleNamespace
+
+from launch_ext.process import LineAssembler
+from launch_ext.process import compile_output_format
+
+DEFAULT_OUTPUT_FORMAT = "[{this.process_description.final_name}] {line}"
+
+
+def make_chunks(line_count: int = 20000, chunk_size: int = 64, line_length: int = 0):
+    """Return process output split into pipe-read sized chunks."""
+    padding = b"x" * line_length
+    data = b"".join(
+        b"[INFO] [1700000000.000000000] [talker]: Publishing: 'Hello World: %d'%s\n" % (i, padding)
+        for i in range(line_count)
+    )
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)], line_count
+
+
+def stringio_lines(chunks):
+    """Split lines the way ExecuteLocalExt used to, with a seek/truncate StringIO."""
+    buffer = io.StringIO()
+    count = 0
+    for chunk in chunks:
+        buffer.write(chunk.decode(errors="replace"))
+        buffer.seek(0)
+        last_line = None
+        for line in buffer:
+            if line.endswith(os.linesep):
+                count += 1
+            else:
+                last_line = line
+                break
+        buffer.seek(0)
+        buffer.truncate(0)
+        if last_line is not None:
+            buffer.write(last_line)
+    return count
+
+
+def assembler_lines(chunks):
+    assembler = LineAssembler()
+    count = 0
+    for chunk in chunks:
+        count += len(assembler.feed(chunk))
+    return count
+
+
+def format_lines(lines, this):
+    for line in lines:
+        DEFAULT_OUTPUT_FORMAT.format(line=line, this=this)
+
+
+def render_lines(lines, this):
+    render = compile_output_format(DEFAULT_OUTPUT_FORMAT, this=this)
+    for line in lines:
+        render(line)
+
+
+def bench(name, func, *args, number=5):
+    seconds = min(timeit.repeat(lambda: func(*args), number=1, repeat=number))
+    return name, seconds
+
+
+def report(results, line_count):
+    for name, seconds in results:
+        print(f"{name:<40} {line_count / seconds:>14,.0f} lines/s")
+
+
+def main():
+    for chunk_size in (16, 64, 4096):
+        chunks, line_count = make_chunks(chunk_size=chunk_size)
+        assert stringio_lines(chunks) == assembler_lines(chunks) == line_count
+        print(f"chunk size {chunk_size} bytes")
+        report(
+            [
+                bench("StringIO seek/truncate", stringio_lines, chunks),
+                bench("LineAssembler", assembler_lines, chunks),
+            ],
+            line_count,
+        )
+
+    # long lines arriving in small reads are quadratic with the StringIO approach
+    chunks, line_count = make_chunks(line_count=200, chunk_size=64, line_length=16384)
+    print("16 KiB lines, chunk size 64 bytes")
+    report(
+        [
+            bench("StringIO seek/truncate", stringio_lines, chunks, number=1),
+            bench("LineAssembler", assembler_lines, chunks, number=1),
+        ],
+        line_count,
+    )
+
+    this = SimpleNamespace(process_description=SimpleNamespace(final_name="talker-1"))
+    chunks, _ = make_chunks(chunk_size=1 << 30)
+    lines = LineAssembler().feed(chunks[0])
+    print("default output_format")
+    report(
+        [
+            bench("str.format per line", format_lines, lines, this),
+            bench("compile_output_format", render_lines, lines, this),
+        ],
+        len(lines),
+    )
+
+
+if __name__ == "__main__":
+    main()
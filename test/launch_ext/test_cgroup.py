@@ -0,0 +1,131 @@
+import asyncio
+import os
+
+import pytest
+
+from launch_ext.process import CgroupError
+from launch_ext.process import CgroupLeaf
+from launch_ext.process.cgroup import CGROUP_ROOT_ENV
+
+
+def make_cgroup(path, controllers=("cpu", "io", "memory")):
+    """Lay out the files of a cgroup, as the cgroup filesystem would."""
+    files = {
+        "cgroup.controllers": " ".join(controllers),
+        "cgroup.subtree_control": "",
+        "cgroup.procs": "",
+        "cgroup.events": "populated 0\nfrozen 0\n",
+        "cpu.max": "max 100000",
+        "memory.max": "max",
+        "io.weight": "default 100",
+    }
+    for filename, content in files.items():
+        (path / filename).write_text(content)
+
+
+def test_create(tmp_path, monkeypatch):
+    monkeypatch.setenv(CGROUP_ROOT_ENV, str(tmp_path))
+    first = CgroupLeaf.create("my node/1")
+    second = CgroupLeaf.create("my node/1")
+    assert os.path.dirname(first.path) == str(tmp_path)
+    assert os.path.basename(first.path).startswith(f"my_node_1-{os.getpid()}-")
+    assert first.path != second.path
+    assert os.path.isdir(first.path)
+    assert os.path.isdir(second.path)
+
+
+def test_create_enables_controllers(tmp_path):
+    make_cgroup(tmp_path)
+    leaf = CgroupLeaf.create("node", parent=str(tmp_path), controllers=["memory", "cpu"])
+    assert os.path.isdir(leaf.path)
+    assert (tmp_path / "cgroup.subtree_control").read_text() == "+cpu +memory"
+
+
+def test_create_fails_without_controllers(tmp_path):
+    make_cgroup(tmp_path, controllers=("cpu",))
+    with pytest.raises(CgroupError, match="memory"):
+        CgroupLeaf.create("node", parent=str(tmp_path), controllers=["memory"])
+    assert not [name for name in os.listdir(tmp_path) if name.startswith("node-")]
+
+
+def test_create_fails_without_parent(tmp_path):
+    with pytest.raises(CgroupError):
+        CgroupLeaf.create("node", parent=str(tmp_path / "missing"))
+
+
+def test_pids(tmp_path):
+    leaf = CgroupLeaf.create("node", parent=str(tmp_path))
+    assert leaf.pids() == set()
+    make_cgroup(tmp_path / os.path.basename(leaf.path))
+    assert leaf.pids() == set()
+    leaf.attach(1234)
+    assert leaf.pids() == {1234}
+    with open(os.path.join(leaf.path, "cgroup.procs"), "w") as f:
+        f.write("1234\n5678\n")
+    assert leaf.pids() == {1234, 5678}
+
+
+def test_set_limits(tmp_path):
+    leaf = CgroupLeaf.create("node", parent=str(tmp_path))
+    make_cgroup(tmp_path / os.path.basename(leaf.path))
+    leaf.set_limits(cpu_max="50000 100000", memory_max=1 << 20)
+    with open(os.path.join(leaf.path, "cpu.max")) as f:
+        assert f.read() == "50000 100000"
+    with open(os.path.join(leaf.path, "memory.max")) as f:
+        assert f.read() == str(1 << 20)
+    with open(os.path.join(leaf.path, "io.weight")) as f:
+        assert f.read() == "default 100"
+    leaf.set_limits(io_weight=500)
+    with open(os.path.join(leaf.path, "io.weight")) as f:
+        assert f.read() == "default 500"
+
+
+def test_set_limits_fails_without_controller(tmp_path):
+    leaf = CgroupLeaf.create("node", parent=str(tmp_path))
+    with pytest.raises(CgroupError, match="memory.max"):
+        leaf.set_limits(memory_max=1 << 20)
+
+
+def test_populated(tmp_path):
+    leaf = CgroupLeaf.create("node", parent=str(tmp_path))
+    assert not leaf.populated
+    make_cgroup(tmp_path / os.path.basename(leaf.path))
+    assert not leaf.populated
+    with open(os.path.join(leaf.path, "cgroup.events"), "w") as f:
+        f.write("populated 1\nfrozen 0\n")
+    assert leaf.populated
+
+
+@pytest.mark.parametrize("poll", [False, True])
+def test_wait_until_empty(tmp_path, monkeypatch, poll):
+    if poll:
+
+        def no_inotify(path):
+            raise OSError("inotify is not available")
+
+        monkeypatch.setattr("launch_ext.process.cgroup._InotifyWatch", no_inotify)
+    leaf = CgroupLeaf.create("node", parent=str(tmp_path))
+    make_cgroup(tmp_path / os.path.basename(leaf.path))
+    events = os.path.join(leaf.path, "cgroup.events")
+    with open(events, "w") as f:
+        f.write("populated 1\nfrozen 0\n")
+
+    def empty():
+        with open(events, "w") as f:
+            f.write("populated 0\nfrozen 0\n")
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.1, empty)
+        await asyncio.wait_for(leaf.wait_until_empty(loop, poll_period=0.01), 5.0)
+
+    asyncio.run(run())
+    assert not leaf.populated
+
+
+def test_remove(tmp_path):
+    leaf = CgroupLeaf.create("node", parent=str(tmp_path))
+    leaf.remove()
+    assert not os.path.exists(leaf.path)
+    # removing it again is not an error
+    leaf.remove()
@@ -0,0 +1,274 @@
+import io
+import json
+import os
+import signal
+import sys
+import time
+
+import launch.logging
+import pytest
+from launch import LaunchDescription
+from launch import LaunchService
+from launch.actions import RegisterEventHandler
+from launch.actions import SetLaunchConfiguration
+from launch.actions import Shutdown
+from launch.event_handlers import OnProcessIO
+from launch.frontend import Parser
+
+from launch_ext.actions import ExecuteProcessExt
+from launch_ext.event_handlers import OnProcessReady
+from launch_ext.process import OutputProbe
+
+
+@pytest.fixture(autouse=True)
+def log_dir(tmp_path):
+    launch.logging.reset()
+    launch.logging.launch_config.log_dir = str(tmp_path)
+    return tmp_path
+
+
+def run(*entities):
+    ls = LaunchService()
+    ls.include_launch_description(LaunchDescription(list(entities)))
+    return ls.run()
+
+
+def python(script):
+    return [sys.executable, "-c", script]
+
+
+def shutdown_once_all_printed(actions):
+    """Shut down the launch once each of `actions` printed something."""
+    printed = set()
+
+    def on_stdout(event):
+        printed.add(event.action)
+        if printed == set(actions):
+            return Shutdown()
+
+    return RegisterEventHandler(OnProcessIO(on_stdout=on_stdout))
+
+
+def test_block_backpressure_reads_the_output_left_after_exit():
+    # more than the high water mark, then as much as the pipe holds while reading is
+    # paused, and exit before any of it is handled
+    script = (
+        "import sys, time\n"
+        "sys.stdout.write('x' * 4096 + '\\n'); sys.stdout.flush(); time.sleep(0.2)\n"
+        "sys.stdout.write(''.join('line %d\\n' % i for i in range(5000)))\n"
+    )
+    action = ExecuteProcessExt(
+        cmd=python(script),
+        output="log",
+        cached_output=True,
+        output_high_water=1024,
+        output_overflow="block",
+    )
+    slowed = []
+
+    def slow(event):
+        # hold up the launch loop on the first output, while the process exits
+        if not slowed:
+            slowed.append(event)
+            time.sleep(0.5)
+
+    handler = RegisterEventHandler(OnProcessIO(target_action=action, on_stdout=slow))
+    assert run(handler, action) == 0
+
+    lines = action.get_stdout().splitlines()
+    assert lines[0] == "x" * 4096
+    assert lines[1:] == ["line %d" % i for i in range(5000)]
+    assert action.output_backpressure_stats["pause_count"] >= 1
+
+
+def test_output_probe_matches_the_first_line():
+    # the ready line is out before the ready task first runs
+    action = ExecuteProcessExt(
+        cmd=python("import time; print('ready', flush=True); time.sleep(1)"),
+        output="log",
+        readiness_probe=OutputProbe("ready"),
+    )
+    ready = []
+    handler = RegisterEventHandler(
+        OnProcessReady(target_action=action, on_ready=lambda event, context: ready.append(event))
+    )
+    assert run(handler, action) == 0
+    assert len(ready) == 1
+
+
+def test_shutdown_reaches_every_process():
+    script = (
+        "import signal, sys, time\n"
+        "signal.signal(signal.SIGINT, lambda *args: sys.exit(0))\n"
+        "print('up', flush=True); time.sleep(30); sys.exit(1)\n"
+    )
+    exits = {}
+    actions = [
+        ExecuteProcessExt(
+            cmd=python(script),
+            output="log",
+            on_exit=lambda event, context: exits.setdefault(event.action, []).append(
+                event.returncode
+            ),
+        )
+        for _ in range(3)
+    ]
+    assert run(shutdown_once_all_printed(actions), *actions) == 0
+    # the handler of each process only got its own exit
+    assert exits == {action: [0] for action in actions}
+
+
+def test_shutdown_escalates_to_sigterm_and_sigkill():
+    ignore_sigint = "import signal, time\nsignal.signal(signal.SIGINT, signal.SIG_IGN)\n"
+    ignore_sigterm = ignore_sigint + "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+    exits = {}
+    actions = [
+        ExecuteProcessExt(
+            cmd=python(script + "print('up', flush=True); time.sleep(30)\n"),
+            output="log",
+            sigterm_timeout="0.2",
+            sigkill_timeout="0.2",
+            on_exit=lambda event, context: exits.setdefault(event.action, event.returncode),
+        )
+        for script in (ignore_sigint, ignore_sigterm)
+    ]
+    started_at = time.monotonic()
+    run(shutdown_once_all_printed(actions), *actions)
+    assert time.monotonic() - started_at < 10.0
+    assert exits == {actions[0]: -signal.SIGTERM, actions[1]: -signal.SIGKILL}
+
+
+def test_standby_replaces_each_exited_process():
+    pids = []
+    action = ExecuteProcessExt(
+        cmd=python("import time; time.sleep(0.3)"),
+        output="log",
+        respawn=True,
+        respawn_max_retries=2,
+        respawn_mode="standby",
+        on_exit=lambda event, context: pids.append(event.pid),
+    )
+    assert run(action) == 0
+    assert len(set(pids)) == 3
+
+
+def test_stdin_file_is_streamed_to_the_process(tmp_path):
+    stdin_file = tmp_path / "stdin.txt"
+    stdin_file.write_text("".join("record %d\n" % i for i in range(10000)))
+    action = ExecuteProcessExt(
+        cmd=python("import sys; sys.stdout.write(sys.stdin.read())"),
+        output="log",
+        cached_output=True,
+        stdin_file=str(stdin_file),
+    )
+    assert run(action) == 0
+    assert action.get_stdout().splitlines() == stdin_file.read_text().splitlines()
+
+
+def test_coalesced_output_is_complete():
+    script = (
+        "import sys, time\n"
+        "for i in range(2000):\n"
+        "    sys.stdout.write('line %d\\n' % i); sys.stdout.flush()\n"
+        "    if i % 100 == 0: time.sleep(0.01)\n"
+    )
+    events = []
+    action = ExecuteProcessExt(
+        cmd=python(script),
+        output="log",
+        cached_output=True,
+        output_coalesce_window=0.05,
+    )
+    handler = RegisterEventHandler(OnProcessIO(target_action=action, on_stdout=events.append))
+    assert run(handler, action) == 0
+
+    assert action.get_stdout().splitlines() == ["line %d" % i for i in range(2000)]
+    stats = action.output_coalescing_stats["stdout"]
+    assert stats["events_emitted"] == len(events)
+    assert stats["events_emitted"] < stats["reads_received"]
+
+
+def test_screen_shedding_keeps_the_cached_output():
+    action = ExecuteProcessExt(
+        cmd=python("for i in range(1000): print('line %d' % i)"),
+        output="screen",
+        cached_output=True,
+        screen_max_lines_per_second=10,
+    )
+    assert run(action) == 0
+    assert action.get_stdout().splitlines() == ["line %d" % i for i in range(1000)]
+    assert 0 < action.screen_dropped_lines < 1000
+
+
+def test_spawn_slots_go_by_priority():
+    order = []
+    actions = [
+        ExecuteProcessExt(
+            cmd=python("print('up', flush=True)"), output="log", spawn_priority=priority
+        )
+        for priority in (0, 0, 10)
+    ]
+    handler = RegisterEventHandler(OnProcessIO(on_stdout=lambda event: order.append(event.action)))
+    # the process declared last starts first
+    max_starting = SetLaunchConfiguration("max_starting_processes", "1")
+    assert run(max_starting, handler, *actions) == 0
+    assert order == [actions[2], actions[0], actions[1]]
+
+
+def test_inheritable_fds_are_inherited():
+    read_fd, write_fd = os.pipe()
+    os.set_inheritable(write_fd, True)
+    try:
+        action = ExecuteProcessExt(
+            cmd=python(f"import os; os.write({write_fd}, b'inherited')"),
+            output="log",
+            # spawned by launch_ext rather than osrf_pycommon, to set the limit before exec
+            rlimits={"core": "0"},
+        )
+        assert run(action) == 0
+        assert os.read(read_fd, 100) == b"inherited"
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_output_jsonl_times_when_received(log_dir):
+    action = ExecuteProcessExt(
+        cmd=python("import time; print('a', flush=True); time.sleep(0.2); print('b')"),
+        output="log",
+        output_jsonl=True,
+    )
+    slowed = []
+
+    def slow(event):
+        # the second line is handled late, with the launch loop held up
+        if not slowed:
+            slowed.append(event)
+            time.sleep(0.5)
+
+    handler = RegisterEventHandler(OnProcessIO(target_action=action, on_stdout=slow))
+    assert run(handler, action) == 0
+
+    with open(log_dir / "process_output.jsonl") as f:
+        records = {record["line"]: record for record in map(json.loads, f)}
+    assert 0.15 < records["b"]["monotonic"] - records["a"]["monotonic"] < 0.45
+
+
+def test_parse_reads_the_launch_ext_attributes():
+    xml = """
+        <launch>
+            <executable_wait_on_children cmd="true" output_to_file="true"
+                output_file_compression="none" output_coalesce_window="0.05"
+                respawn_mode="standby" respawn_crash_loop_count="3" use_cgroup="false"/>
+        </launch>
+    """
+    root_entity, parser = Parser.load(io.StringIO(xml))
+    _, kwargs = ExecuteProcessExt.parse(root_entity.children[0], parser)
+
+    assert kwargs["output_to_file"] is True
+    assert kwargs["output_file_compression"] is None
+    assert kwargs["output_coalesce_window"] == 0.05
+    assert kwargs["respawn_mode"] == "standby"
+    assert kwargs["respawn_crash_loop_count"] == 3
+    assert kwargs["use_cgroup"] is False
+    assert "output_jsonl" not in kwargs
@@ -0,0 +1,33 @@
+import os
+import subprocess
+
+from launch_ext.process import InodeHolderTracker
+from launch_ext.process.inode_tracker import get_descendants
+from launch_ext.process.inode_tracker import get_inodes
+
+
+def test_inode_holder_tracker():
+    # the shell and its background sleep both hold the stdout pipe
+    process = subprocess.Popen(
+        ["sh", "-c", "sleep 30 & echo $!; wait"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        sleep_pid = int(process.stdout.readline())
+        assert sleep_pid in get_descendants([process.pid])
+
+        stdout_inode = os.fstat(process.stdout.fileno()).st_ino
+        assert stdout_inode in get_inodes(process.pid)
+        tracker = InodeHolderTracker({stdout_inode})
+        assert tracker.poll() == {process.pid, sleep_pid}
+        # following polls only look at the holders and their descendants
+        assert tracker.poll() == {process.pid, sleep_pid}
+
+        subprocess.run(["kill", str(sleep_pid)], check=True)
+        process.wait(timeout=10)
+        assert tracker.poll() == set()
+    finally:
+        process.kill()
+        process.wait()
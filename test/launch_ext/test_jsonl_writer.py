@@ -0,0 +1,53 @@
+import asyncio
+import json
+
+from launch_ext.process import JsonLinesWriter
+
+
+def test_jsonl_writer(tmp_path):
+    path = tmp_path / "process_output.jsonl"
+
+    async def run():
+        writer = JsonLinesWriter(str(path), asyncio.get_running_loop(), flush_interval=0.01)
+        writer.write("talker", 42, "stdout", 'hello "world" ✓')
+        writer.write("talker", None, "stderr", "")
+        writer.write("talker", 42, "stdout", "received earlier", (1.5, 1700000000.25))
+        assert path.read_text() == ""
+        await asyncio.sleep(0.05)
+        assert len(path.read_text().splitlines()) == 3
+        writer.close()
+
+    asyncio.run(run())
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(r["name"], r["pid"], r["stream"], r["line"]) for r in records] == [
+        ("talker", 42, "stdout", 'hello "world" ✓'),
+        ("talker", None, "stderr", ""),
+        ("talker", 42, "stdout", "received earlier"),
+    ]
+    assert records[0]["monotonic"] <= records[1]["monotonic"]
+    assert isinstance(records[0]["time"], float)
+    assert (records[2]["monotonic"], records[2]["time"]) == (1.5, 1700000000.25)
+
+
+def test_jsonl_writer_closed_by_last_user(tmp_path):
+    class Launch:
+        pass
+
+    launch = Launch()
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        writer = JsonLinesWriter.shared(launch, str(tmp_path / "process_output.jsonl"), loop)
+        writer.add("talker")
+        writer.add("listener")
+        writer.write("talker", 42, "stdout", "bye")
+        writer.remove("talker")
+        assert not writer.closed
+        writer.remove("listener")
+        assert writer.closed
+        assert json.loads((tmp_path / "process_output.jsonl").read_text())["line"] == "bye"
+        # a process executed later writes to the same file again
+        assert JsonLinesWriter.shared(launch, writer.path, loop) is not writer
+
+    asyncio.run(run())
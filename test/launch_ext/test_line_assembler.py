@@ -0,0 +1,50 @@
+from launch_ext.process import LineAssembler
+
+
+def test_complete_lines():
+    assembler = LineAssembler()
+    assert assembler.feed(b"hello\nworld\n") == ["hello", "world"]
+    assert assembler.pending == 0
+    assert assembler.flush() is None
+
+
+def test_partial_lines():
+    assembler = LineAssembler()
+    assert assembler.feed(b"he") == []
+    assert assembler.feed(b"llo") == []
+    assert assembler.pending == 5
+    assert assembler.feed(b"\nwor") == ["hello"]
+    assert assembler.feed(b"ld\n\n") == ["world", ""]
+    assert assembler.feed(b"tail") == []
+    assert assembler.flush() == "tail"
+    assert assembler.flush() is None
+
+
+def test_carriage_return_is_kept():
+    # matches the previous behaviour for output from an emulated tty
+    assert LineAssembler().feed(b"a\r\nb\r\n") == ["a\r", "b\r"]
+
+
+def test_invalid_bytes_are_replaced():
+    assert LineAssembler().feed(b"\xff\n") == ["�"]
+
+
+def test_multibyte_character_split_across_reads():
+    data = "héllo wörld ✓\n".encode()
+    assembler = LineAssembler()
+    lines = []
+    for i in range(len(data)):
+        lines += assembler.feed(data[i : i + 1])
+    assert lines == ["héllo wörld ✓"]
+
+
+def test_drain():
+    check = "✓".encode()
+    assembler = LineAssembler()
+    assert assembler.drain(b"a" + check[:1]) == "a"
+    assert assembler.pending == 1
+    assert assembler.drain(check[1:2]) == ""
+    assert assembler.drain(check[2:] + b"\nb") == "✓\nb"
+    assert assembler.flush() is None
+    assembler.feed(b"partial")
+    assert assembler.drain(b" line") == "partial line"
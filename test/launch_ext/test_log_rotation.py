@@ -0,0 +1,71 @@
+import gzip
+import sys
+import threading
+import time
+
+import pytest
+
+from launch_ext.process import LogFileRotator
+from launch_ext.process import check_compression
+from launch_ext.process import rotate_file
+
+
+def test_rotate_file(tmp_path):
+    path = tmp_path / "talker.stdout.log"
+    for i in range(4):
+        path.write_bytes(b"segment %d\n" % i)
+        rotate_file(str(path), backups=2)
+        assert path.read_bytes() == b""
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "talker.stdout.log",
+        "talker.stdout.log.1.gz",
+        "talker.stdout.log.2.gz",
+    ]
+    assert gzip.decompress((tmp_path / "talker.stdout.log.1.gz").read_bytes()) == b"segment 3\n"
+    assert gzip.decompress((tmp_path / "talker.stdout.log.2.gz").read_bytes()) == b"segment 2\n"
+
+
+def test_rotate_file_uncompressed(tmp_path):
+    path = tmp_path / "talker.stdout.log"
+    path.write_bytes(b"segment\n")
+    rotate_file(str(path), backups=1, compression=None)
+    assert (tmp_path / "talker.stdout.log.1").read_bytes() == b"segment\n"
+
+
+def test_check_compression(monkeypatch):
+    check_compression("gzip")
+    check_compression(None)
+    with pytest.raises(ValueError):
+        check_compression("bzip2")
+    # an import of a module set to None in sys.modules raises ImportError
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with pytest.raises(ValueError, match="zstandard"):
+        check_compression("zstd")
+
+
+def test_log_file_rotator(tmp_path):
+    class Launch:
+        pass
+
+    launch = Launch()
+    assert LogFileRotator.shared(launch) is LogFileRotator.shared(launch)
+    assert LogFileRotator.shared(launch) is not LogFileRotator.shared(Launch())
+
+    path = tmp_path / "talker.stdout.log"
+    path.write_bytes(b"x" * 100)
+    rotator = LogFileRotator(check_interval=0.01)
+    rotator.add(str(path), 10, 1, None)
+    deadline = time.monotonic() + 5.0
+    while not (tmp_path / "talker.stdout.log.1").exists():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    rotator.remove(str(path))
+
+    # the thread stops once no file is left
+    def rotating():
+        return any(thread.name == "launch_ext log rotation" for thread in threading.enumerate())
+
+    while rotating():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
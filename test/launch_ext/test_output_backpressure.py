@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from launch_ext.process import OutputBackpressure
+
+
+class Pipe:
+    def __init__(self):
+        self.paused = False
+        self.closing = False
+
+    def pause_reading(self):
+        self.paused = True
+
+    def resume_reading(self):
+        self.paused = False
+
+    def is_closing(self):
+        return self.closing
+
+
+def test_block():
+    resumed = []
+    backpressure = OutputBackpressure(100, 20, on_resume=lambda: resumed.append(True))
+    stdout, stderr = Pipe(), Pipe()
+    backpressure.attach(stdout)
+    backpressure.attach(stderr)
+
+    assert backpressure.received(60)
+    assert backpressure.received(60)
+    assert backpressure.engaged and stdout.paused and stderr.paused
+    # data already read is kept
+    assert backpressure.received(10)
+    assert backpressure.pending_bytes == 130
+
+    backpressure.handled(100)
+    assert stdout.paused and not resumed
+    backpressure.handled(10)
+    assert not backpressure.engaged and not stdout.paused and not stderr.paused
+    assert resumed == [True]
+    assert backpressure.pause_count == 1
+    assert backpressure.dropped_bytes == 0
+
+
+def test_pipes_attached_while_engaged_are_paused():
+    backpressure = OutputBackpressure(10)
+    old = Pipe()
+    backpressure.attach(old)
+    backpressure.received(11)
+    assert old.paused
+    # a detached pipe is not left paused, it must still be read to its end
+    backpressure.detach(old)
+    assert not old.paused
+    new = Pipe()
+    backpressure.attach(new)
+    assert new.paused
+    backpressure.handled(11)
+    assert not new.paused
+
+
+def test_drop():
+    backpressure = OutputBackpressure(100, policy="drop")
+    pipe = Pipe()
+    backpressure.attach(pipe)
+    assert backpressure.received(101)
+    assert not backpressure.received(30)
+    assert not backpressure.received(30)
+    assert not pipe.paused
+    assert (backpressure.dropped_bytes, backpressure.dropped_reads) == (60, 2)
+    backpressure.handled(50)
+    assert backpressure.engaged
+    backpressure.handled(1)
+    assert not backpressure.engaged
+    assert backpressure.received(30)
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        OutputBackpressure(100, policy="buffer")
+    with pytest.raises(ValueError):
+        OutputBackpressure(100, 100)
+
+
+def test_blocks_the_process():
+    """A process writing faster than its output is handled ends up blocked on its pipe."""
+
+    class Protocol(asyncio.SubprocessProtocol):
+        def __init__(self, backpressure, closed):
+            self.backpressure = backpressure
+            self.received = []
+            self.closed = closed
+
+        def connection_made(self, transport):
+            self.pipe = transport.get_pipe_transport(1)
+            self.backpressure.attach(self.pipe)
+
+        def pipe_connection_lost(self, fd, exc):
+            self.backpressure.detach(self.pipe)
+
+        def connection_lost(self, exc):
+            self.closed.set_result(None)
+
+        def pipe_data_received(self, fd, data):
+            if self.backpressure.received(len(data)):
+                self.received.append(data)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        backpressure = OutputBackpressure(1 << 16, policy="block")
+        closed = loop.create_future()
+        transport, protocol = await loop.subprocess_exec(
+            lambda: Protocol(backpressure, closed), "head", "-c", str(4 << 20), "/dev/zero"
+        )
+        await asyncio.sleep(0.2)
+        # nothing was handled, so reading stopped shortly after the high water mark
+        assert backpressure.engaged
+        pending = backpressure.pending_bytes
+        assert pending < 1 << 20
+        await asyncio.sleep(0.1)
+        assert backpressure.pending_bytes == pending
+        total = pending
+        while not closed.done():
+            backpressure.handled(backpressure.pending_bytes)
+            await asyncio.sleep(0.01)
+            total += backpressure.pending_bytes
+        # the pipes were read to their end, and closed
+        await asyncio.wait_for(closed, 5.0)
+        transport.close()
+        return total, sum(len(data) for data in protocol.received)
+
+    total, received = asyncio.run(run())
+    assert total == received == 4 << 20
@@ -0,0 +1,79 @@
+import pytest
+
+from launch_ext.process import MemoryOutputCache
+from launch_ext.process import MmapOutputCache
+from launch_ext.process import RingOutputCache
+
+
+def test_memory_output_cache():
+    cache = MemoryOutputCache()
+    cache.write(b"one\ntw")
+    cache.write(b"o\nthree\n")
+    assert cache.getvalue() == "one\ntwo\nthree\n"
+    assert cache.tail(2) == ["two", "three"]
+    assert cache.tail(10) == ["one", "two", "three"]
+    cache.write(b"fou")
+    assert cache.tail(1) == ["fou"]
+
+
+def test_ring_output_cache_max_lines():
+    cache = RingOutputCache(max_lines=2)
+    cache.write(b"one\ntwo\nthree\n")
+    assert cache.getvalue() == "two\nthree\n"
+    cache.write(b"f")
+    assert cache.tail(5) == ["three", "f"]
+    cache.write(b"our\n")
+    assert cache.tail(5) == ["three", "four"]
+
+
+def test_ring_output_cache_max_bytes():
+    cache = RingOutputCache(max_bytes=10)
+    for i in range(100):
+        cache.write(b"%d\n" % i)
+    assert cache.size <= 10
+    assert cache.getvalue() == "97\n98\n99\n"
+    cache.write(b"x" * 20 + b"\n")
+    assert cache.getvalue() == "x" * 9 + "\n"
+
+
+def test_ring_output_cache_limits():
+    with pytest.raises(ValueError):
+        RingOutputCache()
+    with pytest.raises(ValueError):
+        RingOutputCache(max_lines=0)
+
+
+def test_mmap_output_cache(tmp_path):
+    cache = MmapOutputCache(str(tmp_path / "stdout.cache"))
+    assert cache.getvalue() == ""
+    assert cache.tail(1) == []
+    cache.write(b"one\ntwo\n")
+    assert cache.tail(1) == ["two"]
+    cache.write(b"three")
+    assert cache.size == 13
+    assert cache.slice(4, 7) == b"two"
+    assert list(cache.iter_lines()) == [b"one\n", b"two\n", b"three"]
+    assert cache.getvalue() == "one\ntwo\nthree"
+    cache.close()
+    assert (tmp_path / "stdout.cache").read_bytes() == b"one\ntwo\nthree"
+
+
+def test_mmap_output_cache_iter_lines_while_writing(tmp_path):
+    cache = MmapOutputCache(str(tmp_path / "stdout.cache"))
+    cache.write(b"one\ntwo\n")
+    lines = cache.iter_lines()
+    assert next(lines) == b"one\n"
+    cache.write(b"three\n")
+    assert cache.tail(1) == ["three"]
+    assert list(lines) == [b"two\n"]
+    cache.close()
+
+
+def test_mmap_output_cache_after_close(tmp_path):
+    cache = MmapOutputCache(str(tmp_path / "stdout.cache"))
+    cache.write(b"one\n")
+    cache.close()
+    cache.write(b"two\n")
+    assert cache.getvalue() == "one\ntwo\n"
+    assert cache.tail(1) == ["two"]
+    assert list(cache.iter_lines()) == [b"one\n", b"two\n"]
@@ -0,0 +1,55 @@
+import asyncio
+
+from launch_ext.process import OutputCoalescer
+
+
+def test_output_coalescer_window():
+    async def run():
+        chunks = []
+        coalescer = OutputCoalescer(
+            chunks.append, asyncio.get_running_loop(), max_latency=0.01, max_bytes=1024
+        )
+        for _ in range(10):
+            coalescer.feed(b"abc\n")
+        assert chunks == []
+        await asyncio.sleep(0.05)
+        assert chunks == [b"abc\n" * 10]
+        assert coalescer.reads_received == 10
+        assert coalescer.chunks_emitted == 1
+        assert coalescer.reads_merged == 9
+
+    asyncio.run(run())
+
+
+def test_output_coalescer_max_bytes():
+    async def run():
+        chunks = []
+        coalescer = OutputCoalescer(
+            chunks.append, asyncio.get_running_loop(), max_latency=10.0, max_bytes=8
+        )
+        coalescer.feed(b"abcd")
+        coalescer.feed(b"efgh")
+        coalescer.feed(b"ij")
+        assert chunks == [b"abcdefgh"]
+        coalescer.flush()
+        assert chunks == [b"abcdefgh", b"ij"]
+        assert coalescer.reads_merged == 1
+
+    asyncio.run(run())
+
+
+def test_output_coalescer_received_at():
+    async def run():
+        received = []
+        coalescer = OutputCoalescer(
+            lambda data: received.append((data, coalescer.received_at)),
+            asyncio.get_running_loop(),
+            max_latency=10.0,
+        )
+        coalescer.feed(b"abc", (1.0, 100.0))
+        coalescer.feed(b"\n", (2.0, 101.0))
+        coalescer.flush()
+        # the data was complete with the last read
+        assert received == [(b"abc\n", (2.0, 101.0))]
+
+    asyncio.run(run())
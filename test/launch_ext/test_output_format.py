@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+from launch_ext.process import compile_output_format
+
+
+def render_both(output_format, line, **fields):
+    expected = output_format.format(line=line, **fields)
+    assert compile_output_format(output_format, **fields)(line) == expected
+    return expected
+
+
+def test_default_output_format():
+    this = SimpleNamespace(process_description=SimpleNamespace(final_name="talker-1"))
+    assert (
+        render_both("[{this.process_description.final_name}] {line}", "hello", this=this)
+        == "[talker-1] hello"
+    )
+
+
+def test_output_format_variants():
+    this = SimpleNamespace(name="talker", pid=42, details={"pid": 42})
+    render_both("{line}", "hello", this=this)
+    render_both("no line {this.name}", "hello", this=this)
+    render_both("{{literal}} {this.name!r:>10} {line!r:<8}|", "hello", this=this)
+    render_both("{line} and {line}", "hello", this=this)
+    render_both("{this.details[pid]:{this.pid}d} {line}", "hello", this=this)
+    render_both("{line.upper} {this.name}", "hello", this=this)
+
+
+def test_static_fields_resolved_once():
+    this = SimpleNamespace(name="before")
+    render = compile_output_format("[{this.name}] {line}", this=this)
+    this.name = "after"
+    assert render("hello") == "[before] hello"
@@ -0,0 +1,82 @@
+import io
+import logging
+
+import pytest
+
+from launch_ext.process import OutputSheddingFilter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_loggers(name):
+    screen = logging.StreamHandler(io.StringIO())
+    log_file = logging.StreamHandler(io.StringIO())
+    loggers = []
+    for stream in ("stdout", "stderr"):
+        logger = logging.getLogger(f"{name}-{stream}")
+        logger.handlers = [screen, log_file]
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        loggers.append(logger)
+    return screen, log_file, loggers
+
+
+def lines(handler):
+    return handler.stream.getvalue().splitlines()
+
+
+def test_sheds_stdout_on_screen_only():
+    screen, log_file, (stdout, stderr) = make_loggers("shed-talker")
+    clock = Clock()
+    shedding = OutputSheddingFilter(screen, clock)
+    shedding.limit(stdout.name, 10, "talker")
+
+    for i in range(100):
+        stdout.info(f"out {i}")
+        stderr.info(f"err {i}")
+    assert [line for line in lines(screen) if line.startswith("out")] == [
+        f"out {i}" for i in range(10)
+    ]
+    assert len(lines(screen)) == 110
+    assert len(lines(log_file)) == 200
+    assert shedding.dropped(stdout.name) == 90
+
+    # half a second later, 5 more lines go through, after a summary
+    clock.now = 0.5
+    for i in range(100, 110):
+        stdout.info(f"out {i}")
+    assert lines(screen)[110:] == [
+        "[talker] dropped 90 lines from the screen, over 10 lines/s",
+        "out 100",
+        "out 101",
+        "out 102",
+        "out 103",
+        "out 104",
+    ]
+    assert shedding.dropped(stdout.name) == 95
+
+    assert shedding.unlimit(stdout.name) == 95
+    assert shedding.dropped(stdout.name) == 0
+    assert lines(screen)[-1] == "[talker] dropped 5 lines from the screen, over 10 lines/s"
+    stdout.info("after")
+    assert lines(screen)[-1] == "after"
+    screen.removeFilter(shedding)
+
+
+def test_other_loggers_go_through():
+    screen, _, (stdout, _) = make_loggers("shed-listener")
+    shedding = OutputSheddingFilter(screen, Clock())
+    shedding.limit("some-other-logger", 1)
+    for i in range(20):
+        stdout.info(f"out {i}")
+    assert len(lines(screen)) == 20
+    shedding.flush()
+    assert len(lines(screen)) == 20
+    with pytest.raises(ValueError):
+        shedding.limit(stdout.name, 0)
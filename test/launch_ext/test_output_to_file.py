@@ -0,0 +1,26 @@
+import launch.logging
+from launch import LaunchDescription
+from launch import LaunchService
+
+from launch_ext.actions import ExecuteProcessExt
+
+
+def test_output_to_file(tmp_path):
+    launch.logging.reset()
+    launch.logging.launch_config.log_dir = str(tmp_path)
+    action = ExecuteProcessExt(
+        cmd=["sh", "-c", "echo out; echo err >&2; echo more out"],
+        name="writer",
+        output="own_log",
+        output_to_file=True,
+    )
+    ls = LaunchService()
+    ls.include_launch_description(LaunchDescription([action]))
+    assert ls.run() == 0
+
+    name = action.process_details["name"]
+    assert (tmp_path / f"{name}.stdout.log").read_text() == "out\nmore out\n"
+    assert (tmp_path / f"{name}.stderr.log").read_text() == "err\n"
+    # launch's own log file of the process is a different file, which gets none of it
+    own_log = tmp_path / f"{name}-stdout.log"
+    assert not own_log.exists() or own_log.read_text() == ""
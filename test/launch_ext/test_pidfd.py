@@ -0,0 +1,44 @@
+import asyncio
+import subprocess
+import time
+
+import pytest
+
+from launch_ext.process import pidfd_supported
+from launch_ext.process import wait_for_any_exit
+
+
+@pytest.mark.skipif(not pidfd_supported(), reason="pidfds are not supported")
+def test_wait_for_any_exit():
+    short = subprocess.Popen(["sleep", "0.2"])
+    long = subprocess.Popen(["sleep", "30"])
+    try:
+
+        async def run():
+            start = time.monotonic()
+            await wait_for_any_exit([short.pid, long.pid], asyncio.get_running_loop())
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 5.0
+        assert short.wait(timeout=1) == 0
+        assert long.poll() is None
+    finally:
+        long.kill()
+        long.wait()
+
+
+@pytest.mark.skipif(not pidfd_supported(), reason="pidfds are not supported")
+def test_wait_for_any_exit_timeout():
+    running = subprocess.Popen(["sleep", "30"])
+    try:
+
+        async def run():
+            start = time.monotonic()
+            await wait_for_any_exit([running.pid], asyncio.get_running_loop(), timeout=0.1)
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 5.0
+        assert running.poll() is None
+    finally:
+        running.kill()
+        running.wait()
@@ -0,0 +1,63 @@
+from launch import Action
+from launch import LaunchContext
+from launch.actions import LogInfo
+from launch.events import Shutdown
+from launch.events.process import ProcessExited
+from launch.events.process import ProcessStderr
+from launch.events.process import ProcessStdout
+
+from launch_ext.event_handlers import ProcessEventDispatcher
+
+
+def process_args(action):
+    return dict(action=action, name="talker", cmd=["talker"], cwd=None, env=None, pid=1)
+
+
+def handle(context, event):
+    """Handle `event` the way the launch service does, returning the entities."""
+    entities = []
+    for handler in tuple(context._event_handlers):
+        if handler.matches(event):
+            entities.extend(handler.handle(event, context) or [])
+    return entities
+
+
+def test_routes_to_action():
+    context = LaunchContext()
+    dispatcher = ProcessEventDispatcher.shared(context)
+    assert ProcessEventDispatcher.shared(context) is dispatcher
+    actions = [Action() for _ in range(3)]
+    received = []
+    for action in actions:
+        dispatcher.add(
+            action, ProcessStdout, lambda event, _, action=action: received.append(action)
+        )
+
+    handle(context, ProcessStdout(text=b"hello\n", **process_args(actions[1])))
+    handle(context, ProcessStderr(text=b"hello\n", **process_args(actions[1])))
+    assert received == [actions[1]]
+    # one handler, however many actions
+    assert len(dispatcher.event_handlers) == 1
+    assert len(context._event_handlers) == 1
+
+
+def test_broadcast_and_entities():
+    context = LaunchContext()
+    dispatcher = ProcessEventDispatcher.shared(context)
+    first, second = Action(), Action()
+    log = LogInfo(msg="exited")
+    dispatcher.add(first, Shutdown, lambda event, _: log)
+    dispatcher.add(second, Shutdown, lambda event, _: None)
+    dispatcher.add(second, Shutdown, lambda event, _: [log, log])
+    seen = []
+    dispatcher.add(first, ProcessExited, lambda event, _: seen.append(context.locals.event))
+
+    assert handle(context, Shutdown()) == [log, log, log]
+    event = ProcessExited(returncode=0, **process_args(first))
+    assert handle(context, event) == []
+    assert seen == [event]
+
+    dispatcher.remove(first)
+    assert handle(context, Shutdown()) == [log, log]
+    assert handle(context, event) == []
+    assert seen == [event]
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from launch_ext.process import CoroutineProbe
+from launch_ext.process import FileProbe
+from launch_ext.process import OutputProbe
+from launch_ext.process import SocketProbe
+
+
+def test_output_probe():
+    probe = OutputProbe(r"listening on port \d+", stream="stdout")
+
+    async def probe_output():
+        waiter = asyncio.ensure_future(probe.wait(100))
+        await asyncio.sleep(0)
+        assert probe.watches_output
+        probe.on_output(100, "stdout", "starting")
+        probe.on_output(100, "stderr", "listening on port 80")
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        probe.on_output(100, "stdout", "[INFO] listening on port 80")
+        await asyncio.wait_for(waiter, 1.0)
+        assert not probe.watches_output
+
+    asyncio.run(probe_output())
+
+
+def test_output_probe_shared():
+    probe = OutputProbe("ready")
+
+    async def probe_output():
+        first = asyncio.ensure_future(probe.wait(100))
+        second = asyncio.ensure_future(probe.wait(200))
+        await asyncio.sleep(0)
+        probe.on_output(200, "stdout", "ready")
+        await asyncio.wait_for(second, 1.0)
+        assert not first.done()
+        assert probe.watches_output
+        probe.on_output(100, "stderr", "ready")
+        await asyncio.wait_for(first, 1.0)
+        assert not probe.watches_output
+
+    asyncio.run(probe_output())
+
+
+def test_output_probe_expected():
+    probe = OutputProbe("ready")
+
+    async def probe_output():
+        probe.expect(100)
+        probe.expect(200)
+        assert probe.watches_output
+        probe.on_output(100, "stdout", "ready")
+        await asyncio.wait_for(probe.wait(100), 1.0)
+        probe.forget(200)
+        assert not probe.watches_output
+
+    asyncio.run(probe_output())
+
+
+def test_socket_probe_tcp():
+    async def probe_socket():
+        probe = SocketProbe("127.0.0.1:0", period=0.01)
+        assert not await probe.async_check()
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            await asyncio.wait_for(SocketProbe(f"127.0.0.1:{port}").wait(0), 1.0)
+
+    asyncio.run(probe_socket())
+
+
+def test_socket_probe_unix(tmp_path):
+    path = str(tmp_path / "ready.sock")
+
+    async def probe_socket():
+        waiter = asyncio.ensure_future(SocketProbe(path, period=0.01).wait(0))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        server = await asyncio.start_unix_server(lambda r, w: w.close(), path)
+        async with server:
+            await asyncio.wait_for(waiter, 1.0)
+
+    asyncio.run(probe_socket())
+
+
+def test_file_probe(tmp_path):
+    path = tmp_path / "ready"
+
+    async def probe_file():
+        waiter = asyncio.ensure_future(FileProbe(str(path), period=0.01).wait(0))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        path.touch()
+        await asyncio.wait_for(waiter, 1.0)
+
+    asyncio.run(probe_file())
+
+
+def test_coroutine_probe():
+    pids = []
+
+    async def check(pid):
+        pids.append(pid)
+
+    asyncio.run(CoroutineProbe(check).wait(42))
+    assert pids == [42]
+
+
+def test_invalid_stream():
+    with pytest.raises(ValueError):
+        OutputProbe("ready", stream="stdin")
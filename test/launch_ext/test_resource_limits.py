@@ -0,0 +1,77 @@
+import resource
+import subprocess
+
+import pytest
+
+from launch_ext.process import get_rlimit
+from launch_ext.process import parse_cpu_quota
+from launch_ext.process import parse_io_weight
+from launch_ext.process import parse_rlimit
+from launch_ext.process import parse_size
+from launch_ext.process import rlimit_setter
+
+
+def test_parse_size():
+    assert parse_size("4096") == 4096
+    assert parse_size("512M") == 512 << 20
+    assert parse_size("1.5g") == 3 << 29
+    assert parse_size("2KB") == 2048
+    with pytest.raises(ValueError):
+        parse_size("lots")
+    with pytest.raises(ValueError):
+        parse_size("-1")
+
+
+def test_parse_cpu_quota():
+    assert parse_cpu_quota("0.5") == "50000 100000"
+    assert parse_cpu_quota("2") == "200000 100000"
+    assert parse_cpu_quota("0.001") == "1000 100000"
+    assert parse_cpu_quota("max") == "max 100000"
+    with pytest.raises(ValueError):
+        parse_cpu_quota("0")
+
+
+def test_parse_io_weight():
+    assert parse_io_weight("100") == 100
+    with pytest.raises(ValueError):
+        parse_io_weight("0")
+    with pytest.raises(ValueError):
+        parse_io_weight("10001")
+
+
+def test_parse_rlimit():
+    assert parse_rlimit("nofile", "1024") == (resource.RLIMIT_NOFILE, (1024, 1024))
+    assert parse_rlimit("NOFILE", "256:1024") == (resource.RLIMIT_NOFILE, (256, 1024))
+    assert parse_rlimit("core", "unlimited") == (
+        resource.RLIMIT_CORE,
+        (resource.RLIM_INFINITY, resource.RLIM_INFINITY),
+    )
+    assert parse_rlimit("nofile", "1024:unlimited") == (
+        resource.RLIMIT_NOFILE,
+        (1024, resource.RLIM_INFINITY),
+    )
+    with pytest.raises(ValueError):
+        parse_rlimit("nofiles", "1024")
+    with pytest.raises(ValueError):
+        parse_rlimit("nofile", "4096:1024")
+    with pytest.raises(ValueError):
+        parse_rlimit("core", "unlimited:1G")
+
+
+def test_rlimit_setter_before_exec():
+    step = rlimit_setter(*parse_rlimit("nofile", "100:200"))
+    output = subprocess.check_output(
+        ["sh", "-c", "ulimit -Sn; ulimit -Hn"], preexec_fn=lambda: step(0)
+    )
+    assert output.split() == [b"100", b"200"]
+
+
+def test_get_rlimit():
+    assert get_rlimit(0, resource.RLIMIT_NOFILE) == resource.getrlimit(resource.RLIMIT_NOFILE)
+
+
+def test_rlimits_unsupported(monkeypatch):
+    # e.g. on macOS, which has no prlimit()
+    monkeypatch.delattr(resource, "prlimit")
+    with pytest.raises(ValueError):
+        parse_rlimit("nofile", "1024")
@@ -0,0 +1,141 @@
+import asyncio
+import csv
+import os
+import subprocess
+import sys
+
+import pytest
+
+from launch_ext.process import ResourceSampler
+from launch_ext.process import check_resource_sampling
+from launch_ext.process.inode_tracker import get_descendants
+from launch_ext.process.resource_sampler import read_process_stats
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def test_read_process_stats():
+    ticks, pages, read_bytes, write_bytes = read_process_stats(os.getpid())
+    assert ticks >= 0
+    assert pages > 0
+    assert read_bytes >= 0 and write_bytes >= 0
+
+
+def test_read_process_stats_exited():
+    process = subprocess.Popen(["true"])
+    process.wait()
+    assert read_process_stats(process.pid) is None
+
+
+def test_check_resource_sampling(monkeypatch):
+    check_resource_sampling()
+    # e.g. on Windows
+    monkeypatch.delattr(os, "sysconf")
+    with pytest.raises(ValueError):
+        check_resource_sampling()
+
+
+def test_samples_descendants(tmp_path):
+    metrics_path = tmp_path / "metrics.csv"
+    process = subprocess.Popen(
+        ["sh", "-c", f"{sys.executable} -c 'import time; time.sleep(30)' & wait"],
+    )
+    samples = []
+
+    async def sample():
+        sampler = ResourceSampler(asyncio.get_running_loop(), str(metrics_path))
+        # wait for the child to start
+        while not get_descendants((process.pid,)):
+            await asyncio.sleep(0.01)
+        sampler.add("sleepy", "sleepy", process.pid, 0.05, samples.append)
+        while len(samples) < 2:
+            await asyncio.sleep(0.01)
+        sampler.remove("sleepy")
+
+    try:
+        asyncio.run(asyncio.wait_for(sample(), 10.0))
+    finally:
+        subprocess.run(["pkill", "-P", str(process.pid)])
+        process.wait()
+
+    assert all(sample.num_processes == 2 for sample in samples)
+    assert all(sample.rss > 0 for sample in samples)
+    rows = metrics_path.read_text().splitlines()
+    assert rows[0] == ",".join(ResourceSampler.METRICS_FIELDS)
+    assert len(rows) == len(samples) + 1
+    assert rows[1].split(",")[1:3] == ["sleepy", str(process.pid)]
+
+
+class FakeProc:
+    """Stats of fake processes, as read_process_stats() returns them."""
+
+    def __init__(self):
+        self.stats = {}
+
+    def read_stats(self, pid):
+        return self.stats.get(pid)
+
+
+def test_cpu_percent():
+    proc = FakeProc()
+    # CPU time used before the process is added
+    proc.stats[100] = (10 * CLOCK_TICKS, 5, 0, 0)
+    proc.stats[101] = (2 * CLOCK_TICKS, 3, 0, 0)
+    samples = []
+
+    async def sample():
+        sampler = ResourceSampler(
+            asyncio.get_running_loop(), read_stats=proc.read_stats, clock=lambda: 0.0
+        )
+        sampler.add("busy", "busy", 100, 1.0, samples.append, get_pids=lambda: set(proc.stats))
+        sampler.remove("busy")
+        assert sampler.sample_due(0.5) == float("inf")
+        sampler.add("busy", "busy", 100, 1.0, samples.append, get_pids=lambda: set(proc.stats))
+        assert sampler.sample_due(0.5) == 1.0
+        assert samples == []
+        # half a CPU for a second, in the first process only
+        proc.stats[100] = (int(10.5 * CLOCK_TICKS), 5, 0, 0)
+        assert sampler.sample_due(1.0) == 2.0
+        # a process started since, its ticks count in full, and one that exited
+        proc.stats[102] = (CLOCK_TICKS, 2, 0, 0)
+        del proc.stats[101]
+        assert sampler.sample_due(2.0) == 3.0
+        sampler.remove("busy")
+
+    asyncio.run(sample())
+    assert [(s.monotonic, s.num_processes, s.cpu_percent) for s in samples] == [
+        (1.0, 2, 50.0),
+        (2.0, 2, 100.0),
+    ]
+    assert samples[0].rss == 8 * PAGE_SIZE
+
+
+def test_metrics_escape_names(tmp_path):
+    metrics_path = tmp_path / "metrics.csv"
+    proc = FakeProc()
+    proc.stats[100] = (0, 1, 2, 3)
+
+    async def sample():
+        sampler = ResourceSampler(
+            asyncio.get_running_loop(),
+            str(metrics_path),
+            read_stats=proc.read_stats,
+            clock=lambda: 0.0,
+        )
+        sampler.add("odd", 'node,"1"', 100, 1.0, lambda sample: None, get_pids=lambda: {100})
+        sampler.sample_due(1.0)
+        sampler.remove("odd")
+        # the file is reopened for processes subscribed later, e.g. respawned
+        sampler.add("odd", 'node,"1"', 100, 1.0, lambda sample: None, get_pids=lambda: {100})
+        sampler.sample_due(2.0)
+        sampler.remove("odd")
+
+    asyncio.run(sample())
+    with open(metrics_path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        list(ResourceSampler.METRICS_FIELDS),
+        ["1.000", 'node,"1"', "100", "1", "0.0", str(PAGE_SIZE), "2", "3"],
+        ["2.000", 'node,"1"', "100", "1", "0.0", str(PAGE_SIZE), "2", "3"],
+    ]
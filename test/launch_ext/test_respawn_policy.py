@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from launch_ext.process import RespawnPolicy
+
+
+def test_backoff():
+    policy = RespawnPolicy(initial_delay=1.0, multiplier=2.0, max_delay=5.0)
+    assert [policy.next_delay() for _ in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_fixed_delay_by_default():
+    policy = RespawnPolicy(initial_delay=0.5)
+    assert [policy.next_delay() for _ in range(3)] == [0.5, 0.5, 0.5]
+
+
+def test_jitter():
+    policy = RespawnPolicy(initial_delay=10.0, jitter=0.1, rng=random.Random(0))
+    for _ in range(100):
+        assert 9.0 <= policy.next_delay() <= 11.0
+
+
+def test_reset_after_healthy_uptime():
+    policy = RespawnPolicy(initial_delay=1.0, multiplier=2.0, reset_after=30.0)
+    policy.next_delay()
+    policy.next_delay()
+    assert not policy.record_exit(uptime=1.0, now=100.0)
+    assert policy.next_delay() == 4.0
+    assert policy.record_exit(uptime=60.0, now=200.0)
+    assert policy.next_delay() == 1.0
+
+
+def test_crash_loop():
+    policy = RespawnPolicy(crash_loop_count=3, crash_loop_window=10.0)
+    policy.record_exit(uptime=1.0, now=0.0)
+    policy.record_exit(uptime=1.0, now=8.0)
+    assert not policy.in_crash_loop
+    policy.record_exit(uptime=1.0, now=15.0)
+    assert policy.crash_count == 2
+    assert not policy.in_crash_loop
+    policy.record_exit(uptime=1.0, now=16.0)
+    assert policy.in_crash_loop
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        RespawnPolicy(multiplier=0.5)
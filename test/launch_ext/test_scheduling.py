@@ -0,0 +1,72 @@
+import os
+import subprocess
+
+import pytest
+
+from launch_ext.process import affinity_setter
+from launch_ext.process import check_scheduling
+from launch_ext.process import nice_setter
+from launch_ext.process import parse_cpu_affinity
+from launch_ext.process import parse_nice
+from launch_ext.process import parse_sched_policy
+
+
+def test_parse_cpu_affinity():
+    assert parse_cpu_affinity("2") == {2}
+    assert parse_cpu_affinity("0-3, 6") == {0, 1, 2, 3, 6}
+    with pytest.raises(ValueError):
+        parse_cpu_affinity("first")
+
+
+def test_parse_nice():
+    assert parse_nice("-5") == -5
+    with pytest.raises(ValueError):
+        parse_nice("20")
+
+
+@pytest.mark.parametrize(
+    "function, parse",
+    [
+        ("sched_setaffinity", lambda: parse_cpu_affinity("0")),
+        ("setpriority", lambda: parse_nice("5")),
+        ("sched_setscheduler", lambda: parse_sched_policy("other", None)),
+    ],
+)
+def test_unsupported_platform(monkeypatch, function, parse):
+    # e.g. macOS has no sched_setaffinity(), and Windows none of them
+    monkeypatch.delattr(os, function)
+    with pytest.raises(ValueError):
+        parse()
+
+
+def test_parse_sched_policy():
+    assert parse_sched_policy("rr", "10") == (os.SCHED_RR, 10)
+    assert parse_sched_policy(None, "80") == (os.SCHED_FIFO, 80)
+    assert parse_sched_policy("batch", None) == (os.SCHED_BATCH, 0)
+    with pytest.raises(ValueError):
+        parse_sched_policy("fifo", "0")
+    with pytest.raises(ValueError):
+        parse_sched_policy("other", "10")
+    with pytest.raises(ValueError):
+        parse_sched_policy("deadline", None)
+
+
+def test_applied_before_exec():
+    cpus = {min(os.sched_getaffinity(0))}
+    nice = min(os.getpriority(os.PRIO_PROCESS, 0) + 3, 19)
+    steps = [affinity_setter(cpus), nice_setter(nice)]
+
+    def preexec():
+        for step in steps:
+            step(0)
+
+    process = subprocess.Popen(["sleep", "10"], preexec_fn=preexec)
+    try:
+        assert os.sched_getaffinity(process.pid) == cpus
+        assert os.getpriority(os.PRIO_PROCESS, process.pid) == nice
+        assert check_scheduling(process.pid, cpus=cpus, nice=nice) == []
+        issues = check_scheduling(process.pid, nice=nice - 1)
+        assert len(issues) == 1 and "CAP_SYS_NICE" in issues[0]
+    finally:
+        process.kill()
+        process.wait()
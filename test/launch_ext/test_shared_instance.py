@@ -0,0 +1,43 @@
+import functools
+import gc
+import weakref
+
+from launch_ext.process import shared_instance
+
+
+class Owner:
+    pass
+
+
+class Instance:
+    def __init__(self, owner=None):
+        self.owner = owner
+        self.closed = False
+
+
+def test_shared_instance():
+    first, second = Owner(), Owner()
+    instance = shared_instance(first, Instance, Instance)
+    assert shared_instance(first, Instance, Instance) is instance
+    assert shared_instance(second, Instance, Instance) is not instance
+    assert shared_instance(first, (Instance, "other"), Instance) is not instance
+
+
+def test_shared_instance_renew():
+    owner = Owner()
+    instance = shared_instance(owner, Instance, Instance, renew=lambda i: i.closed)
+    assert shared_instance(owner, Instance, Instance, renew=lambda i: i.closed) is instance
+    instance.closed = True
+    renewed = shared_instance(owner, Instance, Instance, renew=lambda i: i.closed)
+    assert renewed is not instance
+    assert shared_instance(owner, Instance, Instance) is renewed
+
+
+def test_shared_instance_goes_away_with_its_owner():
+    owner = Owner()
+    # the instance referencing its owner, as e.g. the ProcessEventDispatcher does
+    instance = weakref.ref(shared_instance(owner, Instance, functools.partial(Instance, owner)))
+    assert instance() is not None
+    del owner
+    gc.collect()
+    assert instance() is None
@@ -0,0 +1,40 @@
+import asyncio
+
+from launch_ext.process import ShutdownScheduler
+
+
+def test_deadlines_in_order():
+    calls = []
+
+    async def schedule():
+        loop = asyncio.get_running_loop()
+        scheduler = ShutdownScheduler(loop)
+        for name, delay in (("kill a", 0.06), ("term a", 0.02), ("term b", 0.04)):
+            scheduler.schedule(delay, lambda name=name: calls.append((name, loop.time())))
+        cancelled = scheduler.schedule(0.03, lambda: calls.append(("cancelled", 0)))
+        cancelled.cancel()
+        assert len(scheduler) == 3
+        await asyncio.sleep(0.1)
+        assert len(scheduler) == 0
+        return loop.time()
+
+    end = asyncio.run(schedule())
+    assert [name for name, _ in calls] == ["term a", "term b", "kill a"]
+    assert all(at <= end for _, at in calls)
+
+
+def test_schedule_from_callback():
+    calls = []
+
+    async def schedule():
+        scheduler = ShutdownScheduler(asyncio.get_running_loop())
+
+        def first():
+            calls.append("first")
+            scheduler.schedule(0.01, lambda: calls.append("second"))
+
+        scheduler.schedule(0.01, first)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(schedule())
+    assert calls == ["first", "second"]
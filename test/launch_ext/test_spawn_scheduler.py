@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from launch_ext.process import SpawnScheduler
+
+
+def test_bounded_and_prioritized():
+    async def run():
+        scheduler = SpawnScheduler(asyncio.get_running_loop(), 2)
+        started = []
+
+        async def start(name, priority=0):
+            slot = await scheduler.acquire(priority)
+            started.append(name)
+            return slot
+
+        first = await start("first")
+        second = await start("second")
+        waiters = [
+            asyncio.ensure_future(start("low", -1)),
+            asyncio.ensure_future(start("normal")),
+            asyncio.ensure_future(start("critical", 10)),
+            asyncio.ensure_future(start("normal 2")),
+        ]
+        await asyncio.sleep(0)
+        assert started == ["first", "second"]
+        assert (scheduler.starting, scheduler.waiting) == (2, 4)
+
+        first.release()
+        first.release()
+        await asyncio.sleep(0)
+        assert started[2:] == ["critical"]
+        second.release()
+        await asyncio.sleep(0)
+        assert started[3:] == ["normal"]
+        for waiter in waiters[1:3]:
+            (await waiter).release()
+        await asyncio.sleep(0)
+        assert started[4:] == ["normal 2", "low"]
+        assert scheduler.starting == 2
+
+    asyncio.run(run())
+
+
+def test_same_iteration_by_priority():
+    async def run():
+        scheduler = SpawnScheduler(asyncio.get_running_loop(), 1)
+        started = []
+
+        async def start(name, priority=0):
+            slot = await scheduler.acquire(priority)
+            started.append(name)
+            slot.release()
+
+        # e.g. the actions of a launch description, declared by increasing priority
+        await asyncio.gather(start("low", -1), start("normal"), start("critical", 10))
+        assert started == ["critical", "normal", "low"]
+        assert scheduler.starting == 0
+
+    asyncio.run(run())
+
+
+def test_timeout_releases():
+    async def run():
+        scheduler = SpawnScheduler(asyncio.get_running_loop(), 1)
+        slot = await scheduler.acquire(timeout=0.05)
+        waiter = asyncio.ensure_future(scheduler.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        await asyncio.wait_for(waiter, 1.0)
+        assert slot.released
+        assert scheduler.starting == 1
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_gives_up_its_turn():
+    async def run():
+        scheduler = SpawnScheduler(asyncio.get_running_loop(), 1)
+        slot = await scheduler.acquire()
+        cancelled = asyncio.ensure_future(scheduler.acquire(priority=5))
+        waiter = asyncio.ensure_future(scheduler.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        slot.release()
+        await asyncio.wait_for(waiter, 1.0)
+        assert cancelled.cancelled()
+        assert (scheduler.starting, scheduler.waiting) == (1, 0)
+
+    asyncio.run(run())
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        SpawnScheduler(None, 0)
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+import time
+
+from launch_ext.process import StandbyGate
+
+
+def test_exec_gate():
+    gate = StandbyGate("exec")
+    process = subprocess.Popen(
+        gate.get_cmd(["sh", "-c", "echo started"]), stdout=subprocess.PIPE, pass_fds=gate.pass_fds
+    )
+    gate.spawned()
+    time.sleep(0.2)
+    assert process.poll() is None
+    gate.release()
+    assert process.communicate(timeout=10)[0] == b"started\n"
+
+
+def test_exec_gate_cancelled():
+    gate = StandbyGate("exec")
+    process = subprocess.Popen(
+        gate.get_cmd(["sh", "-c", "echo started"]), stdout=subprocess.PIPE, pass_fds=gate.pass_fds
+    )
+    gate.spawned()
+    gate.cancel()
+    assert process.wait(timeout=10) == 1
+    assert process.stdout.read() == b""
+
+
+def test_cooperative_gate():
+    gate = StandbyGate("cooperative")
+    script = (
+        "import os, sys; print('ready', flush=True); "
+        "sys.exit(0 if os.read(int(os.environ['LAUNCH_EXT_STANDBY_FD']), 1) else 3)"
+    )
+    process = subprocess.Popen(
+        gate.get_cmd([sys.executable, "-c", script]),
+        stdout=subprocess.PIPE,
+        pass_fds=gate.pass_fds,
+        env=gate.get_env(None),
+    )
+    gate.spawned()
+    assert process.stdout.readline() == b"ready\n"
+    gate.release()
+    assert process.wait(timeout=10) == 0
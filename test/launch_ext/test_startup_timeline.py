@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+import pytest
+
+from launch_ext.process import StartupReport
+from launch_ext.process import StartupTimeline
+
+
+def test_first_occurrence_kept():
+    timeline = StartupTimeline("talker")
+    timeline.mark("connection_made", at=2.0)
+    timeline.mark("connection_made", at=5.0)
+    assert timeline.times == {"connection_made": 2.0}
+    assert timeline.complete
+    with pytest.raises(ValueError):
+        timeline.mark("spawned")
+
+
+def test_report_on_complete(tmp_path):
+    reports = []
+
+    async def run():
+        report = StartupReport(asyncio.get_running_loop(), reports.append, settle_delay=0.05)
+        fast = StartupTimeline("fast")
+        slow = StartupTimeline("slow", expects_ready=True)
+        report.add(fast)
+        report.add(slow)
+        for timeline in (fast, slow):
+            timeline.mark("execute", at=10.0)
+            timeline.mark("prepared", at=10.5)
+            timeline.mark("spawn", at=11.0)
+            timeline.mark("connection_made", at=11.5)
+        slow.mark("ready", at=14.0)
+        assert reports == []
+        await asyncio.sleep(0.1)
+        assert reports == [report]
+        return report
+
+    report = asyncio.run(run())
+    processes = report.to_dict()["processes"]
+    assert [process["name"] for process in processes] == ["slow", "fast"]
+    assert processes[0]["end"] == 4.0
+    assert processes[1]["milestones"]["connection_made"] == 1.5
+    assert report.render().splitlines()[2].startswith("slow")
+
+    report.write(str(tmp_path / "report.json"))
+    assert json.loads((tmp_path / "report.json").read_text()) == report.to_dict()
+
+
+def test_report_settles_once():
+    reports = []
+
+    async def run():
+        report = StartupReport(asyncio.get_running_loop(), reports.append, settle_delay=0.2)
+        first = StartupTimeline("first")
+        report.add(first)
+        first.mark("connection_made")
+        await asyncio.sleep(0.1)
+        # executed before the report settled, which then waits for it
+        second = StartupTimeline("second")
+        report.add(second)
+        await asyncio.sleep(0.15)
+        assert reports == []
+        second.mark("connection_made")
+        await asyncio.sleep(0.15)
+        assert reports == [report]
+        # executed after the report was closed
+        third = StartupTimeline("third")
+        report.add(third)
+        third.mark("connection_made")
+        await asyncio.sleep(0.1)
+        assert reports == [report]
+        assert [timeline.name for timeline in report.timelines] == ["first", "second"]
+
+    asyncio.run(run())
+
+
+def test_report_abandoned():
+    reports = []
+
+    async def run():
+        report = StartupReport(asyncio.get_running_loop(), reports.append, settle_delay=0.0)
+        failed = StartupTimeline("failed")
+        report.add(failed)
+        failed.mark("execute", at=1.0)
+        failed.abandon()
+        await asyncio.sleep(0.01)
+        assert reports == [report]
+        return report
+
+    report = asyncio.run(run())
+    assert report.to_dict()["processes"][0]["complete"] is False
+    assert "(not started)" in report.render()
+
+
+def test_report_closed_before_started():
+    # e.g. on shutdown, with a process whose readiness probe never matched
+    reports = []
+
+    async def run():
+        report = StartupReport(asyncio.get_running_loop(), reports.append)
+        waiting = StartupTimeline("waiting", expects_ready=True)
+        report.add(waiting)
+        waiting.mark("connection_made")
+        report.close()
+        report.close()
+        waiting.mark("ready")
+        assert reports == [report]
+        assert report.closed
+
+    asyncio.run(run())
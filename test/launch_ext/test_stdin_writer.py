@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from launch_ext.process import StdinWriter
+
+
+class CatProtocol(asyncio.SubprocessProtocol):
+    def __init__(self, loop, max_queued_bytes):
+        self.stdin = StdinWriter(loop, max_queued_bytes=max_queued_bytes)
+        self.received = 0
+        self.paused = 0
+        self.exited = loop.create_future()
+
+    def connection_made(self, transport):
+        self.stdin.connect(transport.get_pipe_transport(0))
+
+    def pause_writing(self):
+        self.paused += 1
+        self.stdin.pause_writing()
+
+    def resume_writing(self):
+        self.stdin.resume_writing()
+
+    def pipe_data_received(self, fd, data):
+        self.received += len(data)
+
+    def process_exited(self):
+        self.stdin.disconnect()
+        self.exited.set_result(None)
+
+
+async def spawn_cat(max_queued_bytes=1 << 16, delay=0.0):
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.subprocess_exec(
+        lambda: CatProtocol(loop, max_queued_bytes),
+        "sh",
+        "-c",
+        f"sleep {delay}; exec cat",
+        stderr=None,
+    )
+    return transport, protocol
+
+
+def test_stream_generator():
+    chunk = b"x" * 4096
+    count = 2048
+
+    async def stream():
+        # cat starts reading late, so the pipe fills up
+        transport, protocol = await spawn_cat(delay=0.2)
+        highest = 0
+
+        def chunks():
+            nonlocal highest
+            for _ in range(count):
+                highest = max(highest, protocol.stdin.queued_bytes)
+                yield chunk
+
+        assert await protocol.stdin.stream(chunks(), close=True) == len(chunk) * count
+        await asyncio.wait_for(protocol.exited, 10.0)
+        transport.close()
+        return protocol, highest
+
+    protocol, highest = asyncio.run(stream())
+    assert protocol.received == len(chunk) * count
+    assert protocol.stdin.written_bytes == len(chunk) * count
+    # the pipe filled up, and the queue stayed bounded meanwhile
+    assert protocol.paused > 0
+    assert highest <= (1 << 16) + len(chunk)
+
+
+def test_stream_file_and_text(tmp_path):
+    path = tmp_path / "recording.bin"
+    path.write_bytes(b"\0\1\2" * 100000)
+
+    async def stream():
+        transport, protocol = await spawn_cat()
+        protocol.stdin.write("header\n")
+        await protocol.stdin.stream(str(path), chunk_size=1000)
+
+        async def footer():
+            yield "footer\n"
+
+        await protocol.stdin.stream(footer(), close=True)
+        with pytest.raises(RuntimeError):
+            protocol.stdin.write(b"late")
+        await asyncio.wait_for(protocol.exited, 10.0)
+        transport.close()
+        return protocol
+
+    protocol = asyncio.run(stream())
+    assert protocol.received == len("header\n") + 300000 + len("footer\n")
+
+
+def test_disconnect_drops_queued_data():
+    async def stream():
+        transport, protocol = await spawn_cat()
+        transport.kill()
+        await asyncio.wait_for(protocol.exited, 10.0)
+        with pytest.raises(RuntimeError):
+            await protocol.stdin.stream([b"data"])
+        assert protocol.stdin.queued_bytes == 0
+        transport.close()
+
+    asyncio.run(stream())